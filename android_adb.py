@@ -0,0 +1,357 @@
+# Talks to the adb server directly over its socket protocol (port 5037) so the
+# Android scripts don't pay for one `adb` process per step.
+#
+# Host services (devices, forward) are single request/response exchanges.
+# Shell-level steps share one long-lived `shell:` stream per device; every
+# command runs in a subshell framed by sentinel lines that also carry its exit
+# status.
+# File pushes and pulls use the `sync:` service directly; `exec:` streams raw bytes into
+# a device command's stdin, like `adb exec-in`.
+#
+# Set ANDROID_ADB_SERVER_PORT to point at a different server, for example the
+# stand-in from android_fake_adb.py.
+
+import os
+import posixpath
+import re
+import shlex
+import socket
+import struct
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+
+ADB_SERVER_HOST = "127.0.0.1"
+SYNC_DATA_MAX = 64 * 1024
+
+
+class AdbError(Exception):
+    """The adb server refused a request or a device stream broke."""
+
+
+def server_port():
+    return int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037"))
+
+
+def _recv_exact(sock, count):
+    data = b""
+    while len(data) < count:
+        chunk = sock.recv(count - len(data))
+        if not chunk:
+            raise AdbError("adb server closed the connection")
+        data += chunk
+    return data
+
+
+def _read_length_prefixed(sock):
+    length = int(_recv_exact(sock, 4), 16)
+    return _recv_exact(sock, length).decode(errors="replace")
+
+
+def _read_status(sock):
+    status = _recv_exact(sock, 4)
+    if status == b"OKAY":
+        return
+    if status == b"FAIL":
+        raise AdbError(_read_length_prefixed(sock))
+    raise AdbError(f"unexpected adb status {status!r}")
+
+
+def _send_request(sock, service):
+    payload = service.encode()
+    sock.sendall(b"%04x" % len(payload) + payload)
+    _read_status(sock)
+
+
+def _connect(timeout=10):
+    """Open a socket to the adb server, starting it once if nobody is listening."""
+    address = (ADB_SERVER_HOST, server_port())
+    try:
+        sock = socket.create_connection(address, timeout=timeout)
+    except ConnectionRefusedError:
+        subprocess.run(["adb", "start-server"], capture_output=True, timeout=30)
+        sock = socket.create_connection(address, timeout=timeout)
+    # Shell round trips are many tiny writes; don't let Nagle batch them.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def host_query(service, timeout=10):
+    """Run a host service that answers with a length-prefixed payload."""
+    with _connect(timeout) as sock:
+        _send_request(sock, service)
+        return _read_length_prefixed(sock)
+
+
+def host_command(service, timeout=10):
+    """Run a host service that answers with status words only (e.g. forward)."""
+    with _connect(timeout) as sock:
+        _send_request(sock, service)
+        # forward/killforward send a second status once the work is done.
+        _read_status(sock)
+
+
+def open_device_service(serial, service, timeout=10):
+    """Switch a fresh connection to a device transport and open `service` on it."""
+    sock = _connect(timeout)
+    try:
+        _send_request(sock, f"host:transport:{serial}" if serial else "host:transport-any")
+        _send_request(sock, service)
+    except Exception:
+        sock.close()
+        raise
+    return sock
+
+
+def list_devices():
+    """Parse `adb devices -l` into dicts with serial, state and any properties."""
+    devices = []
+    for line in host_query("host:devices-l").splitlines():
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        device = {"serial": parts[0], "state": parts[1]}
+        for prop in parts[2:]:
+            key, _, value = prop.partition(":")
+            device[key] = value
+        devices.append(device)
+    return devices
+
+
+class AdbShellSession:
+    """One persistent `adb shell` stream that runs commands back to back."""
+
+    def __init__(self, serial=None, timeout=10):
+        self._sock = open_device_service(serial, "shell:", timeout)
+        self._buffer = b""
+        self._counter = 0
+        # Quieten the interactive shell; framing copes if either is ignored.
+        self._sock.sendall(b"stty -echo 2>/dev/null; PS1=''; PS2=''\n")
+        self.run("true", timeout=timeout)
+
+    def run(self, command, timeout=30):
+        """Run `command` and return (exit status, output with \\r stripped)."""
+        self._counter += 1
+        tag = f"{os.getpid()}_{self._counter}"
+        begin = f"__ADB_BEGIN_{tag}__".encode()
+        end = re.compile(rb"__ADB_END_" + tag.encode() + rb"__ (\d+)\r?\n")
+        # The markers are split by quotes so the echoed command line never
+        # looks like the shell's output. The command runs in a subshell so an
+        # `exit` or `cd` in it cannot take the session down with it.
+        script = (
+            f'echo "__ADB_""BEGIN_{tag}__"\n'
+            f"(\n{command}\n) </dev/null\n"
+            f'echo "__ADB_""END_{tag}__" $?\n'
+        )
+        self._sock.sendall(script.encode())
+
+        deadline = time.monotonic() + timeout
+        start = -1
+        while True:
+            if start < 0:
+                index = self._buffer.find(begin)
+                if index >= 0:
+                    newline = self._buffer.find(b"\n", index)
+                    if newline >= 0:
+                        self._buffer = self._buffer[newline + 1 :]
+                        start = 0
+            if start >= 0:
+                match = end.search(self._buffer)
+                if match:
+                    output = self._buffer[: match.start()]
+                    self._buffer = self._buffer[match.end() :]
+                    text = output.decode(errors="replace").replace("\r", "")
+                    return int(match.group(1)), text
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"adb shell command timed out: {command}")
+            self._sock.settimeout(remaining)
+            try:
+                chunk = self._sock.recv(65536)
+            except socket.timeout:
+                raise TimeoutError(f"adb shell command timed out: {command}")
+            if not chunk:
+                raise AdbError("adb shell session closed")
+            self._buffer += chunk
+
+    def close(self):
+        try:
+            self._sock.sendall(b"exit\n")
+        except OSError:
+            pass
+        self._sock.close()
+
+
+@dataclass
+class LaunchedProcess:
+    """A background process started by `AdbDevice.launch()`."""
+
+    pid: int | None
+    ready: bool
+    exited: bool
+    elapsed: float  # seconds from launch until ready (or until giving up)
+    log_path: str
+
+
+class AdbDevice:
+    """A device reached through the adb server, with a lazily opened shell session."""
+
+    def __init__(self, serial=None):
+        self.serial = serial
+        self._session = None
+        # Pipeline steps running side by side take turns on the one session.
+        self._lock = threading.Lock()
+
+    def shell(self, command, timeout=30):
+        """Run a shell command on the persistent session; returns (status, output)."""
+        with self._lock:
+            if self._session is None:
+                self._session = AdbShellSession(self.serial)
+            try:
+                return self._session.run(command, timeout=timeout)
+            except (TimeoutError, AdbError, OSError):
+                # The hung command would keep this shell busy for every later
+                # call; dropping the stream makes adbd hang it up.
+                self._session.close()
+                self._session = None
+                raise
+
+    def push(self, local_path, remote_path, mode=0o755, timeout=60):
+        """Copy a host file to the device with the sync protocol; returns bytes sent."""
+        if remote_path.endswith("/"):
+            remote_path += os.path.basename(local_path)
+        sent = 0
+        sock = open_device_service(self.serial, "sync:", timeout)
+        try:
+            sock.settimeout(timeout)
+            header = f"{remote_path},{mode}".encode()
+            sock.sendall(b"SEND" + struct.pack("<I", len(header)) + header)
+            with open(local_path, "rb") as f:
+                while chunk := f.read(SYNC_DATA_MAX):
+                    sock.sendall(b"DATA" + struct.pack("<I", len(chunk)) + chunk)
+                    sent += len(chunk)
+            mtime = int(os.path.getmtime(local_path))
+            sock.sendall(b"DONE" + struct.pack("<I", mtime))
+            reply, length = struct.unpack("<4sI", _recv_exact(sock, 8))
+            if reply == b"FAIL":
+                raise AdbError(_recv_exact(sock, length).decode(errors="replace"))
+            if reply != b"OKAY":
+                raise AdbError(f"unexpected sync reply {reply!r}")
+            sock.sendall(b"QUIT" + struct.pack("<I", 0))
+        finally:
+            sock.close()
+        return sent
+
+    def pull(self, remote_path, local_path, timeout=60):
+        """Copy a device file to the host with the sync protocol; returns bytes received."""
+        received = 0
+        sock = open_device_service(self.serial, "sync:", timeout)
+        try:
+            sock.settimeout(timeout)
+            path = remote_path.encode()
+            sock.sendall(b"RECV" + struct.pack("<I", len(path)) + path)
+            tmp_path = local_path + ".part"
+            with open(tmp_path, "wb") as f:
+                while True:
+                    reply, length = struct.unpack("<4sI", _recv_exact(sock, 8))
+                    if reply == b"DONE":
+                        break
+                    if reply == b"FAIL":
+                        raise AdbError(_recv_exact(sock, length).decode(errors="replace"))
+                    if reply != b"DATA":
+                        raise AdbError(f"unexpected sync reply {reply!r}")
+                    f.write(_recv_exact(sock, length))
+                    received += length
+            os.replace(tmp_path, local_path)
+            sock.sendall(b"QUIT" + struct.pack("<I", 0))
+        finally:
+            sock.close()
+        return received
+
+    def exec_in(self, command, chunks, timeout=60):
+        """Stream `chunks` (bytes) into the stdin of `command` on the device.
+
+        Like `adb exec-in`, there is no exit status and the device may still
+        be reading when this returns; callers that need either have the
+        command leave a marker behind. Returns the number of bytes sent.
+        """
+        sent = 0
+        sock = open_device_service(self.serial, f"exec:{command}", timeout)
+        try:
+            sock.settimeout(timeout)
+            for chunk in chunks:
+                sock.sendall(chunk)
+                sent += len(chunk)
+            sock.shutdown(socket.SHUT_WR)
+        finally:
+            sock.close()
+        return sent
+
+    def launch(self, command, cwd="/data/local/tmp", ready_output=None, log_path=None, timeout=10):
+        """Start `command` in the background and wait until it can be attached to.
+
+        The PID comes straight from `$!` and readiness is checked on the device
+        itself: the process must have exec'd its binary and, if `ready_output`
+        is given, written that text to its log. The whole launch is a single
+        round trip with no host-side sleeps or `ps` scraping.
+        """
+        name = posixpath.basename(shlex.split(command)[0])
+        if log_path is None:
+            log_path = f"{name}.log" if ready_output else "/dev/null"
+        # A script's exe is its interpreter, so fall back to its arguments.
+        checks = (f'{{ case "$(readlink /proc/$pid/exe)" in */{name}) ;; '
+                  f'*) tr "\\0" "\\n" < /proc/$pid/cmdline 2>/dev/null | grep -qF -- {shlex.quote(name)} ;; esac; }}')
+        if ready_output:
+            checks += f" && grep -qF -- {shlex.quote(ready_output)} {shlex.quote(log_path)}"
+        polls = max(1, int(timeout / 0.01))
+        script = f"""cd {shlex.quote(cwd)} || exit 3
+nohup {command} </dev/null >{shlex.quote(log_path)} 2>&1 &
+pid=$!
+echo "pid $pid"
+i=0
+while [ $i -lt {polls} ]; do
+  state=Z
+  [ -r /proc/$pid/stat ] && read -r _ _ state _ < /proc/$pid/stat
+  [ "$state" = Z ] && {{ echo exited; exit 2; }}
+  if {checks}; then echo ready; exit 0; fi
+  sleep 0.01
+  i=$((i+1))
+done
+echo timeout
+exit 1"""
+        started = time.monotonic()
+        _, output = self.shell(script, timeout=timeout + 10)
+        elapsed = time.monotonic() - started
+        pid = None
+        for line in output.splitlines():
+            if line.startswith("pid ") and line[4:].strip().isdigit():
+                pid = int(line[4:])
+        lines = output.split()
+        return LaunchedProcess(
+            pid=pid,
+            ready="ready" in lines,
+            exited="exited" in lines,
+            elapsed=elapsed,
+            log_path=posixpath.join(cwd, log_path),
+        )
+
+    def forward(self, local, remote):
+        prefix = f"host-serial:{self.serial}" if self.serial else "host"
+        host_command(f"{prefix}:forward:{local};{remote}")
+
+    def remove_forward(self, local):
+        prefix = f"host-serial:{self.serial}" if self.serial else "host"
+        host_command(f"{prefix}:killforward:{local}")
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,210 @@
+# Fingerprint-based build skipping for the Android release build.
+#
+# The fingerprint covers everything build-android.sh feeds into cargo:
+# Cargo.lock, the workspace and toolchain config, every crate reachable from
+# codex-cli through path dependencies, the NDK version and RUSTFLAGS. Built
+# binaries are kept in a content-addressed store keyed by that fingerprint, so
+# switching branches back and forth restores an earlier build instead of
+# rebuilding it.
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+import tomllib
+
+WORKSPACE_DIR = "codex-rs"
+ROOT_CRATE = "cli"
+RELEASE_DIR = os.path.join(WORKSPACE_DIR, "target", "aarch64-linux-android", "release")
+ARTIFACTS = ("codex", "codex-exec")
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "codex-android-build")
+
+# Directories inside a crate that never end up in the release binary.
+SKIPPED_DIRS = {"target", "tests", "benches", "snapshots", "node_modules"}
+# Environment that changes what cargo produces for the same sources.
+FINGERPRINT_ENV = ("RUSTFLAGS", "CARGO_ENCODED_RUSTFLAGS", "CARGO_PROFILE_RELEASE_LTO",
+                   "CARGO_PROFILE_RELEASE_DEBUG", "CARGO_PROFILE_RELEASE_STRIP")
+
+
+def path_dependencies(crate_dir):
+    """Return directories of path dependencies that can end up in a release build."""
+    with open(os.path.join(crate_dir, "Cargo.toml"), "rb") as f:
+        manifest = tomllib.load(f)
+
+    tables = [manifest.get("dependencies", {}), manifest.get("build-dependencies", {})]
+    for target in manifest.get("target", {}).values():
+        tables.append(target.get("dependencies", {}))
+        tables.append(target.get("build-dependencies", {}))
+
+    deps = []
+    for table in tables:
+        for spec in table.values():
+            if isinstance(spec, dict) and "path" in spec:
+                deps.append(os.path.normpath(os.path.join(crate_dir, spec["path"])))
+    return deps
+
+
+def reachable_crates(workspace_dir=WORKSPACE_DIR, root_crate=ROOT_CRATE):
+    """All crate directories reachable from `root_crate`, sorted."""
+    pending = [os.path.join(workspace_dir, root_crate)]
+    seen = set()
+    while pending:
+        crate_dir = pending.pop()
+        if crate_dir in seen:
+            continue
+        seen.add(crate_dir)
+        pending.extend(path_dependencies(crate_dir))
+    return sorted(seen)
+
+
+def hash_tree(digest, crate_dir):
+    """Feed every source file of a crate (path and contents) into `digest`."""
+    for dirpath, dirnames, filenames in os.walk(crate_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS and not d.startswith("."))
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            digest.update(path.encode() + b"\0")
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+
+
+def ndk_version():
+    """Pkg.Revision of the NDK named by ANDROID_NDK_HOME, or its path if unreadable."""
+    ndk_home = os.environ.get("ANDROID_NDK_HOME", "")
+    try:
+        with open(os.path.join(ndk_home, "source.properties")) as f:
+            for line in f:
+                if line.startswith("Pkg.Revision"):
+                    return line.split("=", 1)[1].strip()
+    except OSError:
+        pass
+    return ndk_home
+
+
+def rustc_version():
+    try:
+        return subprocess.run(
+            ["rustc", "-vV"], cwd=WORKSPACE_DIR, capture_output=True, text=True, timeout=30
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def build_fingerprint(build_script="build-android.sh"):
+    """Hash every input of the Android release build into one hex digest."""
+    digest = hashlib.sha256()
+    inputs = [
+        build_script,
+        os.path.join(WORKSPACE_DIR, "Cargo.lock"),
+        os.path.join(WORKSPACE_DIR, "Cargo.toml"),
+        os.path.join(WORKSPACE_DIR, "rust-toolchain.toml"),
+        os.path.join(WORKSPACE_DIR, ".cargo", "config.toml"),
+    ]
+    for path in inputs:
+        digest.update(path.encode() + b"\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+    for crate_dir in reachable_crates():
+        hash_tree(digest, crate_dir)
+    for name in FINGERPRINT_ENV:
+        digest.update(f"{name}={os.environ.get(name, '')}\0".encode())
+    digest.update(f"ndk={ndk_version()}\0".encode())
+    digest.update(rustc_version().encode())
+    return digest.hexdigest()
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Content-addressed store of release binaries, indexed by build fingerprint."""
+
+    def __init__(self, cache_dir=None, max_entries=10):
+        self.cache_dir = cache_dir or os.environ.get("CODEX_ANDROID_BUILD_CACHE", DEFAULT_CACHE_DIR)
+        self.objects_dir = os.path.join(self.cache_dir, "objects")
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.max_entries = max_entries
+
+    def _load_index(self):
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def restore(self, fingerprint, release_dir=RELEASE_DIR):
+        """Make `release_dir` hold the binaries built from `fingerprint`.
+
+        Returns "fresh" if they are already in place, "restored" if they were
+        copied back from the store, or None on a cache miss.
+        """
+        index = self._load_index()
+        entry = index.get(fingerprint)
+        if not entry:
+            return None
+        objects = [os.path.join(self.objects_dir, sha) for sha in entry["artifacts"].values()]
+        if not all(os.path.exists(path) for path in objects):
+            return None
+
+        result = "fresh"
+        for name, sha in entry["artifacts"].items():
+            target = os.path.join(release_dir, name)
+            if os.path.exists(target) and file_sha256(target) == sha:
+                continue
+            os.makedirs(release_dir, exist_ok=True)
+            tmp_path = target + ".restore"
+            shutil.copy2(os.path.join(self.objects_dir, sha), tmp_path)
+            os.replace(tmp_path, target)
+            result = "restored"
+
+        entry["used"] = time.time()
+        self._save_index(index)
+        return result
+
+    def store(self, fingerprint, release_dir=RELEASE_DIR):
+        """Record the freshly built binaries under `fingerprint`."""
+        artifacts = {}
+        os.makedirs(self.objects_dir, exist_ok=True)
+        for name in ARTIFACTS:
+            path = os.path.join(release_dir, name)
+            if not os.path.exists(path):
+                continue
+            sha = file_sha256(path)
+            object_path = os.path.join(self.objects_dir, sha)
+            if not os.path.exists(object_path):
+                shutil.copy2(path, object_path + ".tmp")
+                os.replace(object_path + ".tmp", object_path)
+            artifacts[name] = sha
+        if not artifacts:
+            return
+
+        index = self._load_index()
+        index[fingerprint] = {"artifacts": artifacts, "used": time.time()}
+        self._prune(index)
+        self._save_index(index)
+
+    def _prune(self, index):
+        """Keep the most recently used entries and drop objects nobody references."""
+        by_age = sorted(index, key=lambda fp: index[fp].get("used", 0), reverse=True)
+        for fingerprint in by_age[self.max_entries:]:
+            del index[fingerprint]
+        live = {sha for entry in index.values() for sha in entry["artifacts"].values()}
+        for name in os.listdir(self.objects_dir):
+            if name not in live:
+                os.remove(os.path.join(self.objects_dir, name))
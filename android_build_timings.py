@@ -0,0 +1,115 @@
+# Per-crate compile timings for the Android build.
+#
+# While the build streams, `BuildTimer` picks up cargo's `Compiling <crate>`
+# lines (when each crate started) and `Timing report saved to ...` lines. The
+# driver runs cargo with --timings, so afterwards the reports' UNIT_DATA gives
+# the real duration of every unit even though cargo builds crates in parallel.
+# Each run is appended to a JSON history so a regressing crate stands out.
+
+import json
+import os
+import re
+import subprocess
+import time
+
+from android_build_cache import DEFAULT_CACHE_DIR
+
+HISTORY_PATH = os.path.join(DEFAULT_CACHE_DIR, "build-timings.json")
+HISTORY_LIMIT = 200
+
+COMPILING_RE = re.compile(rb"^\s*Compiling (\S+) v(\S+)", re.MULTILINE)
+FINISHED_RE = re.compile(rb"^\s*Finished .* in (.+)$", re.MULTILINE)
+REPORT_RE = re.compile(rb"Timing report saved to (\S+\.html)")
+UNIT_DATA_RE = re.compile(r"const UNIT_DATA = (\[.*?\n?\]);", re.DOTALL)
+
+
+class BuildTimer:
+    """Collects crate start times and timing report paths from streamed output."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.crate_starts = {}
+        self.reports = []
+        self.finished_lines = 0
+
+    def feed(self, block):
+        """Scan a block of complete output lines (bytes) from the build."""
+        now = time.monotonic() - self.started
+        for match in COMPILING_RE.finditer(block):
+            self.crate_starts.setdefault(match.group(1).decode(), now)
+        for match in REPORT_RE.finditer(block):
+            self.reports.append(match.group(1).decode())
+        self.finished_lines += len(FINISHED_RE.findall(block))
+
+    def crate_durations(self):
+        """Sum unit durations per crate from the --timings reports of this build."""
+        durations = {}
+        for report in self.reports:
+            try:
+                with open(report, encoding="utf-8") as f:
+                    match = UNIT_DATA_RE.search(f.read())
+            except OSError:
+                continue
+            if not match:
+                continue
+            for unit in json.loads(match.group(1)):
+                name = unit["name"]
+                durations[name] = durations.get(name, 0.0) + unit.get("duration", 0.0)
+        return durations
+
+    def wall_time(self):
+        return time.monotonic() - self.started
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def load_history(path=HISTORY_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def record_build(timer, path=HISTORY_PATH):
+    """Append this build to the history file and return the previous entry, if any."""
+    history = load_history(path)
+    previous = history[-1] if history else None
+    history.append({
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "wall_time": round(timer.wall_time(), 2),
+        "crates": {name: round(seconds, 2) for name, seconds in timer.crate_durations().items()},
+    })
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(history[-HISTORY_LIMIT:], f, indent=1)
+    os.replace(tmp_path, path)
+    return previous
+
+
+def print_crate_table(timer, previous=None, limit=20):
+    """Print the slowest crates, with the change since the previous build."""
+    durations = timer.crate_durations()
+    if not durations:
+        # No --timings report: fall back to when each crate started compiling.
+        if timer.crate_starts:
+            print(f"\nCrates compiled ({len(timer.crate_starts)}), by start time:")
+            for name, started in sorted(timer.crate_starts.items(), key=lambda item: item[1])[-limit:]:
+                print(f"  {started:8.1f}s  {name}")
+        return
+
+    before = previous["crates"] if previous else {}
+    print(f"\nSlowest crates ({len(durations)} compiled, {timer.wall_time():.1f}s wall):")
+    print(f"  {'seconds':>8} {'change':>8}  crate")
+    for name, seconds in sorted(durations.items(), key=lambda item: item[1], reverse=True)[:limit]:
+        change = f"{seconds - before[name]:+8.1f}" if name in before else f"{'new':>8}"
+        print(f"  {seconds:8.1f} {change}  {name}")
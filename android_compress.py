@@ -0,0 +1,276 @@
+# Compressed transfers: compress on the host, decompress on the device.
+#
+# Release binaries shrink to a third or less, so over a slow link it is
+# quicker to send them compressed. `compressed_push()` streams the compressed
+# file into the device's own decompressor through the adb `exec:` service
+# (what `adb exec-in` uses), with compression running in a background thread
+# so the host CPU and the link work at the same time.
+#
+# Which codec wins depends on the machine: a fast CPU on a slow USB 2 cable
+# wants xz, a slow laptop on USB 3 wants gzip -1 or nothing at all.
+# `choose_codec()` measures both sides (compressing a sample of the file and
+# pushing a probe of random bytes) and picks the codec with the shortest
+# estimated transfer. `benchmark_codecs()` pushes with every codec for real
+# and reports the effective throughput of each.
+
+import bz2
+import lzma
+import os
+import posixpath
+import queue
+import shlex
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+
+from android_adb import AdbError
+from android_build_cache import file_sha256
+from android_sync import SyncStats, format_bytes
+
+CHUNK_SIZE = 1024 * 1024
+SAMPLE_SLICES = 4
+PROBE_SIZE = 2 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Codec:
+    """A host-side compressor paired with the device command that undoes it."""
+
+    name: str
+    device_command: str  # reads stdin, writes stdout; "" means no compression
+    level: int = 0
+
+    def compressor(self):
+        """A fresh object with compress(data) and flush(), or None for raw."""
+        if self.name.startswith("gzip"):
+            # wbits=31 writes a gzip header so toybox `gzip -d` accepts it.
+            return zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        if self.name.startswith("bzip2"):
+            return bz2.BZ2Compressor(self.level)
+        if self.name.startswith("xz"):
+            return lzma.LZMACompressor(preset=self.level)
+        return None
+
+
+CODECS = {
+    codec.name: codec
+    for codec in (
+        Codec("none", ""),
+        Codec("gzip-1", "gzip -d", 1),
+        Codec("gzip-6", "gzip -d", 6),
+        Codec("bzip2", "bzcat", 9),
+        Codec("xz-1", "xzcat", 1),
+        Codec("xz-6", "xzcat", 6),
+    )
+}
+
+
+@dataclass
+class CodecEstimate:
+    """Measured host cost of one codec and what it predicts for the transfer."""
+
+    codec: Codec
+    ratio: float  # compressed size / original size
+    compress_rate: float  # original bytes per second on this host
+    seconds: float  # estimated time to get the whole file onto the device
+
+    def effective_rate(self, total_bytes):
+        return total_bytes / self.seconds if self.seconds else float("inf")
+
+
+def device_codecs(device):
+    """Codecs whose decompressor exists on the device."""
+    tools = sorted({codec.device_command.split()[0] for codec in CODECS.values() if codec.device_command})
+    _, output = device.shell(
+        " ; ".join(f"command -v {tool} >/dev/null && echo {tool}" for tool in tools), timeout=10
+    )
+    present = set(output.split())
+    return [
+        codec for codec in CODECS.values()
+        if not codec.device_command or codec.device_command.split()[0] in present
+    ]
+
+
+def compressed_chunks(local_path, codec):
+    """Yield the compressed file in chunks, compressing in a background thread.
+
+    zlib, bz2 and lzma release the GIL while they work, so the caller can be
+    sending one chunk while the next one is being compressed.
+    """
+    compressor = codec.compressor()
+    chunks = queue.Queue(maxsize=8)
+    failure = []
+
+    def produce():
+        try:
+            with open(local_path, "rb") as f:
+                while data := f.read(CHUNK_SIZE):
+                    out = compressor.compress(data) if compressor else data
+                    if out:
+                        chunks.put(out)
+            if compressor:
+                chunks.put(compressor.flush())
+        except Exception as e:
+            failure.append(e)
+        finally:
+            chunks.put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while (chunk := chunks.get()) is not None:
+        yield chunk
+    if failure:
+        raise failure[0]
+
+
+def compressed_push(device, local_path, remote_path, codec="gzip-1", timeout=300):
+    """Stream `local_path` through `codec` into a decompressor on the device.
+
+    The decompressed file lands next to `remote_path`, is checked against the
+    host file's sha256 and only then moved into place. `codec` is a name from
+    `CODECS` or a `Codec`. Returns a `SyncStats` with mode "compressed".
+    """
+    if isinstance(codec, str):
+        codec = CODECS[codec]
+    total_bytes = os.path.getsize(local_path)
+    local_hash = file_sha256(local_path)
+
+    staging = f"{remote_path}.unpack"
+    status_path = f"{remote_path}.unpack.status"
+    decompress = codec.device_command or "cat"
+    # exec: gives no exit status and the stream may close before the device
+    # has drained it, so the command leaves one behind in a status file.
+    command = (
+        f"rm -f {shlex.quote(status_path)}; "
+        f"{decompress} > {shlex.quote(staging)}; echo $? > {shlex.quote(status_path)}"
+    )
+    bytes_sent = device.exec_in(command, compressed_chunks(local_path, codec), timeout=timeout)
+
+    polls = max(1, int(timeout / 0.01))
+    quoted_staging = shlex.quote(staging)
+    quoted_status = shlex.quote(status_path)
+    status, output = device.shell(
+        f"i=0; while [ ! -s {quoted_status} ] && [ $i -lt {polls} ]; do sleep 0.01; i=$((i+1)); done\n"
+        f'[ "$(cat {quoted_status} 2>/dev/null)" = 0 ] || {{ echo decompress failed; exit 4; }}\n'
+        f'[ "$(sha256sum {quoted_staging} | cut -d" " -f1)" = {local_hash} ] || {{ echo checksum mismatch; exit 5; }}\n'
+        f"chmod 755 {quoted_staging} && mv {quoted_staging} {shlex.quote(remote_path)}\n"
+        f"rm -f {quoted_status}",
+        timeout=timeout + 10,
+    )
+    if status != 0:
+        device.shell(f"rm -f {quoted_staging} {quoted_status}")
+        raise AdbError(f"{codec.name} transfer to {remote_path} failed: {output.strip()}")
+    return SyncStats("compressed", total_bytes, bytes_sent, codec=codec.name)
+
+
+def sample_file(local_path, slices=SAMPLE_SLICES, slice_size=CHUNK_SIZE):
+    """A few slices spread over the file: code, data and debug info compress differently."""
+    size = os.path.getsize(local_path)
+    if size <= slices * slice_size:
+        with open(local_path, "rb") as f:
+            return f.read()
+    step = (size - slice_size) // (slices - 1)
+    parts = []
+    with open(local_path, "rb") as f:
+        for index in range(slices):
+            f.seek(index * step)
+            parts.append(f.read(slice_size))
+    return b"".join(parts)
+
+
+def measure_codec(codec, sample):
+    """Return (ratio, original bytes per second) of `codec` on `sample`."""
+    compressor = codec.compressor()
+    if compressor is None or not sample:
+        return 1.0, float("inf")
+    started = time.perf_counter()
+    size = 0
+    for offset in range(0, len(sample), CHUNK_SIZE):
+        size += len(compressor.compress(sample[offset : offset + CHUNK_SIZE]))
+    size += len(compressor.flush())
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    return size / len(sample), len(sample) / elapsed
+
+
+def measure_link(device, remote_dir="/data/local/tmp", size=PROBE_SIZE):
+    """Push `size` random (incompressible) bytes and return bytes per second."""
+    remote_path = posixpath.join(remote_dir, ".codex-link-probe")
+    with tempfile.NamedTemporaryFile() as probe:
+        probe.write(os.urandom(size))
+        probe.flush()
+        started = time.perf_counter()
+        device.push(probe.name, remote_path, mode=0o644)
+        elapsed = max(time.perf_counter() - started, 1e-9)
+    device.shell(f"rm -f {shlex.quote(remote_path)}")
+    return size / elapsed
+
+
+def estimate_codecs(device, local_path, codecs=None):
+    """Estimate the transfer time of every codec, fastest first.
+
+    Compression and sending overlap, so a transfer takes as long as the slower
+    of the two: compressing the whole file on this host, or pushing the
+    compressed bytes over the measured link. Device-side decompression is
+    assumed to keep up, which holds for gzip and xz on any recent phone.
+    """
+    if codecs is None:
+        codecs = device_codecs(device)
+    total_bytes = os.path.getsize(local_path)
+    link_rate = measure_link(device)
+    sample = sample_file(local_path)
+    estimates = []
+    for codec in codecs:
+        ratio, compress_rate = measure_codec(codec, sample)
+        seconds = max(total_bytes / compress_rate, total_bytes * ratio / link_rate)
+        estimates.append(CodecEstimate(codec, ratio, compress_rate, seconds))
+    estimates.sort(key=lambda estimate: estimate.seconds)
+    return link_rate, estimates
+
+
+def choose_codec(device, local_path, verbose=True):
+    """Pick the codec with the shortest estimated transfer for this host and link."""
+    link_rate, estimates = estimate_codecs(device, local_path)
+    if verbose:
+        total_bytes = os.path.getsize(local_path)
+        print(f"Link: {format_bytes(link_rate)}/s, file: {format_bytes(total_bytes)}")
+        print(f"  {'codec':<8} {'ratio':>6} {'host':>12} {'estimate':>9} {'effective':>12}")
+        for estimate in estimates:
+            host = "-" if estimate.compress_rate == float("inf") else f"{format_bytes(estimate.compress_rate)}/s"
+            print(f"  {estimate.codec.name:<8} {estimate.ratio:6.2f} {host:>12} "
+                  f"{estimate.seconds:8.2f}s {format_bytes(estimate.effective_rate(total_bytes)):>10}/s")
+    return estimates[0].codec
+
+
+def benchmark_codecs(device, local_path, remote_path, codecs=None):
+    """Push `local_path` once with every codec and print the effective throughput.
+
+    Returns a list of (codec name, seconds, SyncStats), fastest first. The
+    last successful push leaves a verified copy at `remote_path`. A codec that
+    fails is reported and left out; AdbError is raised only if all of them fail.
+    """
+    if codecs is None:
+        codecs = device_codecs(device)
+    total_bytes = os.path.getsize(local_path)
+    results = []
+    failures = []
+    for codec in codecs:
+        started = time.perf_counter()
+        try:
+            stats = compressed_push(device, local_path, remote_path, codec)
+        except (OSError, AdbError, TimeoutError) as e:
+            failures.append((codec.name, str(e)))
+            continue
+        results.append((codec.name, time.perf_counter() - started, stats))
+    results.sort(key=lambda result: result[1])
+    if not results:
+        raise AdbError("every codec failed: " + "; ".join(f"{name}: {error}" for name, error in failures))
+
+    print(f"\nTransfer benchmark, {format_bytes(total_bytes)} to {remote_path}:")
+    print(f"  {'codec':<8} {'seconds':>8} {'on wire':>10} {'ratio':>6} {'effective':>12}")
+    for name, seconds, stats in results:
+        print(f"  {name:<8} {seconds:8.2f} {format_bytes(stats.bytes_sent):>10} "
+              f"{stats.bytes_sent / total_bytes:6.2f} {format_bytes(total_bytes / seconds):>10}/s")
+    for name, error in failures:
+        print(f"  {name:<8} {'failed':>8}  {error.strip().splitlines()[-1] if error.strip() else ''}")
+    return results
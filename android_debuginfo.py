@@ -0,0 +1,149 @@
+# Split debug info for `android_deploy_debug.py --split-debug`.
+#
+# The release profile strips everything, so the split mode first builds with
+# debug info (DEBUG_BUILD_ENV, which is part of the build fingerprint) and
+# then splits it on the host: `llvm-objcopy --only-keep-debug` writes
+# codex.debug, `--strip-debug --add-gnu-debuglink` writes the binary that is
+# pushed. Both keep the GNU build-id the NDK linker stamps, and that is how
+# lldb pairs the process on the device with the symbols on the host. The
+# split is only redone when the build-id changes.
+
+import os
+import shutil
+import struct
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from android_build_cache import RELEASE_DIR
+
+SPLIT_DIR = os.path.join(RELEASE_DIR, "split-debug")
+DEBUG_BUILD_ENV = {"CARGO_PROFILE_RELEASE_DEBUG": "full", "CARGO_PROFILE_RELEASE_STRIP": "none"}
+
+SHT_NOTE = 7
+NT_GNU_BUILD_ID = 3
+
+
+def ndk_host_tag():
+    """The NDK's prebuilt toolchain directory for this host (darwin is x86_64 only)."""
+    return {"darwin": "darwin-x86_64", "win32": "windows-x86_64"}.get(sys.platform, "linux-x86_64")
+
+
+def find_llvm_objcopy():
+    """Path of the NDK's llvm-objcopy, else one on PATH, else None."""
+    ndk_home = os.environ.get("ANDROID_NDK_HOME", "")
+    candidate = os.path.join(ndk_home, "toolchains", "llvm", "prebuilt", ndk_host_tag(), "bin", "llvm-objcopy")
+    if ndk_home and os.access(candidate, os.X_OK):
+        return candidate
+    return shutil.which("llvm-objcopy")
+
+
+def elf_sections(path):
+    """{name: (type, offset, size)} of a little-endian ELF64 file, e.g. an aarch64 binary."""
+    with open(path, "rb") as f:
+        header = f.read(64)
+        if header[:4] != b"\x7fELF" or header[4] != 2 or header[5] != 1:
+            raise ValueError(f"{path} is not a little-endian ELF64 file")
+        shoff, = struct.unpack_from("<Q", header, 0x28)
+        shentsize, shnum, shstrndx = struct.unpack_from("<HHH", header, 0x3A)
+        f.seek(shoff)
+        table = f.read(shentsize * shnum)
+        headers = []
+        for index in range(shnum):
+            name, kind, _, _, offset, size = struct.unpack_from("<IIQQQQ", table, index * shentsize)
+            headers.append((name, kind, offset, size))
+        _, _, strtab_offset, strtab_size = headers[shstrndx]
+        f.seek(strtab_offset)
+        strtab = f.read(strtab_size)
+    sections = {}
+    for name, kind, offset, size in headers:
+        sections[strtab[name:strtab.index(b"\0", name)].decode()] = (kind, offset, size)
+    return sections
+
+
+def read_build_id(path):
+    """The GNU build-id of an ELF file as hex, or None if it has none."""
+    for kind, offset, size in elf_sections(path).values():
+        if kind != SHT_NOTE:
+            continue
+        with open(path, "rb") as f:
+            f.seek(offset)
+            notes = f.read(size)
+        position = 0
+        while position + 12 <= len(notes):
+            namesz, descsz, note_type = struct.unpack_from("<III", notes, position)
+            name_start = position + 12
+            desc_start = name_start + (namesz + 3) // 4 * 4
+            if note_type == NT_GNU_BUILD_ID and notes[name_start:name_start + namesz] == b"GNU\0":
+                return notes[desc_start:desc_start + descsz].hex()
+            position = desc_start + (descsz + 3) // 4 * 4
+    return None
+
+
+@dataclass
+class SplitBinary:
+    stripped: str  # what gets pushed
+    debug: str  # what lldb loads symbols from
+    build_id: str | None
+    original_size: int
+    stripped_size: int
+    debug_size: int
+    reused: bool
+
+    def summary(self):
+        mb = 1024 * 1024
+        return (f"{self.original_size / mb:.1f} MB -> {self.stripped_size / mb:.1f} MB pushed, "
+                f"{self.debug_size / mb:.1f} MB of symbols kept on the host"
+                + (" (unchanged build)" if self.reused else ""))
+
+
+def split_debug_info(binary, out_dir=SPLIT_DIR):
+    """Split `binary` into a stripped copy and its debug info under `out_dir`."""
+    sections = elf_sections(binary)
+    if ".debug_info" not in sections:
+        flags = " ".join(f"{name}={value}" for name, value in DEBUG_BUILD_ENV.items())
+        raise ValueError(f"{binary} has no DWARF; build it with {flags}")
+    objcopy = find_llvm_objcopy()
+    if objcopy is None:
+        raise FileNotFoundError("llvm-objcopy not found; set ANDROID_NDK_HOME or put it on PATH")
+
+    name = os.path.basename(binary)
+    stripped = os.path.join(out_dir, name)
+    debug = os.path.join(out_dir, f"{name}.debug")
+    stamp = os.path.join(out_dir, f"{name}.build-id")
+    build_id = read_build_id(binary)
+    st = os.stat(binary)
+    # Without a build-id the size and mtime stand in for one.
+    key = build_id or f"{st.st_size}-{st.st_mtime_ns}"
+    try:
+        with open(stamp) as f:
+            reused = f.read().strip() == key and os.path.exists(stripped) and os.path.exists(debug)
+    except OSError:
+        reused = False
+
+    if not reused:
+        os.makedirs(out_dir, exist_ok=True)
+        subprocess.run([objcopy, "--only-keep-debug", binary, debug + ".tmp"], check=True,
+                       capture_output=True, timeout=300)
+        # The debuglink names the file it was made with, so give it its final name first.
+        os.replace(debug + ".tmp", debug)
+        subprocess.run([objcopy, "--strip-debug", f"--add-gnu-debuglink={debug}", binary, stripped + ".tmp"],
+                       check=True, capture_output=True, timeout=300)
+        os.chmod(stripped + ".tmp", 0o755)
+        os.replace(stripped + ".tmp", stripped)
+        with open(stamp, "w") as f:
+            f.write(key + "\n")
+    return SplitBinary(stripped, debug, build_id, st.st_size, os.path.getsize(stripped),
+                       os.path.getsize(debug), reused)
+
+
+def lldb_search_commands(split):
+    """lldb settings, sent before attaching, that find the host copies of the binary and symbols."""
+    directory = os.path.abspath(os.path.dirname(split.stripped))
+    return [f"settings set target.exec-search-paths {directory}",
+            f"settings append target.debug-file-search-paths {directory}"]
+
+
+def lldb_symbols_command(split):
+    """lldb command, sent after attaching, that loads the split symbols."""
+    return f"target symbols add {os.path.abspath(split.debug)}"
@@ -5,206 +5,714 @@
 # ]
 # ///
 
+import argparse
 import pexpect
 import sys
 import time
 import os
+import select
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-def android_codex_deploy_debug():
-    """Deploy and debug Android Codex using pexpect"""
+from android_adb import AdbDevice, AdbError, list_devices
+from android_build_cache import BuildCache, build_fingerprint
+from android_build_timings import BuildTimer, print_crate_table, record_build
+from android_compress import CODECS, benchmark_codecs, choose_codec, compressed_push
+from android_debuginfo import (DEBUG_BUILD_ENV, lldb_search_commands, lldb_symbols_command,
+                               split_debug_info)
+from android_lldb_proxy import proxy_lldb
+from android_log import (BUILD_CONSOLE, LLDB_CONSOLE, LOG_DIR, StreamingLog, console,
+                         console_filter, step_log_path, stream_command)
+from android_monitor import print_monitor_summary, start_monitor
+from android_pipeline import Pipeline, Step, StepFailed
+from android_simpleperf import print_hot_functions, profile_on_device
+from android_startup_bench import (DEFAULT_SUBCOMMAND, print_startup_bench,
+                                   record_startup_bench, run_startup_bench)
+from android_sync import delta_push
+from android_trace import tracer
+from android_watch import POLL_INTERVAL, CancellableBuild, file_watcher
+
+CODEX_HOST_BINARY = 'codex-rs/target/aarch64-linux-android/release/codex'
+CODEX_DEVICE_BINARY = '/data/local/tmp/codex'
+
+def android_codex_deploy_debug(full_push=False, all_devices=False, jobs=4, debug_args='--help',
+                               use_build_cache=True, compress=None, transfer_benchmark=False,
+                               startup_bench=None, simpleperf=None, monitor_interval=None,
+                               split_debug=False):
+    """Deploy and debug Android Codex using pexpect
+
+    `startup_bench`, if given, is a dict of run_startup_bench() arguments
+    (runs, warmup, subcommand) plus set_baseline. `simpleperf`, if given, is
+    a dict with the codex args to profile, a duration and the table size.
+    `monitor_interval` samples the launched codex's memory and CPU that often.
+    `split_debug` builds with debug info, pushes a stripped copy and has lldb
+    load the symbols from the host.
+    """
     
     print("=== Android Codex Deploy & Debug Session ===")
+    if split_debug:
+        # Before the cache check: these settings are part of the fingerprint
+        os.environ.update(DEBUG_BUILD_ENV)
+    
+    # The device and lldb get ready while cargo builds; the push waits for both
+    build = Step('build', build_android, skip_if=build_is_cached if use_build_cache else None)
+    devices = Step('device check', detect_devices, retries=2)
+    push_deps = ('build', 'device check')
+    if split_debug:
+        split = [Step('split debug info', split_binary, deps=('build',), timeout=600)]
+        push_deps += ('split debug info',)
+    else:
+        split = []
+    
+    if all_devices:
+        steps = [build, devices, *split,
+                 Step('deploy', partial(deploy_to_all_devices, full_push=full_push, jobs=jobs,
+                                        compress=compress), deps=push_deps)]
+        return Pipeline(steps).run({}).ok
     
-    # Step 1: Build Android binary
-    print("\n1. Building Android Codex binary...")
-    build_child = pexpect.spawn('bash ./build-android.sh', timeout=300)
-    build_child.logfile = sys.stdout.buffer
+    steps = [
+        build,
+        devices,
+        *split,
+        Step('lldb start', start_lldb, timeout=60, required=False),
+        Step('push', partial(push_binary, full_push=full_push, compress=compress,
+                             transfer_benchmark=transfer_benchmark),
+             deps=push_deps, retries=1, timeout=600),
+        Step('chmod', make_executable, deps=('push',), timeout=30),
+        Step('smoke test', smoke_test, deps=('chmod',), timeout=60, required=False),
+    ]
+    # Benchmarks and profiles want the device to themselves, but don't need
+    # the step before them to have succeeded
+    quiet = 'smoke test'
+    if startup_bench:
+        steps.append(Step('startup bench', partial(benchmark_startup, **startup_bench),
+                          deps=('chmod',), after=(quiet,), required=False))
+        quiet = 'startup bench'
+    if simpleperf:
+        steps.append(Step('simpleperf', partial(profile_with_simpleperf, **simpleperf),
+                          deps=('chmod',), after=(quiet,), required=False))
+        quiet = 'simpleperf'
+    steps.append(Step('launch', partial(launch_codex, debug_args=debug_args), deps=('chmod',),
+                      after=(quiet,), timeout=60))
+    if monitor_interval:
+        steps.append(Step('monitor', partial(monitor_codex, interval=monitor_interval),
+                          deps=('launch',), required=False))
+    steps += [
+        Step('lldb attach', attach_lldb, deps=('launch', 'lldb start'), timeout=90, required=False),
+        Step('interactive lldb', interactive_lldb, deps=('lldb attach',), main_thread=True,
+             required=False),
+    ]
+    steps.append(Step('cleanup', cleanup, after=tuple(step.name for step in steps)))
+    
+    # Every device-side step shares this one adb session
+    with AdbDevice() as device:
+        return Pipeline(steps).run({'device': device}).ok
+
+def build_is_cached(ctx):
+    """Restore a cached build of the current inputs; returns why the build can be skipped"""
+    print("\nChecking Android build cache...")
+    span = tracer.begin('build cache check')
+    cache = BuildCache()
+    fingerprint = build_fingerprint()
+    cached = cache.restore(fingerprint)
+    span.end(fingerprint=fingerprint[:12], result=cached or 'miss')
+    ctx['build cache'] = (cache, fingerprint)
+    if cached == 'fresh':
+        print(f"✅ Android binary is up to date (fingerprint {fingerprint[:12]}), skipping build")
+        return f'fresh {fingerprint[:12]}'
+    if cached == 'restored':
+        print(f"✅ Restored cached Android binary for fingerprint {fingerprint[:12]}, skipping build")
+        return f'restored {fingerprint[:12]}'
+    return None
+
+def build_android(ctx=None):
+    """Run build-android.sh and wait for its success banner"""
+    print("\nBuilding Android Codex binary...")
+    span = tracer.begin('build')
+    log = StreamingLog(os.path.join(LOG_DIR, 'build-android.log'), tail_bytes=8 * 1024,
+                       console=console_filter(BUILD_CONSOLE))
+    # --timings makes cargo write per-unit durations we can attribute to crates
+    timer = BuildTimer()
+    env = dict(os.environ)
+    env['CODEX_CARGO_ARGS'] = (env.get('CODEX_CARGO_ARGS', '') + ' --timings').strip()
     
     try:
-        # Wait for build to complete
-        build_index = build_child.expect([
+        # Wait for build to complete, matching whole lines as they stream.
+        # build-android.sh carries on past failed crates, so a failed codex-cli
+        # build has to be caught by its own message.
+        build_index = stream_command(['bash', './build-android.sh'], [
             'Android build completed successfully!',
             'Error:',
-            pexpect.TIMEOUT,
-            pexpect.EOF
-        ], timeout=300)
+            'codex-cli binary build failed',
+        ], timeout=300, log=log, env=env, on_block=timer.feed)
         
+        span.end(success=build_index == 0, log_bytes=log.total_bytes,
+                 crates_compiled=len(timer.crate_starts))
         if build_index == 0:
             print("\n✅ Android build successful!")
         else:
             print("\n❌ Build failed or timed out")
+            print(f"Last build output (full log in {log.log_path}):")
+            print(log.tail())
             return False
             
     except Exception as e:
         print(f"Build error: {e}")
         return False
-    finally:
-        build_child.close()
     
-    # Step 2: Check if device is connected
-    print("\n2. Checking Android device connection...")
-    adb_child = pexpect.spawn('adb devices', timeout=10)
-    adb_child.logfile = sys.stdout.buffer
+    previous = record_build(timer)
+    print_crate_table(timer, previous)
+    if ctx and 'build cache' in ctx:
+        # Stored under the fingerprint taken before cargo ran: an edit made
+        # during the build changes the fingerprint, so the next run rebuilds
+        cache, fingerprint = ctx['build cache']
+        cache.store(fingerprint)
+    return True
+
+def detect_devices(ctx):
+    """Connected devices in the `device` state; fails when there are none"""
+    print("\nChecking Android device connection...")
+    span = tracer.begin('device check')
+    try:
+        devices = [d for d in list_devices() if d['state'] == 'device']
+    except (OSError, AdbError) as e:
+        print(f"adb error: {e}")
+        devices = []
+    span.end(devices=len(devices))
+    
+    if not devices:
+        raise StepFailed("No Android device detected. Please connect device and enable USB debugging.")
+    if len(devices) == 1:
+        print(f"✅ Android device detected ({devices[0]['serial']})")
+    else:
+        print(f"✅ {len(devices)} Android device(s) detected")
+    return devices
+
+def start_lldb(ctx):
+    """Start lldb and connect it to the remote-android platform"""
+    span = tracer.begin('lldb start')
+    # No logfile until attach: lldb's banner would land in the middle of the build log
+    lldb_child = pexpect.spawn('lldb', timeout=30)
+    ctx['lldb'] = lldb_child
+    lldb_child.expect('(lldb)', timeout=10)
+    
+    lldb_child.sendline('platform select remote-android')
+    lldb_child.expect('(lldb)', timeout=10)
     
+    # Connect to device (assuming adb is forwarding)
+    lldb_child.sendline('platform connect connect://localhost:5555')  # Default adb port
+    lldb_child.expect(['(lldb)', 'error:', 'Connected'], timeout=15)
+    span.end()
+    print("✅ lldb started and connected to the Android platform")
+    return lldb_child
+
+def split_binary(ctx):
+    """Split the debug info off the host binary; the push then sends the stripped copy"""
+    print("\nSplitting debug info off the codex binary...")
+    span = tracer.begin('split debug info')
     try:
-        adb_child.expect([pexpect.EOF], timeout=10)
-        adb_output = adb_child.before.decode()
-        
-        if 'device' not in adb_output or adb_output.count('device') < 2:
-            print("❌ No Android device detected. Please connect device and enable USB debugging.")
-            return False
+        split = split_debug_info(CODEX_HOST_BINARY)
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        span.end(error=str(e))
+        raise StepFailed(f"Could not split debug info: {e}")
+    span.end(build_id=split.build_id, stripped_bytes=split.stripped_size, debug_bytes=split.debug_size,
+             reused=split.reused)
+    if split.build_id is None:
+        print("⚠️ The binary has no GNU build-id; lldb may not match the symbols to the process")
+    print(f"✅ Debug info split off ({split.summary()})")
+    return split
+
+def host_binary(ctx):
+    """The binary to push: the stripped copy when the debug info was split off"""
+    split = ctx.get('split debug info')
+    return split.stripped if split else CODEX_HOST_BINARY
+
+def push_binary(ctx, full_push=False, compress=None, transfer_benchmark=False):
+    """Get the host binary onto the device the way the flags ask for"""
+    device = ctx['device']
+    binary = host_binary(ctx)
+    span = tracer.begin('push', serial=ctx['device check'][0]['serial'])
+    try:
+        if transfer_benchmark:
+            # Every codec pushes the binary once; the last one leaves it in place
+            print("\nBenchmarking transfer codecs...")
+            results = benchmark_codecs(device, binary, CODEX_DEVICE_BINARY)
+            for name, seconds, stats in results:
+                span.set(**{f'{name}_seconds': round(seconds, 3), f'{name}_bytes': stats.bytes_sent})
+            span.end(mode='benchmark', fastest=results[0][0])
+            print(f"✅ Binary pushed to device, fastest codec {results[0][0]}")
+        elif compress:
+            print("\nPushing compressed codex binary to Android device...")
+            codec = choose_codec(device, binary) if compress == 'auto' else compress
+            stats = compressed_push(device, binary, CODEX_DEVICE_BINARY, codec)
+            span.end(mode=stats.mode, codec=stats.codec, bytes_sent=stats.bytes_sent,
+                     bytes_skipped=stats.bytes_skipped)
+            print(f"✅ Binary pushed to device ({stats.summary()})")
+        elif full_push:
+            print("\nPushing codex binary to Android device...")
+            sent = device.push(binary, CODEX_DEVICE_BINARY)
+            span.end(mode='full', bytes_sent=sent, bytes_skipped=0)
+            print("✅ Binary pushed to device")
         else:
-            print("✅ Android device detected")
-    finally:
-        adb_child.close()
+            # Only send the blocks that changed since the last deploy
+            print("\nSyncing codex binary to Android device...")
+            stats = delta_push(device, binary, CODEX_DEVICE_BINARY)
+            span.end(mode=stats.mode, bytes_sent=stats.bytes_sent, bytes_skipped=stats.bytes_skipped)
+            print(f"✅ Binary synced to device ({stats.summary()})")
+    except (OSError, AdbError) as e:
+        span.end(error=str(e))
+        raise StepFailed(f"Failed to push binary: {e}")
+
+def make_executable(ctx):
+    print("\nMaking binary executable...")
+    ctx['device'].shell(f'chmod +x {CODEX_DEVICE_BINARY}', timeout=10)
+
+def smoke_test(ctx):
+    """Run `codex --version`; a bad exit status only warns"""
+    print("\nTesting basic execution...")
+    status, output = ctx['device'].shell(f'{CODEX_DEVICE_BINARY} --version', timeout=30)
+    print(output, end='')
+    if status == 0:
+        print("✅ Basic execution test completed")
+    else:
+        print(f"⚠️ Basic execution may have issues (exit status {status})")
+    return status
+
+def benchmark_startup(ctx, runs, warmup, subcommand, set_baseline=False):
+    print(f"\nBenchmarking startup latency ({runs} runs, {warmup} warmup)...")
+    info = ctx['device check'][0]
+    try:
+        bench = run_startup_bench(ctx['device'], CODEX_DEVICE_BINARY, subcommand, runs, warmup)
+    except (RuntimeError, TimeoutError, AdbError) as e:
+        raise StepFailed(f"Startup benchmark failed: {e}")
+    baseline = record_startup_bench(bench, info.get('model', info['serial']), set_baseline=set_baseline)
+    print_startup_bench(bench, baseline)
+    return bench
+
+def profile_with_simpleperf(ctx, args, duration=None, top=20):
+    print(f"\nProfiling 'codex {args}' with simpleperf...")
+    try:
+        samples, paths = profile_on_device(ctx['device'], CODEX_DEVICE_BINARY, args, duration)
+    except (RuntimeError, TimeoutError, OSError, AdbError) as e:
+        raise StepFailed(f"simpleperf profiling failed: {e}")
+    print_hot_functions(samples, top)
+    print(f"\nperf.data: {paths['perf_data']}")
+    print(f"Folded stacks: {paths['folded']} (symbolized on the {paths['symbolized_on']})")
+    return paths
+
+def launch_codex(ctx, debug_args='--help'):
+    """Start codex in the background and wait until it can be attached to
+
+    Returns the PID, or None when codex already finished (`--help` does in
+    milliseconds); only a process that neither exits nor gets ready fails.
+    """
+    print("\nStarting codex on device...")
+    ctx['launch started'] = time.monotonic()
+    span = tracer.begin('launch + PID discovery', command=f'./codex {debug_args}')
+    process = ctx['device'].launch(f'./codex {debug_args}', cwd='/data/local/tmp')
+    span.end(pid=process.pid, ready=process.ready, exited=process.exited)
     
-    # Step 3: Push binary to device
-    print("\n3. Pushing codex binary to Android device...")
-    push_child = pexpect.spawn('adb push codex-rs/target/aarch64-linux-android/release/codex /data/local/tmp/codex', timeout=60)
-    push_child.logfile = sys.stdout.buffer
+    if process.exited:
+        print(f"⚠️ codex (PID {process.pid}) exited before it could be attached; "
+              f"pass a long-running --debug-args to debug it")
+        return None
+    if not process.ready:
+        raise StepFailed(f"codex did not become ready within {process.elapsed:.2f}s")
+    print(f"✅ Started codex with PID {process.pid}, ready after {process.elapsed:.2f}s")
+    return process.pid
+
+def monitor_codex(ctx, interval):
+    if ctx['launch'] is None:
+        return None
+    return start_monitor(ctx['device'].serial, ctx['launch'], interval)
+
+def attach_lldb(ctx):
+    """Attach the already connected lldb to the launched codex and set breakpoints"""
+    pid = ctx['launch']
+    if pid is None:
+        raise StepFailed("codex is not running, nothing to attach to")
+    lldb_child = ctx['lldb start']
+    lldb_child.logfile_read = StreamingLog(step_log_path('lldb attach'), console=console_filter(LLDB_CONSOLE))
+    split = ctx.get('split debug info')
+    if split:
+        # The device only has the stripped binary; point lldb at the host copies
+        for command in lldb_search_commands(split):
+            lldb_child.sendline(command)
+            lldb_child.expect('(lldb)', timeout=10)
+    print(f"\nAttaching to PID {pid}...")
+    span = tracer.begin('lldb attach', pid=pid)
+    lldb_child.sendline(f'attach -p {pid}')
+    lldb_child.expect(['(lldb)', 'error:', 'Process'], timeout=20)
+    time_to_attach = time.monotonic() - ctx['launch started']
+    span.end(time_to_attach=round(time_to_attach, 3))
+    print(f"⏱️ Time to attach: {time_to_attach:.2f}s")
+    if split:
+        lldb_child.sendline(lldb_symbols_command(split))
+        lldb_child.expect(['(lldb)', 'error:'], timeout=60)
     
-    try:
-        push_child.expect([pexpect.EOF], timeout=60)
-        print("✅ Binary pushed to device")
-    except:
-        print("❌ Failed to push binary")
-        return False
-    finally:
-        push_child.close()
+    # Set some useful breakpoints
+    print("Setting breakpoints...")
+    lldb_child.sendline('breakpoint set --name main')
+    lldb_child.expect('(lldb)', timeout=10)
     
-    # Step 4: Make binary executable
-    print("\n4. Making binary executable...")
-    chmod_child = pexpect.spawn('adb shell chmod +x /data/local/tmp/codex', timeout=10)
-    chmod_child.expect([pexpect.EOF], timeout=10)
-    chmod_child.close()
+    lldb_child.sendline('breakpoint set --name panic')
+    lldb_child.expect('(lldb)', timeout=10)
     
-    # Step 5: Test basic execution
-    print("\n5. Testing basic execution...")
-    test_child = pexpect.spawn('adb shell /data/local/tmp/codex --version', timeout=30)
-    test_child.logfile = sys.stdout.buffer
+    # Show current state
+    lldb_child.sendline('process status')
+    lldb_child.expect('(lldb)', timeout=10)
+    console.flush()
     
+    print("\n✅ lldb debugging session established!")
+    print("Common lldb commands:")
+    print("- 'c' or 'continue' to resume execution")
+    print("- 'bt' for backtrace")
+    print("- 'breakpoint list' to see breakpoints")
+    print("- 'register read' to see registers")
+    print("- 'memory read' to examine memory")
+    print("- 'quit' to exit lldb")
+
+def interactive_lldb(ctx):
+    """Hand the terminal to lldb; runs on the main thread for SIGWINCH"""
+    print("\nEntering interactive lldb session (type 'quit' to exit, Ctrl-] to leave)...")
+    span = tracer.begin('interactive lldb')
+    ended_by = proxy_lldb(ctx['lldb start'])
+    span.end(ended_by=ended_by)
+    print(f"Exiting lldb session ({ended_by})...")
+    return ended_by
+
+def cleanup(ctx):
+    """Stop lldb and the monitor and kill what is left of codex"""
+    span = tracer.begin('cleanup')
+    if 'lldb' in ctx:
+        try:
+            ctx['lldb'].close()
+        except:
+            pass
+        if isinstance(ctx['lldb'].logfile_read, StreamingLog):
+            ctx['lldb'].logfile_read.close()
+    monitor = ctx.get('monitor')
+    if monitor:
+        summary = monitor.stop()
+        span.set(peak_rss_kb=summary.peak_rss_kb, avg_cpu_percent=round(summary.avg_cpu_percent, 1))
+        print_monitor_summary(summary)
     try:
-        test_child.expect([pexpect.EOF], timeout=30)
-        print("✅ Basic execution test completed")
+        ctx['device'].shell('killall codex', timeout=5)  # Kill any remaining codex processes
     except:
-        print("⚠️ Basic execution may have issues")
-    finally:
-        test_child.close()
-    
-    # Step 6: Start lldb debugging session
-    print("\n6. Starting lldb debugging session...")
-    
-    # First, start the binary on device in background
-    print("Starting codex on device...")
-    device_child = pexpect.spawn('adb shell', timeout=10)
-    device_child.expect(['#', '$'], timeout=10)
-    device_child.sendline('cd /data/local/tmp')
-    device_child.expect(['#', '$'], timeout=5)
-    device_child.sendline('./codex --help &')  # Run in background
-    device_child.expect(['#', '$'], timeout=10)
-    
-    # Get the process ID
-    device_child.sendline('ps | grep codex')
-    device_child.expect(['#', '$'], timeout=5)
-    ps_output = device_child.before.decode()
-    
-    # Extract PID (assuming format: user pid ppid ... command)
-    lines = ps_output.strip().split('\n')
-    pid = None
-    for line in lines:
-        if 'codex' in line and './codex' in line:
-            parts = line.split()
-            if len(parts) >= 2:
-                pid = parts[1]  # Second column is usually PID
-                break
-    
-    if pid:
-        print(f"✅ Found codex process with PID: {pid}")
-        
-        # Step 7: Setup lldb
-        print("\n7. Setting up lldb debugging...")
-        lldb_child = pexpect.spawn('lldb', timeout=30)
-        lldb_child.logfile = sys.stdout.buffer
+        pass
+    span.end()
+
+def android_codex_watch(debug_args='--help', full_push=False, compress=None, attach=False,
+                        debounce=0.3, split_debug=False):
+    """Rebuild, sync and relaunch codex on the device whenever a source file changes
+
+    Saves that arrive within `debounce` seconds of each other make one
+    rebuild. An edit during a build cancels it and starts over, so a stale
+    binary never holds up the next deploy. With `attach`, one lldb stays
+    connected and follows every relaunched process. `split_debug` is as for
+    android_codex_deploy_debug(), redone after every build.
+    """
+    
+    print("=== Android Codex Watch Mode ===")
+    if split_debug:
+        os.environ.update(DEBUG_BUILD_ENV)
+    watcher = file_watcher()
+    print(f"👀 Watching {watcher.count} {'directories' if watcher.kind == 'inotify' else 'files'} "
+          f"under {watcher.root} ({watcher.kind})")
+    env = dict(os.environ)
+    env['CODEX_CLI_ONLY'] = '1'
+    
+    with AdbDevice() as device:
+        ctx = {'device': device}
+        try:
+            ctx['device check'] = detect_devices(ctx)
+            if attach:
+                ctx['lldb start'] = start_lldb(ctx)
+                ctx['lldb start'].logfile_read = StreamingLog(step_log_path('watch lldb'),
+                                                              console=console_filter(LLDB_CONSOLE))
+        except (StepFailed, pexpect.ExceptionPexpect) as e:
+            print(f"❌ {e}")
+            watcher.close()
+            return False
         
+        # Deploy what is there now, then follow the edits
+        pending = {'(startup)'}
+        first_change = last_change = last_poll = time.monotonic()
+        build = build_span = None
         try:
-            # Wait for lldb prompt
-            lldb_child.expect('(lldb)', timeout=10)
-            
-            # Connect to remote platform
-            print("Connecting to Android platform...")
-            lldb_child.sendline('platform select remote-android')
-            lldb_child.expect('(lldb)', timeout=10)
-            
-            # Connect to device (assuming adb is forwarding)
-            lldb_child.sendline('platform connect connect://localhost:5555')  # Default adb port
-            lldb_child.expect(['(lldb)', 'error:', 'Connected'], timeout=15)
-            
-            # Attach to process
-            print(f"Attaching to PID {pid}...")
-            lldb_child.sendline(f'attach -p {pid}')
-            lldb_child.expect(['(lldb)', 'error:', 'Process'], timeout=20)
-            
-            # Set some useful breakpoints
-            print("Setting breakpoints...")
-            lldb_child.sendline('breakpoint set --name main')
-            lldb_child.expect('(lldb)', timeout=10)
-            
-            lldb_child.sendline('breakpoint set --name panic')
-            lldb_child.expect('(lldb)', timeout=10)
-            
-            # Show current state
-            lldb_child.sendline('process status')
-            lldb_child.expect('(lldb)', timeout=10)
-            
-            print("\n✅ lldb debugging session established!")
-            print("Common lldb commands:")
-            print("- 'c' or 'continue' to resume execution")
-            print("- 'bt' for backtrace")
-            print("- 'breakpoint list' to see breakpoints")
-            print("- 'register read' to see registers")
-            print("- 'memory read' to examine memory")
-            print("- 'quit' to exit lldb")
-            
-            # Interactive session
-            print("\nEntering interactive lldb session (type 'quit' to exit)...")
             while True:
-                try:
-                    lldb_child.expect('(lldb)', timeout=1)
-                    command = input("(lldb) ")
-                    if command.lower() in ['quit', 'exit', 'q']:
-                        lldb_child.sendline('quit')
-                        break
-                    lldb_child.sendline(command)
-                except pexpect.TIMEOUT:
-                    continue
-                except KeyboardInterrupt:
-                    print("\nExiting lldb session...")
-                    lldb_child.sendline('quit')
-                    break
-                    
-        except Exception as e:
-            print(f"lldb error: {e}")
+                readable = [source for source in (watcher, build) if source and source.fileno() is not None]
+                if 'lldb start' in ctx:
+                    readable.append(ctx['lldb start'].child_fd)
+                timeout = None
+                if pending and not build:
+                    timeout = max(0.0, last_change + debounce - time.monotonic())
+                if watcher.fileno() is None:
+                    timeout = min(timeout if timeout is not None else POLL_INTERVAL, POLL_INTERVAL)
+                ready, _, _ = select.select(readable, [], [], timeout)
+                
+                polling = watcher.fileno() is None and time.monotonic() - last_poll >= POLL_INTERVAL
+                if watcher in ready or polling:
+                    last_poll = time.monotonic()
+                    changes = watcher.read_changes()
+                    if changes:
+                        if not pending:
+                            first_change = time.monotonic()
+                        pending |= changes
+                        last_change = time.monotonic()
+                        if build:
+                            print(f"\n✋ {len(changes)} more change(s), cancelling the build "
+                                  f"after {build.elapsed:.1f}s")
+                            build.cancel()
+                            build_span.end(cancelled=True)
+                            build = None
+                
+                if build and build in ready and build.read():
+                    build_span.end(returncode=build.returncode)
+                    if build.returncode == 0:
+                        print(f"\n✅ Built in {build.elapsed:.1f}s")
+                        redeploy(ctx, debug_args, full_push, compress, first_change, split_debug)
+                    else:
+                        print(f"\n❌ Build failed (exit status {build.returncode}); "
+                              f"full log in {build.log.log_path}")
+                        print(build.log.tail())
+                    build = None
+                    print("\n👀 Waiting for changes (Ctrl-C to stop)...")
+                
+                if 'lldb start' in ctx and ctx['lldb start'].child_fd in ready:
+                    try:
+                        ctx['lldb start'].read_nonblocking(64 * 1024, timeout=0)
+                    except pexpect.TIMEOUT:
+                        pass
+                    except pexpect.EOF:
+                        print("⚠️ lldb exited; relaunches will no longer be attached")
+                        del ctx['lldb start']
+                
+                if pending and not build and time.monotonic() - last_change >= debounce:
+                    names = sorted(os.path.relpath(path, watcher.root) for path in pending if path != '(startup)')
+                    if names:
+                        print(f"\n📝 {len(names)} change(s): {', '.join(names[:5])}"
+                              f"{' ...' if len(names) > 5 else ''}")
+                    print("🔨 Building codex for Android...")
+                    build_span = tracer.begin('watch build', changes=len(names))
+                    build = CancellableBuild(['bash', './build-android.sh'],
+                                             os.path.join(LOG_DIR, 'watch-build.log'), env=env)
+                    pending = set()
+        except KeyboardInterrupt:
+            print("\nStopping watch mode...")
         finally:
-            try:
-                lldb_child.close()
-            except:
-                pass
+            if build:
+                build.cancel()
+            watcher.close()
+            cleanup(ctx)
+    return True
+
+def redeploy(ctx, debug_args, full_push, compress, first_change, split_debug=False):
+    """Sync the new binary, then swap the running codex for a fresh one"""
+    span = tracer.begin('watch redeploy')
+    try:
+        if split_debug:
+            ctx['split debug info'] = split_binary(ctx)
+        # delta_push renames into place, so the old process keeps running meanwhile
+        push_binary(ctx, full_push=full_push, compress=compress)
+        make_executable(ctx)
+        lldb_child = ctx.get('lldb start')
+        if lldb_child and ctx.get('attached'):
+            lldb_child.sendline('process kill')
+            lldb_child.expect('(lldb)', timeout=10)
+            ctx['attached'] = False
+        elif ctx.get('launch'):
+            ctx['device'].shell(f"kill {ctx['launch']} 2>/dev/null", timeout=5)
+        ctx['launch'] = launch_codex(ctx, debug_args)
+        if lldb_child and ctx['launch']:
+            split = ctx.get('split debug info')
+            for command in lldb_search_commands(split) if split else []:
+                lldb_child.sendline(command)
+                lldb_child.expect('(lldb)', timeout=10)
+            print(f"Re-attaching lldb to PID {ctx['launch']}...")
+            lldb_child.sendline(f"process attach --pid {ctx['launch']}")
+            lldb_child.expect(['(lldb)', 'error:'], timeout=20)
+            if split:
+                lldb_child.sendline(lldb_symbols_command(split))
+                lldb_child.expect(['(lldb)', 'error:'], timeout=60)
+            lldb_child.sendline('continue')
+            ctx['attached'] = True
+    except (StepFailed, OSError, AdbError, TimeoutError, pexpect.ExceptionPexpect) as e:
+        span.end(error=str(e))
+        print(f"❌ Redeploy failed: {e}")
+        return False
+    latency = time.monotonic() - first_change
+    span.end(edit_to_running=round(latency, 3))
+    if ctx['launch']:
+        print(f"🔁 codex PID {ctx['launch']} running {latency:.1f}s after the first change")
     else:
-        print("❌ Could not find codex process PID")
+        print(f"🔁 New codex deployed {latency:.1f}s after the first change (it exited right away)")
+    return True
+
+def deploy_to_all_devices(ctx, full_push=False, jobs=4, compress=None):
+    """Push and smoke-test codex on every connected device concurrently"""
+    devices = ctx['device check']
     
-    # Cleanup
+    # Each worker owns its device's adb session, so wall time follows the
+    # slowest device rather than the sum of all of them.
+    workers = max(1, min(jobs, len(devices)))
+    print(f"\nDeploying to {len(devices)} device(s) with {workers} worker(s)...")
+    binary = host_binary(ctx)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda info: deploy_to_device(info, full_push, compress, binary), devices))
+    wall_time = time.monotonic() - started
+    
+    print_device_results(results, wall_time)
+    return all(result['ok'] for result in results)
+
+def deploy_to_device(info, full_push=False, compress=None, binary=CODEX_HOST_BINARY):
+    """Push, chmod and run `codex --version` on one serial, timing each step"""
+    result = {
+        'serial': info['serial'],
+        'model': info.get('model', ''),
+        'ok': False,
+        'detail': '',
+        'push': None,
+        'chmod': None,
+        'smoke': None,
+    }
+    serial = info['serial']
+    device_span = tracer.begin('deploy device', serial=serial)
     try:
-        device_child.sendline('killall codex')  # Kill any remaining codex processes
-        device_child.expect(['#', '$'], timeout=5)
-        device_child.close()
-    except:
-        pass
+        with AdbDevice(serial) as device:
+            with tracer.span('push', serial=serial) as span:
+                if compress:
+                    # Each device gets its own link measurement
+                    codec = compress
+                    if compress == 'auto':
+                        codec = choose_codec(device, binary, verbose=False)
+                    stats = compressed_push(device, binary, CODEX_DEVICE_BINARY, codec)
+                    span.set(mode=stats.mode, codec=stats.codec, bytes_sent=stats.bytes_sent,
+                             bytes_skipped=stats.bytes_skipped)
+                    result['detail'] = stats.summary()
+                elif full_push:
+                    sent = device.push(binary, CODEX_DEVICE_BINARY)
+                    span.set(mode='full', bytes_sent=sent, bytes_skipped=0)
+                    result['detail'] = 'full push'
+                else:
+                    stats = delta_push(device, binary, CODEX_DEVICE_BINARY)
+                    span.set(mode=stats.mode, bytes_sent=stats.bytes_sent, bytes_skipped=stats.bytes_skipped)
+                    result['detail'] = stats.summary()
+            result['push'] = span.duration
+            
+            with tracer.span('chmod', serial=serial) as span:
+                device.shell(f'chmod +x {CODEX_DEVICE_BINARY}', timeout=10)
+            result['chmod'] = span.duration
+            
+            with tracer.span('smoke test', serial=serial) as span:
+                status, output = device.shell(f'{CODEX_DEVICE_BINARY} --version', timeout=30)
+                span.set(exit_status=status)
+            result['smoke'] = span.duration
+            result['ok'] = status == 0
+            if output.strip():
+                version = output.strip().splitlines()[-1]
+            else:
+                version = f'--version exited with status {status}'
+            result['detail'] = f"{version} ({result['detail']})"
+    except (OSError, AdbError, TimeoutError) as e:
+        result['detail'] = str(e)
+    result['total'] = device_span.end(ok=result['ok']).duration
+    return result
+
+def print_device_results(results, wall_time):
+    """Print one row per device with step timings in seconds"""
+    def seconds(value):
+        return '-' if value is None else f'{value:.2f}'
     
-    return True
+    print(f"\n{'':2} {'serial':<20} {'model':<16} {'push':>7} {'chmod':>7} {'smoke':>7} {'total':>7}  detail")
+    for result in results:
+        mark = '✅' if result['ok'] else '❌'
+        print(f"{mark} {result['serial']:<20} {result['model']:<16} "
+              f"{seconds(result['push']):>7} {seconds(result['chmod']):>7} "
+              f"{seconds(result['smoke']):>7} {seconds(result['total']):>7}  {result['detail']}")
+    slowest = max(result['total'] for result in results)
+    print(f"\nWall time {wall_time:.2f}s (slowest device {slowest:.2f}s, "
+          f"sum of devices {sum(result['total'] for result in results):.2f}s)")
 
 # Run the deployment and debugging session
 if __name__ == "__main__":
-    success = android_codex_deploy_debug()
+    parser = argparse.ArgumentParser(description="Build, deploy and debug codex on an Android device.")
+    parser.add_argument('--full-push', action='store_true',
+                        help="always push the whole binary instead of syncing changed blocks")
+    parser.add_argument('--all-devices', action='store_true',
+                        help="deploy and smoke-test on every connected device instead of debugging one")
+    parser.add_argument('--jobs', type=int, default=4,
+                        help="maximum number of devices to deploy to at once (default: 4)")
+    parser.add_argument('--debug-args', default='--help',
+                        help="arguments for the codex process lldb attaches to (default: --help)")
+    parser.add_argument('--no-build-cache', action='store_true',
+                        help="always run build-android.sh, even when no build input changed")
+    parser.add_argument('--compress', choices=['auto', *CODECS],
+                        help="stream the binary through a compressor into the device's decompressor; "
+                             "'auto' measures host CPU and link speed to pick the codec")
+    parser.add_argument('--transfer-benchmark', action='store_true',
+                        help="push the binary once with every codec and report each one's throughput")
+    parser.add_argument('--startup-bench', type=int, metavar='RUNS', default=0,
+                        help="time codex startup on the device RUNS times per command after the smoke test")
+    parser.add_argument('--bench-warmup', type=int, default=3,
+                        help="untimed runs before each benchmarked command (default: 3)")
+    parser.add_argument('--bench-subcommand', default=DEFAULT_SUBCOMMAND,
+                        help=f"extra codex arguments to benchmark besides --version and --help "
+                             f"(default: '{DEFAULT_SUBCOMMAND}')")
+    parser.add_argument('--set-baseline', action='store_true',
+                        help="make this commit's startup results the baseline for regression checks")
+    parser.add_argument('--simpleperf', metavar='ARGS',
+                        help="record 'codex ARGS' with simpleperf record -g on the device and report "
+                             "its hot functions")
+    parser.add_argument('--simpleperf-duration', type=float,
+                        help="stop recording after this many seconds (default: when codex exits)")
+    parser.add_argument('--monitor', type=float, metavar='SECONDS',
+                        help="sample the launched codex's RSS, CPU and threads every SECONDS into a CSV")
+    parser.add_argument('--top', type=int, default=20,
+                        help="rows in the simpleperf hot-function table (default: 20)")
+    parser.add_argument('--split-debug', action='store_true',
+                        help="build with debug info, push a stripped binary and let lldb load the "
+                             "symbols from the host copy")
+    parser.add_argument('--watch', action='store_true',
+                        help="rebuild, sync and relaunch codex whenever a .rs file or Cargo.toml "
+                             "under codex-rs changes")
+    parser.add_argument('--attach', action='store_true',
+                        help="with --watch, keep lldb attached to each relaunched codex")
+    parser.add_argument('--debounce', type=float, default=0.3,
+                        help="with --watch, seconds of quiet before a burst of saves is built "
+                             "(default: 0.3)")
+    args = parser.parse_args()
+    if args.watch:
+        try:
+            success = android_codex_watch(debug_args=args.debug_args, full_push=args.full_push,
+                                          compress=args.compress, attach=args.attach,
+                                          debounce=args.debounce, split_debug=args.split_debug)
+        finally:
+            print(f"\nTrace written to {tracer.save('android_deploy_debug')}")
+        sys.exit(0 if success else 1)
+    try:
+        success = android_codex_deploy_debug(full_push=args.full_push, all_devices=args.all_devices,
+                                             jobs=args.jobs, debug_args=args.debug_args,
+                                             use_build_cache=not args.no_build_cache,
+                                             compress=args.compress,
+                                             transfer_benchmark=args.transfer_benchmark,
+                                             startup_bench=args.startup_bench and {
+                                                 'runs': args.startup_bench,
+                                                 'warmup': args.bench_warmup,
+                                                 'subcommand': args.bench_subcommand,
+                                                 'set_baseline': args.set_baseline,
+                                             },
+                                             simpleperf=args.simpleperf and {
+                                                 'args': args.simpleperf,
+                                                 'duration': args.simpleperf_duration,
+                                                 'top': args.top,
+                                             },
+                                             monitor_interval=args.monitor,
+                                             split_debug=args.split_debug)
+    finally:
+        print(f"\nTrace written to {tracer.save('android_deploy_debug')}")
     if success:
         print("\n✅ Android Codex deploy & debug session completed!")
     else:
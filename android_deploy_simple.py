@@ -1,123 +1,146 @@
 # uv run android_deploy_simple.py
-# /// script
-# dependencies = [
-#   "pexpect",
-# ]
-# ///
 
-import pexpect
-import sys
+import argparse
 import time
 import os
+from functools import partial
 
-def simple_android_build_test():
-    """Simple Android build and test without full codex"""
-    
-    print("=== Simple Android Build Test ===")
-    
-    # Step 1: Build a simple library first
-    print("\n1. Building simple Android library...")
-    build_child = pexpect.spawn('cargo build --release --target aarch64-linux-android --lib -p codex-apply-patch', timeout=60)
-    build_child.logfile = sys.stdout.buffer
-    
-    try:
-        build_child.expect([pexpect.EOF], timeout=60)
-        print("✅ Simple library build successful!")
-    except Exception as e:
-        print(f"Build error: {e}")
-        return False
-    finally:
-        build_child.close()
-    
-    # Step 2: Try building a simple binary
-    print("\n2. Creating minimal test binary...")
-    
-    # Create a minimal test binary
-    test_main = """
+from android_adb import AdbDevice, AdbError, list_devices
+from android_compress import CODECS, choose_codec, compressed_push
+from android_log import BUILD_CONSOLE, StreamingLog, console_filter, run_command, step_log_path
+from android_pipeline import Pipeline, Step, StepFailed
+from android_trace import tracer
+
+TEST_MAIN = """
 fn main() {
     println!("Hello Android from Rust!");
     println!("Current dir: {:?}", std::env::current_dir());
     println!("Args: {:?}", std::env::args().collect::<Vec<_>>());
 }
 """
+
+def simple_android_build_test(compress=None):
+    """Simple Android build and test without full codex"""
     
-    # Write test binary
-    with open('test_android_main.rs', 'w') as f:
-        f.write(test_main)
-    
-    print("\n3. Building test binary...")
-    rustc_child = pexpect.spawn('rustc --target aarch64-linux-android test_android_main.rs -o test_android', timeout=60)
-    rustc_child.logfile = sys.stdout.buffer
-    
-    try:
-        rustc_child.expect([pexpect.EOF], timeout=60)
-        print("✅ Test binary build successful!")
-    except:
-        print("❌ Test binary build failed")
-        return False
-    finally:
-        rustc_child.close()
+    print("=== Simple Android Build Test ===")
     
-    # Step 3: Check if device is connected
-    print("\n4. Checking Android device connection...")
-    adb_child = pexpect.spawn('adb devices', timeout=10)
-    adb_child.logfile = sys.stdout.buffer
+    # The library build, the test binary build and device detection don't
+    # need each other; only the push waits for the binary and the device
+    steps = [
+        Step('build library', build_library, timeout=120),
+        Step('build test binary', build_test_binary, timeout=120),
+        Step('device check', detect_devices, retries=2),
+        Step('push', partial(push_test_binary, compress=compress),
+             deps=('build test binary', 'device check'), retries=1, timeout=300),
+        Step('chmod', partial(run_on_device, command='chmod +x /data/local/tmp/test_android'),
+             deps=('push',), timeout=30),
+        Step('run', partial(run_on_device, command='/data/local/tmp/test_android'),
+             deps=('chmod',), timeout=30),
+    ]
+    steps.append(Step('cleanup', cleanup, after=tuple(step.name for step in steps)))
     
+    with AdbDevice() as device:
+        result = Pipeline(steps).run({'device': device})
+    if result.ok:
+        print("✅ Simple Android deployment test completed!")
+    return result.ok
+
+def build_library(ctx):
+    """Build a simple library first"""
+    print("\nBuilding simple Android library...")
+    span = tracer.begin('build library', package='codex-apply-patch')
+    log = StreamingLog(step_log_path('build library'), tail_bytes=8 * 1024, console=console_filter(BUILD_CONSOLE))
     try:
-        adb_child.expect([pexpect.EOF], timeout=10)
-        adb_output = adb_child.before.decode()
-        
-        if 'device' not in adb_output or adb_output.count('device') < 2:
-            print("❌ No Android device detected. Please connect device and enable USB debugging.")
-            return False
-        else:
-            print("✅ Android device detected")
-    finally:
-        adb_child.close()
-    
-    # Step 4: Push and test binary
-    print("\n5. Pushing test binary to device...")
-    push_child = pexpect.spawn('adb push test_android /data/local/tmp/test_android', timeout=30)
-    push_child.logfile = sys.stdout.buffer
+        status = run_command(['cargo', 'build', '--release', '--target', 'aarch64-linux-android',
+                              '--lib', '-p', 'codex-apply-patch'], timeout=60, log=log)
+    except OSError as e:
+        span.end(error=str(e))
+        raise StepFailed(f"Build error: {e}")
+    span.end(exit_status=status, log_bytes=log.total_bytes)
+    if status != 0:
+        print(f"Last build output (full log in {log.log_path}):")
+        print(log.tail())
+        raise StepFailed("Library build failed" if status is not None else "Library build timed out")
+    print("✅ Simple library build successful!")
+
+def build_test_binary(ctx):
+    """Write and compile a minimal test binary"""
+    print("\nCreating minimal test binary...")
+    with open('test_android_main.rs', 'w') as f:
+        f.write(TEST_MAIN)
     
+    print("\nBuilding test binary...")
+    span = tracer.begin('build test binary')
+    log = StreamingLog(step_log_path('build test binary'), tail_bytes=8 * 1024,
+                       console=console_filter(BUILD_CONSOLE))
     try:
-        push_child.expect([pexpect.EOF], timeout=30)
-        print("✅ Binary pushed to device")
-    except:
-        print("❌ Failed to push binary")
-        return False
-    finally:
-        push_child.close()
-    
-    # Step 5: Make executable and test
-    print("\n6. Testing binary execution...")
-    test_commands = [
-        'adb shell chmod +x /data/local/tmp/test_android',
-        'adb shell /data/local/tmp/test_android'
-    ]
-    
-    for cmd in test_commands:
-        cmd_child = pexpect.spawn(cmd, timeout=15)
-        cmd_child.logfile = sys.stdout.buffer
+        status = run_command(['rustc', '--target', 'aarch64-linux-android', 'test_android_main.rs',
+                              '-o', 'test_android'], timeout=60, log=log)
+    except OSError as e:
+        span.end(error=str(e))
+        raise StepFailed(f"Test binary build failed: {e}")
+    span.end(exit_status=status)
+    if status != 0:
+        print(f"Last rustc output (full log in {log.log_path}):")
+        print(log.tail())
+        raise StepFailed("Test binary build failed")
+    print("✅ Test binary build successful!")
+
+def detect_devices(ctx):
+    print("\nChecking Android device connection...")
+    with tracer.span('device check') as span:
         try:
-            cmd_child.expect([pexpect.EOF], timeout=15)
-        finally:
-            cmd_child.close()
-    
-    print("✅ Simple Android deployment test completed!")
-    
-    # Cleanup
+            devices = [d for d in list_devices() if d['state'] == 'device']
+        except (OSError, AdbError) as e:
+            print(f"adb error: {e}")
+            devices = []
+        span.set(devices=len(devices))
+    
+    if not devices:
+        raise StepFailed("No Android device detected. Please connect device and enable USB debugging.")
+    print(f"✅ Android device detected ({devices[0]['serial']})")
+    return devices
+
+def push_test_binary(ctx, compress=None):
+    print("\nPushing test binary to device...")
+    device = ctx['device']
+    span = tracer.begin('push')
+    try:
+        if compress:
+            codec = choose_codec(device, 'test_android') if compress == 'auto' else compress
+            stats = compressed_push(device, 'test_android', '/data/local/tmp/test_android', codec)
+            span.end(codec=stats.codec, bytes_sent=stats.bytes_sent)
+            print(f"✅ Binary pushed to device ({stats.summary()})")
+        else:
+            sent = device.push('test_android', '/data/local/tmp/test_android')
+            span.end(bytes_sent=sent)
+            print("✅ Binary pushed to device")
+    except (OSError, AdbError) as e:
+        span.end(error=str(e))
+        raise StepFailed(f"Failed to push binary: {e}")
+
+def run_on_device(ctx, command):
+    status, output = ctx['device'].shell(command, timeout=15)
+    print(output, end='')
+    return status
+
+def cleanup(ctx):
     try:
         os.remove('test_android_main.rs')
         os.remove('test_android')
     except:
         pass
-    
-    return True
 
 # Run the simple test
 if __name__ == "__main__":
-    success = simple_android_build_test()
+    parser = argparse.ArgumentParser(description="Build a minimal Rust binary and run it on an Android device.")
+    parser.add_argument('--compress', choices=['auto', *CODECS],
+                        help="stream the binary through a compressor into the device's decompressor")
+    args = parser.parse_args()
+    try:
+        success = simple_android_build_test(compress=args.compress)
+    finally:
+        print(f"\nTrace written to {tracer.save('android_deploy_simple')}")
     if success:
         print("\n✅ Simple Android deployment successful!")
     else:
@@ -0,0 +1,437 @@
+# uv run android_fake_adb.py --root /tmp/fake-device
+#
+# A stand-in adb server for running the Android scripts without a phone.
+#
+# It speaks enough of the adb server socket protocol for android_adb.py:
+# host:devices-l, host:transport*, forward/killforward, shell: (interactive
+# and one-shot), exec: and sync: SEND/RECV. Shell and exec commands run in a
+# local `sh` and device paths under /data/local/tmp are mapped into the --root
+# directory.
+#
+# Point the scripts at it with ANDROID_ADB_SERVER_PORT, e.g.
+#   ANDROID_ADB_SERVER_PORT=5038 uv run android_deploy_simple.py
+#
+# The link can be made to behave like a real one: --latency delays every
+# request, --bandwidth throttles everything sent either way through one shared
+# budget, and --fail makes a share of the requests for a service fail, e.g.
+#   --latency 2 --bandwidth 30M --fail sync:=0.2 --fail shell:=0.05
+#
+# Device commands see `ps`, `pidof`, `killall` and `pkill` stand-ins (bin/ under
+# --root, first on PATH) that only know the processes this device started, so
+# the scripts' process handling works and never touches the host's own. They
+# read /proc, so they need a Linux host.
+
+import argparse
+import os
+import random
+import re
+import signal
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+
+DEVICE_DIR = "/data/local/tmp"
+PROCESS_TOOLS = ("ps", "pidof", "killall", "pkill")
+# Marks the processes started for a device (by its root), whatever they exec afterwards.
+DEVICE_ENV = "FAKE_ADB_DEVICE"
+
+
+class Link:
+    """Latency, bandwidth and injected failures of the connection to a device."""
+
+    def __init__(self, latency=0.0, bandwidth=None, failures=None, seed=None):
+        self.latency = latency  # seconds added to every request
+        self.bandwidth = bandwidth  # bytes per second, both directions together
+        self.failures = dict(failures or {})  # service prefix -> share of requests that fail
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._busy_until = 0.0
+
+    def delay(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def transfer(self, size):
+        """Wait until `size` bytes would have crossed the link."""
+        if not self.bandwidth or not size:
+            return
+        with self._lock:
+            start = max(time.monotonic(), self._busy_until)
+            self._busy_until = start + size / self.bandwidth
+            done = self._busy_until
+        time.sleep(max(0.0, done - time.monotonic()))
+
+    def should_fail(self, service):
+        for prefix, rate in self.failures.items():
+            if service.startswith(prefix):
+                with self._lock:
+                    return self._random.random() < rate
+        return False
+
+
+class FakeDevice:
+    """State shared by every connection: the device's files, forwards and link."""
+
+    def __init__(self, root, serial="fake-0001", link=None):
+        self.root = os.path.abspath(root)
+        self.serial = serial
+        self.forwards = {}
+        self.link = link or Link()
+        # requests, failed (injected), processes, bytes_in, bytes_out
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        os.makedirs(self.map_path(DEVICE_DIR), exist_ok=True)
+        self.env = self._install_process_tools()
+
+    def _install_process_tools(self):
+        bin_dir = os.path.join(self.root, "bin")
+        os.makedirs(bin_dir, exist_ok=True)
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        for tool in PROCESS_TOOLS:
+            path = os.path.join(bin_dir, tool)
+            with open(path, "w") as f:
+                f.write(f"#!{sys.executable} -S\n"
+                        f"import sys\n"
+                        f"sys.path.insert(0, {module_dir!r})\n"
+                        f"from android_fake_adb import process_tool\n"
+                        f"sys.exit(process_tool(sys.argv))\n")
+            os.chmod(path, 0o755)
+        env = dict(os.environ)
+        env["PATH"] = bin_dir + os.pathsep + env.get("PATH", "")
+        env[DEVICE_ENV] = self.root
+        return env
+
+    def count(self, **amounts):
+        with self._stats_lock:
+            self.stats.update(amounts)
+
+    def spawn(self, argv, **kwargs):
+        self.count(processes=1)
+        return subprocess.Popen(argv, cwd=self.map_path(DEVICE_DIR), env=self.env, **kwargs)
+
+    def kill_processes(self):
+        """Kill whatever the device started that is still running, like a reboot."""
+        for pid in device_processes(self.root):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    def map_path(self, device_path):
+        return self.root + device_path
+
+    def map_text(self, text):
+        return text.replace(DEVICE_DIR, self.map_path(DEVICE_DIR))
+
+    def describe(self):
+        return f"{self.serial}\tdevice product:fake model:Fake_Device device:fake transport_id:1\n"
+
+
+class FakeAdbHandler(socketserver.BaseRequestHandler):
+    def recv(self, size):
+        """Read what the host sent, at the link's pace."""
+        data = self.request.recv(size)
+        self.server.device.link.transfer(len(data))
+        self.server.device.count(bytes_in=len(data))
+        return data
+
+    def send(self, data):
+        self.server.device.link.transfer(len(data))
+        self.server.device.count(bytes_out=len(data))
+        self.request.sendall(data)
+
+    def recv_exact(self, count):
+        data = b""
+        while len(data) < count:
+            chunk = self.recv(count - len(data))
+            if not chunk:
+                raise EOFError
+            data += chunk
+        return data
+
+    def okay(self, payload=None):
+        reply = b"OKAY"
+        if payload is not None:
+            reply += b"%04x" % len(payload) + payload
+        self.send(reply)
+
+    def fail(self, message):
+        payload = message.encode()
+        self.send(b"FAIL" + b"%04x" % len(payload) + payload)
+
+    def handle(self):
+        device = self.server.device
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                length = int(self.recv_exact(4), 16)
+                service = self.recv_exact(length).decode()
+                if not self.dispatch(device, service):
+                    return
+        except EOFError:
+            return
+
+    def dispatch(self, device, service):
+        """Handle one request; returns True if the connection expects another."""
+        device.link.delay()
+        device.count(requests=1)
+        if device.link.should_fail(service):
+            device.count(failed=1)
+            self.fail(f"injected failure: {service.split(':', 1)[0]}")
+            return False
+        if service == "host:version":
+            self.okay(b"0029")
+        elif service in ("host:devices", "host:devices-l"):
+            line = device.describe()
+            if service == "host:devices":
+                line = line.split(" ")[0] + "\n"
+            self.okay(line.encode())
+        elif service in ("host:transport-any", "host:transport-usb"):
+            self.okay()
+            return True
+        elif service.startswith("host:transport:"):
+            if service.split(":", 2)[2] != device.serial:
+                self.fail(f"device '{service.split(':', 2)[2]}' not found")
+                return False
+            self.okay()
+            return True
+        elif ":forward:" in service or ":killforward:" in service:
+            self.forward(device, service)
+        elif service.startswith("shell:"):
+            self.okay()
+            self.shell(device, service[len("shell:") :])
+        elif service.startswith("exec:"):
+            self.okay()
+            self.exec(device, service[len("exec:") :])
+        elif service == "sync:":
+            self.okay()
+            self.sync(device)
+        else:
+            self.fail(f"unknown service: {service}")
+        return False
+
+    def forward(self, device, service):
+        if ":killforward:" in service:
+            device.forwards.pop(service.split(":killforward:", 1)[1], None)
+        else:
+            local, _, remote = service.split(":forward:", 1)[1].partition(";")
+            device.forwards[local] = remote
+        self.send(b"OKAYOKAY")
+
+    def shell(self, device, command):
+        argv = ["sh", "-c", device.map_text(command)] if command else ["sh"]
+        proc = device.spawn(
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+
+        def pump_stdin():
+            pending = b""
+            try:
+                while chunk := self.recv(65536):
+                    pending += chunk
+                    lines, _, pending = pending.rpartition(b"\n")
+                    if lines:
+                        proc.stdin.write(device.map_text(lines.decode()).encode() + b"\n")
+                        proc.stdin.flush()
+            except OSError:
+                pass
+            finally:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+        threading.Thread(target=pump_stdin, daemon=True).start()
+        while chunk := proc.stdout.read1(65536):
+            self.send(chunk)
+        proc.wait()
+
+    def exec(self, device, command):
+        # Raw stdin, no line rewriting: this is how binaries get streamed in.
+        # The command outlives the connection, as it does under adbd.
+        proc = device.spawn(
+            ["sh", "-c", device.map_text(command)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while chunk := self.recv(65536):
+                proc.stdin.write(chunk)
+        except OSError:
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    def sync(self, device):
+        while True:
+            command, length = struct.unpack("<4sI", self.recv_exact(8))
+            if command == b"QUIT":
+                return
+            if command == b"RECV":
+                self.recv_file(device, self.recv_exact(length).decode())
+                continue
+            if command != b"SEND":
+                self.send(b"FAIL" + struct.pack("<I", 11) + b"unsupported")
+                return
+            remote_path, _, mode = self.recv_exact(length).decode().rpartition(",")
+            path = device.map_path(remote_path)
+            with open(path, "wb") as f:
+                while True:
+                    chunk_id, size = struct.unpack("<4sI", self.recv_exact(8))
+                    if chunk_id == b"DONE":
+                        break
+                    f.write(self.recv_exact(size))
+            os.chmod(path, int(mode) & 0o777)
+            self.send(b"OKAY" + struct.pack("<I", 0))
+
+    def recv_file(self, device, remote_path):
+        try:
+            with open(device.map_path(remote_path), "rb") as f:
+                while chunk := f.read(64 * 1024):
+                    self.send(b"DATA" + struct.pack("<I", len(chunk)) + chunk)
+        except OSError:
+            message = f"remote object '{remote_path}' does not exist".encode()
+            self.send(b"FAIL" + struct.pack("<I", len(message)) + message)
+            return
+        self.send(b"DONE" + struct.pack("<I", 0))
+
+
+def device_processes(root):
+    """{pid: {"ppid", "state", "name", "args", "rss_kb", "vsz_kb"}} of the processes the device at `root` started."""
+    marker = os.fsencode(f"{DEVICE_ENV}={root}")
+    processes = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit() or int(entry) == os.getpid():
+            continue
+        try:
+            with open(f"/proc/{entry}/environ", "rb") as f:
+                if marker not in f.read().split(b"\0"):
+                    continue
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                args = [arg.decode(errors="replace") for arg in f.read().split(b"\0") if arg]
+        except OSError:
+            continue  # gone, or not ours to read
+        name = stat[stat.index("(") + 1:stat.rindex(")")]
+        fields = stat[stat.rindex(")") + 2:].split()
+        processes[int(entry)] = {
+            "ppid": int(fields[1]),
+            "state": fields[0],
+            "name": name,
+            "args": " ".join(args) or f"[{name}]",
+            "vsz_kb": int(fields[20]) // 1024,
+            "rss_kb": int(fields[21]) * os.sysconf("SC_PAGE_SIZE") // 1024,
+        }
+    return processes
+
+
+def matches_name(process, name):
+    """pidof/killall matching: the command name or the basename of argv[0]."""
+    argv0 = process["args"].split(" ", 1)[0]
+    return name in (process["name"], os.path.basename(argv0))
+
+
+def process_tool(argv):
+    """toybox-style ps, pidof, killall and pkill limited to one fake device's processes."""
+    tool, args = os.path.basename(argv[0]), argv[1:]
+    processes = device_processes(os.environ.get(DEVICE_ENV, ""))
+    if tool == "ps":
+        pids = None
+        if "-p" in args and args.index("-p") + 1 < len(args):
+            pids = {int(pid) for pid in args[args.index("-p") + 1].split(",") if pid.isdigit()}
+        print(f"{'USER':<10} {'PID':>5} {'PPID':>5} {'VSZ':>8} {'RSS':>6} S NAME")
+        user = os.environ.get("USER", "shell")
+        for pid, process in sorted(processes.items()):
+            if pids is None or pid in pids:
+                print(f"{user:<10} {pid:>5} {process['ppid']:>5} {process['vsz_kb']:>8} "
+                      f"{process['rss_kb']:>6} {process['state']} {process['name']}")
+        return 0
+    sig = signal.SIGTERM
+    if args and args[0].startswith("-") and len(args[0]) > 1:
+        name = args.pop(0)[1:].upper()
+        sig = int(name) if name.isdigit() else signal.Signals["SIG" + name.removeprefix("SIG")]
+    if tool == "pkill":
+        pattern = re.compile(args[0]) if args else None
+        targets = [pid for pid, process in processes.items() if pattern and pattern.search(process["name"])]
+    else:
+        targets = [pid for pid, process in processes.items() if any(matches_name(process, name) for name in args)]
+    if tool == "pidof":
+        if targets:
+            print(" ".join(str(pid) for pid in sorted(targets, reverse=True)))
+        return 0 if targets else 1
+    for pid in targets:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+    if not targets and tool == "killall":
+        print(f"killall: {' '.join(args)}: no process killed", file=sys.stderr)
+    return 0 if targets else 1
+
+
+def parse_size(text):
+    """Bytes from e.g. `500K`, `30M` or `1G`."""
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper().removesuffix("B")
+    if text and text[-1] in units:
+        return float(text[:-1]) * units[text[-1]]
+    return float(text)
+
+
+def parse_failure(text):
+    """(service prefix, rate) from `PREFIX=RATE`."""
+    prefix, _, rate = text.rpartition("=")
+    if not prefix:
+        raise argparse.ArgumentTypeError(f"expected SERVICE_PREFIX=RATE, got {text!r}")
+    return prefix, float(rate)
+
+
+class FakeAdbServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, device, port=0):
+        super().__init__(("127.0.0.1", port), FakeAdbHandler)
+        self.device = device
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stand-in adb server backed by a local directory.")
+    parser.add_argument("--root", required=True, help="directory that plays the device's filesystem")
+    parser.add_argument("--port", type=int, default=5038)
+    parser.add_argument("--serial", default="fake-0001")
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds added to every request")
+    parser.add_argument("--bandwidth", type=parse_size,
+                        help="bytes per second over the link, e.g. 30M (default: unlimited)")
+    parser.add_argument("--fail", type=parse_failure, action="append", default=[], metavar="PREFIX=RATE",
+                        help="fail this share of the requests whose service starts with PREFIX")
+    parser.add_argument("--seed", type=int, help="seed for the injected failures")
+    args = parser.parse_args()
+
+    link = Link(args.latency / 1000, args.bandwidth, dict(args.fail), args.seed)
+    server = FakeAdbServer(FakeDevice(args.root, args.serial, link), args.port)
+    print(f"Fake adb server for {args.serial} listening on port {server.port}")
+    print(f"export ANDROID_ADB_SERVER_PORT={server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.device.kill_processes()
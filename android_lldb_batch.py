@@ -0,0 +1,191 @@
+# Unattended lldb triage: run a command file against many processes at once.
+#
+# Every target (a PID, or a command launched on the device first) gets its own
+# `lldb --batch -s <script>` run: select the platform, attach, run the user's
+# commands, detach. Batch mode echoes each command as `(lldb) <command>`, which
+# splits the output back into per-command sections without any prompt
+# scraping; `bt all`, `register read` and `frame variable` sections are then
+# parsed into per-thread, per-frame JSON.
+
+import json
+import os
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+DEFAULT_PORT = 5039
+DEFAULT_PLATFORM_URL = f"connect://localhost:{DEFAULT_PORT}"
+COMMAND_ECHO_RE = re.compile(r"^\(lldb\) (.*)$", re.MULTILINE)
+THREAD_RE = re.compile(
+    r"^\s*(?P<selected>\*)?\s*thread #(?P<index>\d+)"
+    r"(?:, name = '(?P<name>[^']*)')?"
+    r"(?:, tid = (?P<tid>0x[0-9a-fA-F]+|\d+))?"
+    r".*?(?:, stop reason = (?P<stop_reason>.*))?$"
+)
+FRAME_RE = re.compile(
+    r"^\s*(?P<selected>\*)?\s*frame #(?P<index>\d+): (?P<address>0x[0-9a-fA-F]+)"
+    r"(?: (?P<module>[^`\s]+)`(?P<function>.*?))?"
+    r"(?: at (?P<file>[^:\s]+):(?P<line>\d+)(?::\d+)?)?\s*$"
+)
+REGISTER_RE = re.compile(r"^\s*(?P<name>\w+) = (?P<value>0x[0-9a-fA-F]+)")
+THREAD_SELECT_RE = re.compile(r"^(?:thread select|t) (\d+)$")
+FRAME_SELECT_RE = re.compile(r"^(?:frame select|f) (\d+)$")
+
+
+def read_command_file(path):
+    """lldb commands from `path`, without blank lines and # comments."""
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def platform_port(platform_url):
+    """The TCP port a `connect://host:port` platform URL talks to."""
+    return urlsplit(platform_url).port or DEFAULT_PORT
+
+
+def batch_script(pid, commands, platform_url=DEFAULT_PLATFORM_URL):
+    """The lldb script for one target; `platform_url` None attaches locally."""
+    lines = []
+    if platform_url:
+        lines += ["platform select remote-android", f"platform connect {platform_url}"]
+    lines.append(f"process attach --pid {pid}")
+    lines += commands
+    lines.append("process detach")
+    return "\n".join(lines) + "\n"
+
+
+def split_sections(output):
+    """[(command, output)] from lldb batch output, in the order they ran."""
+    sections = []
+    matches = list(COMMAND_ECHO_RE.finditer(output))
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(output)
+        sections.append((match.group(1).strip(), output[match.end():end].strip("\n")))
+    return sections
+
+
+def parse_backtrace(text):
+    """Threads with their frames from `bt` / `bt all` output."""
+    threads = []
+    for line in text.splitlines():
+        match = THREAD_RE.match(line)
+        if match and "frame #" not in line:
+            threads.append({
+                "index": int(match["index"]),
+                "name": match["name"],
+                "tid": match["tid"],
+                "stop_reason": match["stop_reason"],
+                "selected": bool(match["selected"]),
+                "frames": [],
+            })
+            continue
+        match = FRAME_RE.match(line)
+        if match and threads:
+            threads[-1]["frames"].append({
+                "index": int(match["index"]),
+                "address": match["address"],
+                "module": match["module"],
+                "function": match["function"],
+                "file": match["file"],
+                "line": int(match["line"]) if match["line"] else None,
+            })
+    return threads
+
+
+def parse_registers(text):
+    return {match["name"]: match["value"] for match in map(REGISTER_RE.match, text.splitlines()) if match}
+
+
+def triage_result(target, output, returncode):
+    """Turn one lldb batch run into the JSON record for its target."""
+    sections = split_sections(output)
+    threads = {}
+    current_thread = current_frame = None
+    errors = []
+
+    def thread_record(thread_index):
+        return threads.setdefault(thread_index, {"index": thread_index, "frames": []})
+
+    def frame_record(thread_index, frame_index):
+        thread = thread_record(thread_index)
+        for frame in thread["frames"]:
+            if frame["index"] == frame_index:
+                return frame
+        frame = {"index": frame_index}
+        thread["frames"].append(frame)
+        return frame
+
+    for command, text in sections:
+        if text.lstrip().startswith("error:"):
+            errors.append({"command": command, "error": text.strip()})
+        if command.startswith(("bt", "thread backtrace")):
+            for thread in parse_backtrace(text):
+                known = threads.get(thread["index"], {})
+                # Keep what earlier commands found out about these frames.
+                variables = {f["index"]: f["variables"] for f in known.get("frames", []) if "variables" in f}
+                for frame in thread["frames"]:
+                    if frame["index"] in variables:
+                        frame["variables"] = variables[frame["index"]]
+                threads[thread["index"]] = {**known, **thread}
+                if thread["selected"]:
+                    current_thread, current_frame = thread["index"], 0
+        elif match := THREAD_SELECT_RE.match(command):
+            current_thread, current_frame = int(match.group(1)), 0
+        elif match := FRAME_SELECT_RE.match(command):
+            current_frame = int(match.group(1))
+        elif command.startswith(("register read", "re r")):
+            thread_record(current_thread or 1).setdefault("registers", {}).update(parse_registers(text))
+        elif command.startswith(("frame variable", "fr v", "v ")) or command == "v":
+            frame = frame_record(current_thread or 1, current_frame or 0)
+            frame["variables"] = text
+
+    attached = any(command.startswith("process attach") for command, _ in sections) and not any(
+        error["command"].startswith("process attach") for error in errors
+    )
+    return {
+        **target,
+        "ok": returncode == 0 and attached,
+        "returncode": returncode,
+        "errors": errors,
+        "threads": [threads[index] for index in sorted(threads)],
+        "commands": [{"command": command, "output": text} for command, text in sections],
+    }
+
+
+def run_batch(target, commands, platform_url=DEFAULT_PLATFORM_URL, timeout=120, lldb="lldb"):
+    """Attach to `target["pid"]`, run `commands` and return its triage record."""
+    with tempfile.NamedTemporaryFile("w", suffix=".lldb", delete=False) as f:
+        f.write(batch_script(target["pid"], commands, platform_url))
+        script = f.name
+    try:
+        proc = subprocess.run(
+            [lldb, "--no-lldbinit", "--batch", "-s", script],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            # Errors must stay next to the command that caused them.
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=timeout,
+        )
+        return triage_result(target, proc.stdout, proc.returncode)
+    except subprocess.TimeoutExpired as e:
+        output = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        result = triage_result(target, output, None)
+        result["errors"].append({"command": None, "error": f"lldb timed out after {timeout}s"})
+        return result
+    finally:
+        os.remove(script)
+
+
+def run_triage(targets, commands, platform_url=DEFAULT_PLATFORM_URL, jobs=8, timeout=120):
+    """Run `commands` against every target, `jobs` lldb processes at a time."""
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(lambda target: run_batch(target, commands, platform_url, timeout), targets))
+
+
+def write_report(results, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
@@ -5,225 +5,184 @@
 # ]
 # ///
 
+import argparse
 import pexpect
 import sys
 import time
 import os
 import signal
+from functools import partial
 
-def android_lldb_debug_session():
+from android_adb import AdbDevice, AdbError
+from android_lldb_batch import (DEFAULT_PLATFORM_URL, DEFAULT_PORT, platform_port,
+                                read_command_file, run_triage, write_report)
+from android_lldb_proxy import proxy_lldb
+from android_log import LLDB_CONSOLE, StreamingLog, console_filter, step_log_path
+from android_lldb_sampler import LldbSampler, print_profile
+from android_monitor import print_monitor_summary, start_monitor
+from android_pipeline import Pipeline, Step, StepFailed
+from android_trace import tracer
+
+def android_lldb_debug_session(monitor_interval=None):
     """Complete Android debugging session with lldb"""
     
     print("=== Android LLDB Debugging Session ===")
     
-    # Step 1: Verify binary exists on device
-    print("\n1. Verifying binary on device...")
-    adb_child = pexpect.spawn('adb shell ls -la /data/local/tmp/test_android_minimal', timeout=10)
-    adb_child.logfile = sys.stdout.buffer
+    # lldb startup and the port forward don't wait for the device-side steps
+    steps = [
+        Step('verify binary', verify_binary, retries=1, timeout=30),
+        Step('lldb start', start_lldb, timeout=60),
+        Step('forward', forward_port, timeout=30, required=False),
+        Step('lldb-server lookup', find_lldb_server, timeout=30, required=False),
+        Step('launch', launch_test_binary, deps=('verify binary',), timeout=60),
+    ]
+    if monitor_interval:
+        steps.append(Step('monitor', partial(monitor_process, interval=monitor_interval),
+                          deps=('launch',), required=False))
+    steps += [
+        Step('lldb demo', demo_lldb, deps=('launch', 'lldb start'), after=('forward', 'lldb-server lookup'),
+             timeout=60),
+        Step('interactive lldb', interactive_lldb, deps=('lldb demo',), main_thread=True),
+    ]
+    steps.append(Step('cleanup', cleanup, after=tuple(step.name for step in steps)))
     
-    try:
-        adb_child.expect([pexpect.EOF], timeout=10)
-        print("✅ Binary exists on device")
-    except:
-        print("❌ Binary not found on device")
-        return False
-    finally:
-        adb_child.close()
+    # Every device-side step below runs on this one adb shell session
+    with AdbDevice() as device:
+        result = Pipeline(steps).run({'device': device})
+    if result.ok:
+        print("✅ Android LLDB debugging session completed!")
+    return result.ok
+
+def verify_binary(ctx):
+    print("\nVerifying binary on device...")
+    status, output = ctx['device'].shell('ls -la /data/local/tmp/test_android_minimal', timeout=10)
+    print(output, end='')
+    if status != 0:
+        raise StepFailed("Binary not found on device")
+    print("✅ Binary exists on device")
+
+def start_lldb(ctx):
+    """Start lldb and select the remote Android platform"""
+    # No logfile yet: the banner would interleave with the device steps' output
+    lldb_child = pexpect.spawn('lldb', timeout=30)
+    ctx['lldb'] = lldb_child
+    lldb_child.expect('(lldb)', timeout=10)
+    lldb_child.sendline('platform select remote-android')
+    lldb_child.expect('(lldb)', timeout=10)
+    print("✅ LLDB started with the remote-android platform")
+    return lldb_child
+
+def forward_port(ctx, port=DEFAULT_PORT):
+    print(f"Setting up ADB port forwarding (tcp:{port})...")
+    ctx['device'].forward(f'tcp:{port}', f'tcp:{port}')
+
+def find_lldb_server(ctx):
+    # Start lldb-server on Android device (this usually requires root)
+    print("Looking for lldb-server on device (may require root)...")
+    status, output = ctx['device'].shell('which lldb-server', timeout=5)
+    print(output, end='')
+    return status
+
+def launch_test_binary(ctx):
+    """Start the binary in the background; the PID comes straight from $!"""
+    print("\nStarting binary on device...")
+    ctx['launch started'] = time.monotonic()
+    span = tracer.begin('launch + PID discovery')
+    process = ctx['device'].launch('./test_android_minimal', cwd='/data/local/tmp')
+    span.end(pid=process.pid, ready=process.ready, exited=process.exited)
     
-    # Step 2: Start the binary on device in background and get PID
-    print("\n2. Starting binary on device...")
-    device_shell = pexpect.spawn('adb shell', timeout=10)
-    device_shell.logfile = sys.stdout.buffer
+    if process.exited:
+        raise StepFailed(f"Process {process.pid} exited before it could be attached")
+    if not process.ready:
+        raise StepFailed(f"Process did not become ready within {process.elapsed:.2f}s")
+    print(f"✅ Started process with PID {process.pid}, ready after {process.elapsed:.2f}s")
+    return process.pid
+
+def monitor_process(ctx, interval):
+    return start_monitor(ctx['device'].serial, ctx['launch'], interval)
+
+def demo_lldb(ctx):
+    pid = ctx['launch']
+    lldb_child = ctx['lldb start']
+    lldb_child.logfile_read = StreamingLog(step_log_path('lldb demo'), console=console_filter(LLDB_CONSOLE))
+    print(f"\nSetting up lldb debugging for PID {pid}...")
+    print(f"⏱️ Ready to attach after {time.monotonic() - ctx['launch started']:.2f}s")
     
-    try:
-        device_shell.expect(['#', '$'], timeout=10)
-        
-        # Start the binary in background with sleep to keep it running
-        device_shell.sendline('cd /data/local/tmp && ./test_android_minimal & echo "Started with PID: $!"')
-        device_shell.expect(['#', '$'], timeout=10)
-        
-        # Get process list to find our binary
-        device_shell.sendline('ps | grep test_android')
-        device_shell.expect(['#', '$'], timeout=5)
-        ps_output = device_shell.before.decode()
-        
-        print("Process search output:")
-        print(ps_output)
-        
-        # Try to extract PID (this is tricky as the format varies by Android version)
-        lines = ps_output.strip().split('\n')
-        pid = None
-        for line in lines:
-            if 'test_android_minimal' in line:
-                parts = line.split()
-                # Try different positions for PID (usually 2nd or 3rd column)
-                for i in [1, 2]:
-                    if i < len(parts) and parts[i].isdigit():
-                        pid = parts[i]
-                        break
-                if pid:
-                    break
-        
-        if not pid:
-            # Alternative: try to start with a different approach
-            print("Could not find PID, trying alternative approach...")
-            device_shell.sendline('nohup ./test_android_minimal < /dev/null > test_output.log 2>&1 &')
-            device_shell.expect(['#', '$'], timeout=5)
-            time.sleep(2)  # Give it time to start
-            
-            device_shell.sendline('ps -A | grep test_android')
-            device_shell.expect(['#', '$'], timeout=5)
-            ps_output = device_shell.before.decode()
-            
-            lines = ps_output.strip().split('\n')
-            for line in lines:
-                if 'test_android_minimal' in line:
-                    parts = line.split()
-                    for i in range(len(parts)):
-                        if parts[i].isdigit() and len(parts[i]) >= 3:  # PID is usually 3+ digits
-                            pid = parts[i]
-                            break
-                    if pid:
-                        break
-        
-        if pid:
-            print(f"✅ Found process with PID: {pid}")
-        else:
-            print("❌ Could not find process PID")
-            # Let's still try to demonstrate lldb setup
-            pid = "1234"  # Dummy PID for demo
-            print(f"Using dummy PID {pid} for lldb demonstration")
-        
-    except Exception as e:
-        print(f"Error starting process: {e}")
-        return False
+    # For non-root devices, we'll demonstrate the commands that would work
+    print("\n=== LLDB Command Reference for Android Debugging ===")
+    print("The following commands demonstrate how to debug on Android:")
+    print("1. On device (requires root or lldb-server):")
+    print("   adb shell")
+    print("   su  # if available")
+    print("   lldb-server platform --listen '*:5039' --server")
+    print()
+    print("2. In LLDB on host:")
+    print("   platform connect connect://localhost:5039")
+    print(f"   attach -p {pid}")
+    print("   breakpoint set --name main")
+    print("   continue")
+    print()
+    print("3. Common debugging commands:")
+    print("   bt                    # Show backtrace")
+    print("   frame variable        # Show local variables")
+    print("   register read         # Show CPU registers")
+    print("   memory read <addr>    # Read memory")
+    print("   step                  # Step one line")
+    print("   next                  # Step over function calls")
+    print("   continue              # Resume execution")
+    print("   quit                  # Exit lldb")
     
-    # Step 3: Setup lldb debugging session
-    print(f"\n3. Setting up lldb debugging for PID {pid}...")
+    # Let's demonstrate some basic lldb commands even without remote connection
+    print("\n=== Basic LLDB Commands Demo ===")
     
-    # Start lldb
-    lldb_child = pexpect.spawn('lldb', timeout=30)
-    lldb_child.logfile = sys.stdout.buffer
+    # Show help
+    lldb_child.sendline('help')
+    lldb_child.expect('(lldb)', timeout=10)
     
-    try:
-        # Wait for lldb prompt
-        lldb_child.expect('(lldb)', timeout=10)
-        print("✅ LLDB started successfully")
-        
-        # Set up remote Android debugging
-        print("Setting up remote Android platform...")
-        lldb_child.sendline('platform select remote-android')
-        lldb_child.expect('(lldb)', timeout=10)
-        
-        # Forward ADB for debugging
-        print("Setting up ADB port forwarding...")
-        adb_forward = pexpect.spawn('adb forward tcp:5039 tcp:5039', timeout=10)
-        adb_forward.expect([pexpect.EOF], timeout=10)
-        adb_forward.close()
-        
-        # Start lldb-server on Android device (this usually requires root)
-        print("Attempting to start lldb-server on device (may require root)...")
-        device_shell.sendline('which lldb-server')
-        device_shell.expect(['#', '$'], timeout=5)
-        
-        # For non-root devices, we'll demonstrate the commands that would work
-        print("\n=== LLDB Command Reference for Android Debugging ===")
-        print("The following commands demonstrate how to debug on Android:")
-        print("1. On device (requires root or lldb-server):")
-        print("   adb shell")
-        print("   su  # if available")
-        print("   lldb-server platform --listen '*:5039' --server")
-        print()
-        print("2. In LLDB on host:")
-        print("   platform connect connect://localhost:5039")
-        print(f"   attach -p {pid}")
-        print("   breakpoint set --name main")
-        print("   continue")
-        print()
-        print("3. Common debugging commands:")
-        print("   bt                    # Show backtrace")
-        print("   frame variable        # Show local variables")
-        print("   register read         # Show CPU registers")
-        print("   memory read <addr>    # Read memory")
-        print("   step                  # Step one line")
-        print("   next                  # Step over function calls")
-        print("   continue              # Resume execution")
-        print("   quit                  # Exit lldb")
-        
-        # Let's demonstrate some basic lldb commands even without remote connection
-        print("\n=== Basic LLDB Commands Demo ===")
-        
-        # Show help
-        lldb_child.sendline('help')
-        lldb_child.expect('(lldb)', timeout=10)
-        
-        # Show platform info
-        lldb_child.sendline('platform status')
-        lldb_child.expect('(lldb)', timeout=10)
-        
-        # List available platforms
-        lldb_child.sendline('platform list')
-        lldb_child.expect('(lldb)', timeout=10)
-        
-        print("\n✅ LLDB commands demonstrated successfully!")
-        print("\n=== Interactive LLDB Session ===")
-        print("You can now enter lldb commands. Type 'quit' to exit.")
-        print("Note: Remote debugging requires lldb-server running on Android device.")
-        
-        # Interactive session
-        while True:
-            try:
-                # Wait for prompt with short timeout to allow user input
-                index = lldb_child.expect(['(lldb)', pexpect.TIMEOUT], timeout=1)
-                
-                if index == 0:  # Got lldb prompt
-                    try:
-                        command = input("(lldb) ").strip()
-                        if command.lower() in ['quit', 'exit', 'q']:
-                            lldb_child.sendline('quit')
-                            break
-                        elif command:
-                            lldb_child.sendline(command)
-                    except (EOFError, KeyboardInterrupt):
-                        print("\nExiting lldb session...")
-                        lldb_child.sendline('quit')
-                        break
-                
-            except pexpect.TIMEOUT:
-                continue
-            except KeyboardInterrupt:
-                print("\nExiting lldb session...")
-                lldb_child.sendline('quit')
-                break
-        
-    except Exception as e:
-        print(f"LLDB error: {e}")
-    finally:
+    # Show platform info
+    lldb_child.sendline('platform status')
+    lldb_child.expect('(lldb)', timeout=10)
+    
+    # List available platforms
+    lldb_child.sendline('platform list')
+    lldb_child.expect('(lldb)', timeout=10)
+    
+    print("\n✅ LLDB commands demonstrated successfully!")
+
+def interactive_lldb(ctx):
+    """Bytes go straight between the terminal and lldb; needs the main thread for SIGWINCH"""
+    print("\n=== Interactive LLDB Session ===")
+    print("You can now enter lldb commands. Type 'quit' to exit, Ctrl-] to leave.")
+    print("Note: Remote debugging requires lldb-server running on Android device.")
+    span = tracer.begin('interactive lldb')
+    ended_by = proxy_lldb(ctx['lldb start'])
+    span.end(ended_by=ended_by)
+    print(f"Exiting lldb session ({ended_by})...")
+    return ended_by
+
+def cleanup(ctx):
+    print("\nCleaning up...")
+    if 'lldb' in ctx:
         try:
-            lldb_child.close()
+            ctx['lldb'].close()
         except:
             pass
-    
-    # Cleanup
-    print("\n4. Cleaning up...")
+        if isinstance(ctx['lldb'].logfile_read, StreamingLog):
+            ctx['lldb'].logfile_read.close()
+    if ctx.get('monitor'):
+        print_monitor_summary(ctx['monitor'].stop())
+    device = ctx['device']
     try:
         # Kill any remaining processes
-        device_shell.sendline('pkill test_android_minimal')
-        device_shell.expect(['#', '$'], timeout=5)
-        device_shell.close()
+        device.shell('pkill test_android_minimal', timeout=5)
     except:
         pass
     
     # Remove port forwarding
     try:
-        adb_remove_forward = pexpect.spawn('adb forward --remove tcp:5039', timeout=10)
-        adb_remove_forward.expect([pexpect.EOF], timeout=10)
-        adb_remove_forward.close()
+        device.remove_forward('tcp:5039')
     except:
         pass
-    
-    print("✅ Android LLDB debugging session completed!")
-    return True
 
 def show_android_debug_setup():
     """Show instructions for setting up Android debugging"""
@@ -257,11 +216,183 @@ def show_android_debug_setup():
     print("- Use Android logging (logcat)")
     print()
     
+def android_lldb_batch_triage(command_file, pids=(), launch_commands=(), jobs=8, timeout=120,
+                              platform_url=DEFAULT_PLATFORM_URL, output=None):
+    """Run an lldb command file against many processes without anyone at the keyboard"""
+    
+    print("=== Android LLDB Batch Triage ===")
+    commands = read_command_file(command_file)
+    
+    # The forward is set up while the launch commands start
+    steps = [Step('launch', partial(launch_targets, pids=pids, launch_commands=launch_commands))]
+    if platform_url:
+        steps.append(Step('forward', partial(forward_port, port=platform_port(platform_url)), timeout=30))
+    steps.append(Step('lldb batch', partial(triage_targets, commands=commands, jobs=jobs, timeout=timeout,
+                                            platform_url=platform_url),
+                      deps=tuple(step.name for step in steps)))
+    if platform_url:
+        steps.append(Step('remove forward', partial(remove_forward, port=platform_port(platform_url)),
+                          after=('lldb batch',)))
+    
+    ctx = {}
+    with AdbDevice() as device:
+        ctx['device'] = device
+        if not Pipeline(steps).run(ctx).ok:
+            return False
+    results = ctx['lldb batch']
+    
+    if output is None:
+        output = os.path.join('codex-rs', 'target', 'android-triage',
+                              f"triage-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    write_report(results, output)
+    
+    for result in results:
+        mark = '✅' if result['ok'] else '❌'
+        frames = sum(len(thread['frames']) for thread in result['threads'])
+        problem = f", {result['errors'][0]['error'].splitlines()[0]}" if result['errors'] else ''
+        print(f"{mark} PID {result['pid']}: {len(result['threads'])} thread(s), {frames} frame(s){problem}")
+    print(f"\nTriage report written to {output}")
+    return all(result['ok'] for result in results)
+
+def launch_targets(ctx, pids=(), launch_commands=()):
+    """Triage targets: the given PIDs plus one per launch command that became ready"""
+    targets = [{'pid': pid} for pid in pids]
+    for command in launch_commands:
+        with tracer.span('launch + PID discovery', command=command) as span:
+            process = ctx['device'].launch(command, cwd='/data/local/tmp')
+            span.set(pid=process.pid, ready=process.ready)
+        if process.ready:
+            print(f"✅ Launched '{command}' as PID {process.pid}")
+            targets.append({'launch': command, 'pid': process.pid})
+        else:
+            print(f"❌ '{command}' did not become ready (PID {process.pid})")
+    
+    if not targets:
+        raise StepFailed("No process to attach to: give --pid or --launch")
+    return targets
+
+def triage_targets(ctx, commands, jobs=8, timeout=120, platform_url=DEFAULT_PLATFORM_URL):
+    targets = ctx['launch']
+    print(f"\nRunning {len(commands)} command(s) against {len(targets)} process(es), "
+          f"{jobs} at a time...")
+    with tracer.span('lldb batch', targets=len(targets), commands=len(commands)):
+        return run_triage(targets, commands, platform_url, jobs, timeout)
+
+def remove_forward(ctx, port=DEFAULT_PORT):
+    try:
+        ctx['device'].remove_forward(f'tcp:{port}')
+    except (OSError, AdbError):
+        pass
+
+def android_lldb_sample_profile(pid=None, launch_command=None, rate=20.0, duration=10.0,
+                                platform_url=DEFAULT_PLATFORM_URL, output=None):
+    """Profile a process by repeatedly interrupting it under lldb and folding its stacks"""
+    
+    print("=== LLDB Sampling Profiler ===")
+    if not pid and not launch_command:
+        print("❌ Nothing to profile: give --pid or --launch")
+        return False
+    
+    steps = []
+    if launch_command:
+        steps.append(Step('launch', partial(launch_targets, launch_commands=[launch_command])))
+    if platform_url:
+        steps.append(Step('forward', partial(forward_port, port=platform_port(platform_url)), timeout=30))
+    steps.append(Step('sampling', partial(sample_stacks, pid=pid, rate=rate, duration=duration,
+                                          platform_url=platform_url),
+                      deps=tuple(step.name for step in steps)))
+    if platform_url:
+        steps.append(Step('remove forward', partial(remove_forward, port=platform_port(platform_url)),
+                          after=('sampling',)))
+    
+    ctx = {}
+    with AdbDevice() as device:
+        ctx['device'] = device
+        if not Pipeline(steps).run(ctx).ok:
+            return False
+    pid, profile = ctx['sampling']
+    
+    if output is None:
+        output = os.path.join('codex-rs', 'target', 'android-profiles',
+                              f"lldb-{pid}-{time.strftime('%Y%m%d-%H%M%S')}.folded")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        f.write(profile.folded())
+    print_profile(profile)
+    print(f"\nFolded stacks written to {output} (flamegraph.pl, inferno-flamegraph or speedscope)")
+    return True
+
+def sample_stacks(ctx, pid=None, rate=20.0, duration=10.0, platform_url=DEFAULT_PLATFORM_URL):
+    """Attach an LldbSampler and profile; returns (pid, profile)"""
+    if 'launch' in ctx:
+        pid = ctx['launch'][0]['pid']
+    sampler = None
+    try:
+        with tracer.span('lldb attach', pid=pid):
+            sampler = LldbSampler(pid, platform_url)
+        print(f"Sampling PID {pid} at {rate:g} Hz for {duration:g}s...")
+        with tracer.span('sampling', rate=rate, duration=duration) as span:
+            profile = sampler.profile(rate, duration)
+            span.set(**profile.overhead())
+    except (pexpect.ExceptionPexpect, RuntimeError) as e:
+        raise StepFailed(f"Sampling failed: {e}")
+    finally:
+        if sampler:
+            sampler.close()
+    return pid, profile
+
 # Run the debugging session
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Debug codex test binaries on an Android device with lldb.")
+    parser.add_argument('--batch', metavar='COMMAND_FILE',
+                        help="run this lldb command file against --pid/--launch targets instead of "
+                             "the interactive session, and write the results as JSON")
+    parser.add_argument('--pid', type=int, action='append', default=[],
+                        help="device PID to triage (repeatable)")
+    parser.add_argument('--launch', action='append', default=[],
+                        help="command to start in /data/local/tmp and triage (repeatable)")
+    parser.add_argument('--jobs', type=int, default=8,
+                        help="lldb processes to run at once in batch mode (default: 8)")
+    parser.add_argument('--timeout', type=int, default=120,
+                        help="seconds each batch lldb run may take (default: 120)")
+    parser.add_argument('--platform-url', default=DEFAULT_PLATFORM_URL,
+                        help=f"lldb-server platform to connect to (default: {DEFAULT_PLATFORM_URL}); "
+                             "'' attaches to local processes")
+    parser.add_argument('--monitor', type=float, metavar='SECONDS',
+                        help="sample the debugged process's RSS, CPU and threads every SECONDS into a CSV")
+    parser.add_argument('--output', help="where to write the batch JSON report or the folded stacks")
+    parser.add_argument('--profile', action='store_true',
+                        help="sample the first --pid/--launch target's stacks instead of debugging it")
+    parser.add_argument('--rate', type=float, default=20.0,
+                        help="samples per second in profile mode (default: 20)")
+    parser.add_argument('--duration', type=float, default=10.0,
+                        help="seconds to sample in profile mode (default: 10)")
+    args = parser.parse_args()
+    
+    if args.profile:
+        try:
+            success = android_lldb_sample_profile(args.pid[0] if args.pid else None,
+                                                  args.launch[0] if args.launch else None,
+                                                  args.rate, args.duration,
+                                                  args.platform_url or None, args.output)
+        finally:
+            print(f"\nTrace written to {tracer.save('android_lldb_debug')}")
+        sys.exit(0 if success else 1)
+    
+    if args.batch:
+        try:
+            success = android_lldb_batch_triage(args.batch, args.pid, args.launch, args.jobs,
+                                                args.timeout, args.platform_url or None, args.output)
+        finally:
+            print(f"\nTrace written to {tracer.save('android_lldb_debug')}")
+        sys.exit(0 if success else 1)
+    
     show_android_debug_setup()
     print("\nStarting Android LLDB debugging session...")
-    success = android_lldb_debug_session()
+    try:
+        success = android_lldb_debug_session(monitor_interval=args.monitor)
+    finally:
+        print(f"\nTrace written to {tracer.save('android_lldb_debug')}")
     if success:
         print("\n✅ Android debugging session completed successfully!")
     else:
@@ -0,0 +1,94 @@
+# Hands the terminal over to an lldb started with pexpect.
+#
+# The scripts drive lldb with expect() while setting up, then let the user
+# type commands. Instead of waiting for a prompt and reading a line, the proxy
+# copies bytes both ways as soon as they arrive, blocking in poll() with no
+# timeout. lldb sees every keystroke on its pty, so its own line editor does
+# the editing and the command history (arrow keys, persisted under ~/.lldb),
+# and long outputs such as `bt all` stream straight through.
+
+import os
+import select
+import signal
+import sys
+import termios
+import tty
+
+from android_log import StreamingLog
+
+# Ctrl-] leaves the session without going through lldb, like telnet.
+ESCAPE = b"\x1d"
+READ_SIZE = 64 * 1024
+
+
+def _write_all(fd, data):
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def proxy_lldb(child, escape=ESCAPE):
+    """Connect stdin/stdout to `child` (a pexpect.spawn of lldb) until it exits.
+
+    Typing `quit` or Ctrl-D goes to lldb like any other input and ends the
+    session when lldb exits. If stdin is not a terminal, its lines are sent
+    as they come and `quit` follows once it runs dry. Returns how the session
+    ended: "exited", "escape" or "stdin closed".
+    """
+    # Everything expect() has read so far already went through the logs.
+    for name in ("logfile", "logfile_read"):
+        log = getattr(child, name)
+        if isinstance(log, StreamingLog):
+            log.close()
+        setattr(child, name, None)
+    child.buffer = type(child.buffer)()
+
+    stdin_fd = sys.stdin.fileno()
+    stdout_fd = sys.stdout.fileno()
+    pty_fd = child.child_fd
+    sys.stdout.flush()
+
+    interactive = os.isatty(stdin_fd)
+    saved_mode = termios.tcgetattr(stdin_fd) if interactive else None
+    previous_winch = None
+    if interactive:
+        def resize(*_):
+            rows, columns = os.get_terminal_size(stdin_fd)
+            child.setwinsize(rows, columns)
+
+        resize()
+        previous_winch = signal.signal(signal.SIGWINCH, resize)
+        tty.setraw(stdin_fd)
+
+    poller = select.poll()
+    poller.register(pty_fd, select.POLLIN)
+    poller.register(stdin_fd, select.POLLIN)
+    try:
+        while True:
+            for fd, _ in poller.poll():
+                if fd == pty_fd:
+                    try:
+                        data = os.read(pty_fd, READ_SIZE)
+                    except OSError:  # EIO once lldb has closed its side
+                        data = b""
+                    if not data:
+                        return "exited"
+                    _write_all(stdout_fd, data)
+                else:
+                    data = os.read(stdin_fd, READ_SIZE)
+                    if not data:
+                        poller.unregister(stdin_fd)
+                        # Nobody is left to answer "Do you really want to proceed".
+                        _write_all(pty_fd, b"settings set interpreter.prompt-on-quit false\nquit\n")
+                        if interactive:
+                            return "stdin closed"
+                        continue
+                    if interactive and escape in data:
+                        _write_all(pty_fd, data[: data.index(escape)])
+                        return "escape"
+                    _write_all(pty_fd, data)
+    finally:
+        if interactive:
+            termios.tcsetattr(stdin_fd, termios.TCSADRAIN, saved_mode)
+            signal.signal(signal.SIGWINCH, previous_winch)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
@@ -0,0 +1,187 @@
+# Poor man's sampling profiler on top of lldb, for where `perf` is unavailable.
+#
+# lldb attaches once; after that every sample is `process interrupt`,
+# `bt all`, `process continue`. Each sample changes the prompt to a new
+# `(sN) ` so the end of its output is unambiguous even when stop reports and
+# prompt redraws interleave. The backtraces are folded into
+# `thread;outer;...;inner count` lines, the input format of flamegraph.pl,
+# inferno and speedscope, and the time the target spent stopped is reported
+# as the sampling overhead.
+
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+
+import pexpect
+
+from android_lldb_batch import DEFAULT_PLATFORM_URL, parse_backtrace
+
+STOPPED_RE = r"Process \d+ stopped"
+RESUMED_RE = r"Process \d+ resuming"
+# Rust symbol hashes and `+ offset` suffixes would split identical frames.
+OFFSET_RE = re.compile(r" \+ \d+$")
+HASH_RE = re.compile(r"::h[0-9a-f]{16}$")
+
+
+def frame_name(frame):
+    """Stable name for one frame: the function without offset or hash."""
+    if frame["function"]:
+        return HASH_RE.sub("", OFFSET_RE.sub("", frame["function"]))
+    if frame["module"]:
+        return f"{frame['module']}`{frame['address']}"
+    return frame["address"]
+
+
+def fold_threads(threads):
+    """One folded stack (root first) per thread of a single sample."""
+    stacks = []
+    for thread in threads:
+        if not thread["frames"]:
+            continue
+        names = [frame_name(frame) for frame in sorted(thread["frames"], key=lambda f: f["index"])]
+        label = thread["name"] or f"thread-{thread['index']}"
+        stacks.append(";".join([label, *reversed(names)]))
+    return stacks
+
+
+@dataclass
+class SampleProfile:
+    """Folded stack counts plus what collecting them cost the target."""
+
+    counts: dict = field(default_factory=dict)
+    samples: int = 0
+    pauses: list = field(default_factory=list)  # seconds stopped, one per sample
+    wall_time: float = 0.0
+    requested_rate: float = 0.0
+
+    def add(self, stacks, paused):
+        self.samples += 1
+        self.pauses.append(paused)
+        for stack in stacks:
+            self.counts[stack] = self.counts.get(stack, 0) + 1
+
+    def folded(self):
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.counts.items()))
+
+    def self_counts(self):
+        """Samples per innermost function across all threads."""
+        counts = {}
+        for stack, count in self.counts.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            counts[leaf] = counts.get(leaf, 0) + count
+        return counts
+
+    def overhead(self):
+        stopped = sum(self.pauses)
+        return {
+            "samples": self.samples,
+            "achieved_rate": self.samples / self.wall_time if self.wall_time else 0.0,
+            "requested_rate": self.requested_rate,
+            "mean_pause_ms": statistics.mean(self.pauses) * 1000 if self.pauses else 0.0,
+            "max_pause_ms": max(self.pauses) * 1000 if self.pauses else 0.0,
+            "stopped_fraction": stopped / self.wall_time if self.wall_time else 0.0,
+        }
+
+
+class LldbSampler:
+    """An lldb attached to one process, ready to take stack samples."""
+
+    def __init__(self, pid, platform_url=DEFAULT_PLATFORM_URL, lldb="lldb", timeout=30):
+        self.pid = pid
+        self.timeout = timeout
+        self._prompt_counter = 0
+        self.child = pexpect.spawn(lldb, ["--no-lldbinit"], timeout=timeout)
+        # pexpect sleeps 50ms before every send by default; four sends per
+        # sample would cap the rate at 5 Hz and keep the target stopped.
+        self.child.delaybeforesend = None
+        self.child.expect_exact("(lldb) ")
+        self._set_prompt()
+        self._run("settings set use-color false")
+        self._run("settings set stop-line-count-before 0")
+        self._run("settings set stop-line-count-after 0")
+        if platform_url:
+            self._run("platform select remote-android")
+            self._run(f"platform connect {platform_url}")
+        output = self._run(f"process attach --pid {pid}")
+        if "error:" in output:
+            raise RuntimeError(output.strip())
+        self.child.sendline("process continue")
+        self.child.expect(RESUMED_RE)
+
+    def _set_prompt(self):
+        # A fresh prompt per exchange. The echoed command has it in quotes,
+        # so a prompt not preceded by a quote is the real one, even when a
+        # late redraw of the previous prompt lands on the same line.
+        self._prompt_counter += 1
+        prompt = f"(s{self._prompt_counter}) "
+        command = f'settings set prompt "{prompt}"'
+        self.child.sendline(command)
+        self.child.expect('(?<!")' + re.escape(prompt))
+        return command
+
+    def _run(self, command):
+        """Run one command while the target is stopped; returns its output."""
+        self.child.sendline(command)
+        marker = self._set_prompt()
+        output = self.child.before.decode(errors="replace").replace("\r", "")
+        # The marker command was typed ahead; its echo can land anywhere.
+        return output.split(command, 1)[-1].replace(marker, "")
+
+    def sample(self):
+        """Interrupt, backtrace every thread, resume; returns (stacks, seconds stopped)."""
+        started = time.perf_counter()
+        self.child.sendline("process interrupt")
+        self.child.expect(STOPPED_RE)
+        output = self._run("bt all")
+        self.child.sendline("process continue")
+        self.child.expect(RESUMED_RE)
+        paused = time.perf_counter() - started
+
+        # A late stop report can repeat a thread; the `bt all` copy comes last.
+        threads = {}
+        for thread in parse_backtrace(output):
+            threads[thread["index"]] = thread
+        return fold_threads(threads.values()), paused
+
+    def profile(self, rate=20.0, duration=10.0):
+        """Sample at up to `rate` Hz for `duration` seconds."""
+        profile = SampleProfile(requested_rate=rate)
+        interval = 1.0 / rate
+        started = time.perf_counter()
+        deadline = started + duration
+        next_sample = started
+        while time.perf_counter() < deadline:
+            stacks, paused = self.sample()
+            profile.add(stacks, paused)
+            next_sample += interval
+            delay = next_sample - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Falling behind: don't try to catch up with a burst.
+                next_sample = time.perf_counter()
+        profile.wall_time = time.perf_counter() - started
+        return profile
+
+    def close(self):
+        try:
+            self.child.sendline("process detach")
+            self.child.sendline("quit")
+            self.child.expect(pexpect.EOF, timeout=5)
+        except (pexpect.TIMEOUT, pexpect.EOF, OSError):
+            pass
+        self.child.close()
+
+
+def print_profile(profile, limit=15):
+    """Print the hottest leaf functions and the sampling overhead."""
+    overhead = profile.overhead()
+    total = sum(profile.counts.values()) or 1
+    print(f"\nTop {limit} functions by self samples ({profile.samples} samples):")
+    for name, count in sorted(profile.self_counts().items(), key=lambda item: item[1], reverse=True)[:limit]:
+        print(f"  {count:6} {count / total * 100:5.1f}%  {name}")
+    print(f"\nSampling overhead: {overhead['achieved_rate']:.1f} Hz achieved "
+          f"({overhead['requested_rate']:.1f} Hz requested), "
+          f"pause mean {overhead['mean_pause_ms']:.1f}ms / max {overhead['max_pause_ms']:.1f}ms, "
+          f"target stopped {overhead['stopped_fraction'] * 100:.1f}% of the time")
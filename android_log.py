@@ -0,0 +1,244 @@
+# Streaming consumer for the output of child processes: the cargo build, rustc,
+# lldb driven through pexpect.
+#
+# Output is matched a block of whole lines at a time within a fixed-size
+# window, the last few KB are kept in a ring buffer for error reports, and the
+# full log goes to a per-step file through a large write buffer. Memory and
+# CPU stay flat no matter how long the child keeps printing.
+#
+# Only the lines a step's console filter matches reach the terminal, and they
+# go through `console`, which writes them in batches at most every 0.1s, so a
+# slow terminal or SSH link never sets the pace of a build. Set
+# CODEX_ANDROID_CONSOLE to `all`, `none` or a regular expression to override
+# every step's filter.
+
+import atexit
+import os
+import re
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+LOG_DIR = os.path.join("codex-rs", "target", "android-logs")
+# Longest line we try to match; anything beyond is still logged but not searched.
+MATCH_WINDOW = 4096
+READ_SIZE = 64 * 1024
+CONSOLE_ENV = "CODEX_ANDROID_CONSOLE"
+CONSOLE_INTERVAL = 0.1
+CONSOLE_BATCH = 64 * 1024
+# What the build steps show: progress, the script's own messages and errors.
+BUILD_CONSOLE = r"^(\s*(Compiling|Finished)\s|error|Error|warning: build failed|Android build|Building|.*build failed)"
+# What lldb sessions show: the commands, process state, stops and errors.
+LLDB_CONSOLE = r"^(\(lldb\) |Process \d|Breakpoint \d|\s*\* thread|\s*frame #|error:|warning:)"
+
+
+class Console:
+    """Batched writes to stdout, shared by every StreamingLog."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = bytearray()
+        self._timer = None
+
+    def write(self, data):
+        with self._lock:
+            self._pending += data
+            if len(self._pending) >= CONSOLE_BATCH:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(CONSOLE_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            # print() output that came first has to stay first.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(self._pending)
+            sys.stdout.buffer.flush()
+            self._pending.clear()
+
+
+console = Console()
+atexit.register(console.flush)
+
+
+def console_filter(default):
+    """The console filter for a step: CODEX_ANDROID_CONSOLE if set, else `default`."""
+    choice = os.environ.get(CONSOLE_ENV, "")
+    if choice == "all":
+        return True
+    if choice == "none":
+        return False
+    return choice or default
+
+
+def step_log_path(name):
+    """LOG_DIR/<name>.log, with the step name made file-friendly."""
+    return os.path.join(LOG_DIR, re.sub(r"[^A-Za-z0-9._-]+", "-", name).strip("-") + ".log")
+
+
+class StreamingLog:
+    """Line splitter with a bounded tail buffer, a buffered log file and a console filter.
+
+    `console` is True to show everything, False to show nothing, or a regular
+    expression (str or bytes) that the lines shown must match. A log can also
+    be a pexpect child's `logfile_read`.
+    """
+
+    def __init__(self, log_path=None, tail_bytes=64 * 1024, console=True):
+        self.log_path = log_path
+        self.tail_bytes = tail_bytes
+        if isinstance(console, (str, bytes)):
+            console = re.compile(console.encode() if isinstance(console, str) else console)
+        self.console = console
+        self._tail = bytearray()
+        self._partial = b""
+        self._file = None
+        self.total_bytes = 0
+        self.timed_out = False
+        self.returncode = None
+        if log_path:
+            os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+            self._file = open(log_path, "wb", buffering=1024 * 1024)
+
+    def feed(self, data):
+        """Consume a chunk of output and return the complete lines it finished.
+
+        The lines come back as one bytes block; it is never longer than one
+        read plus `MATCH_WINDOW`, which bounds the cost of searching it.
+        """
+        self.total_bytes += len(data)
+        if self._file:
+            self._file.write(data)
+        if self.console is True:
+            console.write(data)
+        self._tail += data
+        if len(self._tail) > self.tail_bytes:
+            del self._tail[: -self.tail_bytes]
+
+        pending = self._partial + data
+        cut = pending.rfind(b"\n") + 1
+        if cut == 0 and len(pending) > MATCH_WINDOW:
+            # A runaway line (progress bars, minified output): search what we have.
+            cut = len(pending)
+        self._partial = pending[cut:][-MATCH_WINDOW:]
+        return self._show(pending[:cut])
+
+    def finish(self):
+        """Return a trailing line that never got its newline."""
+        block, self._partial = self._partial, b""
+        return self._show(block)
+
+    def _show(self, block):
+        if self.console and self.console is not True:
+            shown = b"".join(line for line in block.splitlines(keepends=True)
+                             if self.console.search(line.lstrip(b"\r")))
+            if shown:
+                console.write(shown if shown.endswith(b"\n") else shown + b"\n")
+        return block
+
+    def write(self, data):
+        """File-like entry point, for pexpect's logfile_read."""
+        self.feed(data)
+
+    def flush(self):
+        # pexpect calls this after every write; the console batches instead.
+        pass
+
+    def tail(self):
+        """The most recent output, at most `tail_bytes` of it."""
+        return self._tail.decode(errors="replace").replace("\r", "")
+
+    def close(self):
+        """Close the log file and show whatever the console still holds."""
+        if self._partial:
+            self.finish()
+        if self._file:
+            self._file.close()
+            self._file = None
+        console.flush()
+
+
+def stream_command(argv, patterns, timeout, log, cwd=None, env=None, on_block=None):
+    """Run `argv`, feeding its output to `log`, until a line matches a pattern.
+
+    `patterns` are regular expressions. Returns the index of the first pattern
+    that matched, or None if the process exited or `timeout` seconds passed
+    first. The process group is terminated once this returns, like pexpect's
+    close(). `on_block`, if given, sees every block of complete lines (bytes)
+    so callers can parse the output as it streams. With no patterns it runs
+    until the process exits and leaves the exit status in `log.returncode`.
+    """
+    # One alternation searched once per block; the group that matched tells
+    # us which pattern it was, and the earliest match wins as in pexpect.
+    combined = re.compile(
+        "|".join(f"(?P<p{index}>{pattern})" for index, pattern in enumerate(patterns)).encode(),
+        re.MULTILINE,
+    ) if patterns else None
+    proc = subprocess.Popen(
+        argv,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=True,
+    )
+    fd = proc.stdout.fileno()
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                log.timed_out = True
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            data = os.read(fd, READ_SIZE)
+            block = log.feed(data) if data else log.finish()
+            if on_block:
+                on_block(block)
+            match = combined.search(block) if combined else None
+            if match:
+                return int(match.lastgroup[1:])
+            if not data:
+                try:
+                    log.returncode = proc.wait(timeout=max(0.1, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    log.timed_out = True
+                return None
+    finally:
+        # cargo and friends run as children of the script; stop all of them.
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+        proc.stdout.close()
+        log.close()
+
+
+def run_command(argv, timeout, log, cwd=None, env=None):
+    """Run `argv` to completion with its output going to `log`.
+
+    Returns the exit status, or None if it was still running after `timeout`
+    seconds and had to be stopped.
+    """
+    stream_command(argv, (), timeout, log, cwd=cwd, env=env)
+    return log.returncode
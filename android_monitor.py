@@ -0,0 +1,209 @@
+# Memory and CPU timeline of a process on the device.
+#
+# One shell stream runs a sampling loop on the device: every interval it
+# prints the process's /proc stat line, the interesting /proc status and
+# smaps_rollup fields and the uptime they were read at, then sleeps. The host
+# only reads that stream, in a background thread, and appends one CSV row per
+# sample, so monitoring adds no adb round trips and never blocks the script's
+# own shell session.
+
+import csv
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass
+
+from android_adb import AdbError, open_device_service
+
+MONITOR_DIR = os.path.join("codex-rs", "target", "android-monitor")
+CSV_FIELDS = ("time", "rss_kb", "hwm_kb", "pss_kb", "swap_kb", "threads", "cpu_percent",
+              "utime_ticks", "stime_ticks")
+
+
+def sampling_script(pid, interval):
+    """Device loop printing one `@ uptime` block per sample until the process exits."""
+    return (
+        f"pid={pid}; echo tck $(getconf CLK_TCK 2>/dev/null || echo 100); "
+        f"while [ -d /proc/$pid ]; do "
+        f"read -r up _ < /proc/uptime; echo @ $up; "
+        f"cat /proc/$pid/stat 2>/dev/null; "
+        f"grep -E '^(VmRSS|VmHWM|VmSwap|Threads):' /proc/$pid/status 2>/dev/null; "
+        f"grep -E '^(Pss|SwapPss):' /proc/$pid/smaps_rollup 2>/dev/null; "
+        f"sleep {interval}; done; echo end"
+    )
+
+
+@dataclass
+class MonitorSummary:
+    samples: int
+    duration: float
+    peak_rss_kb: int
+    peak_pss_kb: int
+    avg_cpu_percent: float
+    max_cpu_percent: float
+    threads_start: int
+    threads_end: int
+    threads_max: int
+    csv_path: str
+    exited: bool
+    error: str = ""
+
+
+class ProcessMonitor:
+    """Samples one device process in the background until stopped or it exits."""
+
+    def __init__(self, serial, pid, interval=0.5, csv_path=None):
+        self.pid = pid
+        self.interval = interval
+        if csv_path is None:
+            csv_path = os.path.join(MONITOR_DIR, f"pid{pid}-{time.strftime('%Y%m%d-%H%M%S')}.csv")
+        self.csv_path = csv_path
+        self.rows = []
+        self.exited = False
+        self.error = ""
+        self._clock_ticks = 100
+        self._stopping = False
+        self._sock = open_device_service(serial, "shell:" + sampling_script(pid, interval))
+        # The handshake timeout must not apply to the stream: samples can be far apart.
+        self._sock.settimeout(None)
+        self._thread = threading.Thread(target=self._read, name=f"monitor-{pid}", daemon=True)
+        self._thread.start()
+
+    def _read(self):
+        os.makedirs(os.path.dirname(self.csv_path) or ".", exist_ok=True)
+        with open(self.csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            buffer = b""
+            block = None
+            try:
+                while True:
+                    chunk = self._sock.recv(65536)
+                    if not chunk:
+                        # Whatever is left is the last line, without its newline.
+                        lines, buffer = [buffer], b""
+                    else:
+                        buffer += chunk
+                        *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        line = line.decode(errors="replace").strip()
+                        if line.startswith("tck "):
+                            self._clock_ticks = int(line[4:]) if line[4:].isdigit() else 100
+                        elif line.startswith("@ ") or line == "end":
+                            if block:
+                                self._add_row(writer, block)
+                                f.flush()
+                            block = {"uptime": float(line[2:])} if line.startswith("@ ") else None
+                            self.exited = line == "end"
+                        elif block is not None:
+                            self._parse_line(block, line)
+                    if not chunk:
+                        break
+            except (OSError, ValueError) as e:
+                if not self._stopping:
+                    self.error = str(e) or type(e).__name__
+                    print(f"⚠️ Monitoring PID {self.pid} stopped early: {self.error}")
+            finally:
+                # A block is only written when the next one starts; the last one
+                # is complete unless the process went away while it was printed.
+                if block:
+                    self._add_row(writer, block)
+                self._sock.close()
+
+    def _parse_line(self, block, line):
+        if line.startswith(f"{self.pid} ("):
+            # comm can hold spaces and parens; the fields after the last ')' can't.
+            fields = line.rsplit(")", 1)[1].split()
+            block["utime"], block["stime"] = int(fields[11]), int(fields[12])
+            return
+        key, _, value = line.partition(":")
+        parts = value.split()
+        if parts and parts[0].isdigit():
+            block[key] = int(parts[0])
+
+    def _add_row(self, writer, block):
+        if "utime" not in block:
+            return  # the process went away mid-sample
+        cpu = 0.0
+        if self.rows:
+            previous = self.rows[-1]
+            elapsed = block["uptime"] - previous["uptime"]
+            ticks = block["utime"] + block["stime"] - previous["utime_ticks"] - previous["stime_ticks"]
+            if elapsed > 0:
+                cpu = ticks / self._clock_ticks / elapsed * 100
+        row = {
+            "uptime": block["uptime"],
+            "time": round(block["uptime"] - (self.rows[0]["uptime"] if self.rows else block["uptime"]), 3),
+            "rss_kb": block.get("VmRSS", 0),
+            "hwm_kb": block.get("VmHWM", 0),
+            "pss_kb": block.get("Pss", 0),
+            "swap_kb": block.get("VmSwap", 0),
+            "threads": block.get("Threads", 0),
+            "cpu_percent": round(cpu, 1),
+            "utime_ticks": block["utime"],
+            "stime_ticks": block["stime"],
+        }
+        self.rows.append(row)
+        writer.writerow([row[name] for name in CSV_FIELDS])
+
+    def stop(self):
+        """End sampling and summarize what was collected."""
+        self._stopping = True
+        try:
+            # Ends the reader's recv; the reader then writes its last sample and closes.
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._thread.join(timeout=5)
+        return self.summary()
+
+    def summary(self):
+        rows = list(self.rows)
+        if not rows:
+            return MonitorSummary(0, 0.0, 0, 0, 0.0, 0.0, 0, 0, 0, self.csv_path, self.exited, self.error)
+        duration = rows[-1]["uptime"] - rows[0]["uptime"]
+        ticks = (rows[-1]["utime_ticks"] + rows[-1]["stime_ticks"]
+                 - rows[0]["utime_ticks"] - rows[0]["stime_ticks"])
+        return MonitorSummary(
+            samples=len(rows),
+            duration=duration,
+            peak_rss_kb=max(max(row["rss_kb"], row["hwm_kb"]) for row in rows),
+            peak_pss_kb=max(row["pss_kb"] for row in rows),
+            avg_cpu_percent=ticks / self._clock_ticks / duration * 100 if duration > 0 else 0.0,
+            max_cpu_percent=max(row["cpu_percent"] for row in rows),
+            threads_start=rows[0]["threads"],
+            threads_end=rows[-1]["threads"],
+            threads_max=max(row["threads"] for row in rows),
+            csv_path=self.csv_path,
+            exited=self.exited,
+            error=self.error,
+        )
+
+
+def start_monitor(serial, pid, interval):
+    """Start a ProcessMonitor, or print why not and return None."""
+    try:
+        monitor = ProcessMonitor(serial, pid, interval)
+    except (OSError, AdbError) as e:
+        print(f"⚠️ Could not start monitoring PID {pid}: {e}")
+        return None
+    print(f"📈 Monitoring PID {pid} every {interval:g}s -> {monitor.csv_path}")
+    return monitor
+
+
+def print_monitor_summary(summary):
+    if not summary.samples:
+        print("📈 No monitoring samples collected" + (f" ({summary.error})" if summary.error else ""))
+        return
+    growth = summary.threads_end - summary.threads_start
+    print(f"\n📈 PID samples: {summary.samples} over {summary.duration:.1f}s"
+          f"{' (process exited)' if summary.exited else ''}")
+    print(f"   Peak RSS {summary.peak_rss_kb / 1024:.1f} MB"
+          + (f", peak PSS {summary.peak_pss_kb / 1024:.1f} MB" if summary.peak_pss_kb else ""))
+    print(f"   CPU average {summary.avg_cpu_percent:.1f}%, max {summary.max_cpu_percent:.1f}%")
+    print(f"   Threads {summary.threads_start} -> {summary.threads_end} ({growth:+d}), "
+          f"max {summary.threads_max}")
+    if summary.error:
+        print(f"   ⚠️ Sampling stopped early: {summary.error}")
+    print(f"   Timeline: {summary.csv_path}")
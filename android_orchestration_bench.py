@@ -0,0 +1,269 @@
+# uv run android_orchestration_bench.py --runs 5 --link local,usb2
+# /// script
+# dependencies = [
+#   "pexpect",
+# ]
+# ///
+#
+# Orchestration overhead of android_codex_deploy_debug() and
+# simple_android_build_test(), measured against android_fake_adb.py.
+#
+# The builds and lldb are replaced by stand-ins that finish at once and the
+# binaries are small shell scripts, so what is left is the scripts' own cost:
+# adb round trips, processes spawned per step, polling and fixed sleeps, plus
+# whatever the chosen link profile adds. Every run reports its wall time and
+# critical path, the requests and bytes the fake device saw, and the processes
+# started on the device and on the host. The first --warmup runs of each
+# scenario fill the device (later deploys are delta pushes) and are not counted.
+#
+# Each scenario runs in its own scratch directory, so nothing lands in
+# codex-rs/target.
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import android_deploy_debug
+import android_deploy_simple
+import android_pipeline
+from android_fake_adb import FakeAdbServer, FakeDevice, Link, parse_size, parse_failure
+
+LINKS = {
+    "local": {},
+    "usb2": {"latency": 0.001, "bandwidth": 35 * 1024 ** 2},
+    "usb3": {"latency": 0.0005, "bandwidth": 300 * 1024 ** 2},
+    "wifi": {"latency": 0.005, "bandwidth": 4 * 1024 ** 2},
+}
+SCENARIOS = ("deploy", "deploy-full", "simple")
+# `--version` answers the smoke test, anything else keeps running like codex does.
+STAND_IN_CODEX = """#!/bin/sh
+case "$1" in
+  --version) echo "codex-cli 0.0.0-bench" ;;
+  *) while :; do sleep 0.2; done ;;
+esac
+exit 0
+"""
+STAND_IN_TEST = """#!/bin/sh
+echo "Hello Android from Rust!"
+exit 0
+"""
+HOST_SPAWN_EVENTS = {"subprocess.Popen", "os.fork", "os.forkpty", "os.posix_spawn", "os.spawn", "os.system"}
+
+
+class HostSpawns:
+    """Counts processes this interpreter starts, via an audit hook."""
+
+    def __init__(self):
+        self.count = 0
+        sys.addaudithook(self._hook)
+
+    def _hook(self, event, args):
+        if event in HOST_SPAWN_EVENTS:
+            self.count += 1
+
+
+def write_stand_in(path, script, size):
+    """`script` padded to `size` bytes; the padding is never read."""
+    padding = max(0, size - len(script))
+    with open(path, "wb") as f:
+        f.write(script.encode())
+        f.write(os.urandom(padding))
+    os.chmod(path, 0o755)
+
+
+@contextlib.contextmanager
+def patched(target, **values):
+    saved = {name: getattr(target, name) for name in values}
+    for name, value in values.items():
+        setattr(target, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(target, name, value)
+
+
+@contextlib.contextmanager
+def captured_results():
+    """Collects the PipelineResult of every Pipeline.run() in the block."""
+    results = []
+    real_run = android_pipeline.Pipeline.run
+
+    def run(self, ctx=None, verbose=True):
+        result = real_run(self, ctx, verbose)
+        results.append(result)
+        return result
+
+    with patched(android_pipeline.Pipeline, run=run):
+        yield results
+
+
+def stand_ins(scenario, workdir, binary_size):
+    """Replacements for the build and lldb steps of `scenario`."""
+    if scenario == "simple":
+        def build_test_binary(ctx):
+            with open("test_android_main.rs", "w") as f:
+                f.write(android_deploy_simple.TEST_MAIN)
+            write_stand_in("test_android", STAND_IN_TEST, binary_size)
+
+        return patched(android_deploy_simple, build_library=lambda ctx: None,
+                       build_test_binary=build_test_binary)
+
+    binary = os.path.join(workdir, "codex")
+    write_stand_in(binary, STAND_IN_CODEX, binary_size)
+    return patched(android_deploy_debug, CODEX_HOST_BINARY=binary, build_android=lambda ctx=None: True,
+                   start_lldb=lambda ctx: None, attach_lldb=lambda ctx: None,
+                   interactive_lldb=lambda ctx: None)
+
+
+def run_scenario(scenario, link, runs, warmup, binary_size, compress, spawns, verbose):
+    """[run dict] for `runs` measured runs of one scenario over one link."""
+    workdir = tempfile.mkdtemp(prefix=f"orchestration-{scenario}-")
+    device = FakeDevice(os.path.join(workdir, "device"), link=link)
+    server = FakeAdbServer(device)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    previous_port = os.environ.get("ANDROID_ADB_SERVER_PORT")
+    os.environ["ANDROID_ADB_SERVER_PORT"] = str(server.port)
+    home = os.getcwd()
+    os.chdir(workdir)
+    measured = []
+    try:
+        with stand_ins(scenario, workdir, binary_size), captured_results() as results:
+            for index in range(warmup + runs):
+                device.stats.clear()
+                host_before = spawns.count
+                started = time.perf_counter()
+                with contextlib.ExitStack() as output:
+                    if not verbose:
+                        output.enter_context(contextlib.redirect_stdout(output.enter_context(open(os.devnull, "w"))))
+                    if scenario == "simple":
+                        ok = android_deploy_simple.simple_android_build_test(compress=compress)
+                    else:
+                        ok = android_deploy_debug.android_codex_deploy_debug(
+                            full_push=scenario == "deploy-full", debug_args="serve",
+                            use_build_cache=False, compress=compress)
+                wall_time = time.perf_counter() - started
+                if index < warmup:
+                    continue
+                result = results[-1]
+                stats = dict(device.stats)
+                measured.append({
+                    "ok": ok,
+                    "wall_time": wall_time,
+                    "critical_path": sum(record.duration or 0 for record in result.critical_path()),
+                    "steps": {name: record.duration for name, record in result.records.items()},
+                    "requests": stats.get("requests", 0),
+                    "failed_requests": stats.get("failed", 0),
+                    "bytes": stats.get("bytes_in", 0) + stats.get("bytes_out", 0),
+                    "device_processes": stats.get("processes", 0),
+                    # The fake device's own processes are started from this interpreter too.
+                    "host_processes": spawns.count - host_before - stats.get("processes", 0),
+                })
+    finally:
+        os.chdir(home)
+        server.shutdown()
+        server.server_close()
+        device.kill_processes()
+        if previous_port is None:
+            os.environ.pop("ANDROID_ADB_SERVER_PORT", None)
+        else:
+            os.environ["ANDROID_ADB_SERVER_PORT"] = previous_port
+    return measured
+
+
+def summarize_runs(runs):
+    def median(key):
+        return statistics.median(run[key] for run in runs)
+
+    steps = {}
+    for run in runs:
+        for name, duration in run["steps"].items():
+            if duration is not None:
+                steps.setdefault(name, []).append(duration)
+    return {
+        "runs": len(runs),
+        "ok": sum(run["ok"] for run in runs),
+        "wall_time": median("wall_time"),
+        "wall_time_min": min(run["wall_time"] for run in runs),
+        "critical_path": median("critical_path"),
+        "requests": median("requests"),
+        "failed_requests": median("failed_requests"),
+        "bytes": median("bytes"),
+        "device_processes": median("device_processes"),
+        "host_processes": median("host_processes"),
+        "steps": {name: statistics.median(durations) for name, durations in steps.items()},
+    }
+
+
+def print_summaries(summaries, top=6):
+    print(f"\n{'scenario':<12} {'link':<8} {'ok':>5} {'wall':>7} {'min':>7} {'crit':>7} "
+          f"{'reqs':>5} {'failed':>6} {'KB':>8} {'dev ps':>6} {'host ps':>7}")
+    for (scenario, link), summary in summaries.items():
+        print(f"{scenario:<12} {link:<8} {summary['ok']:>2}/{summary['runs']:<2} "
+              f"{summary['wall_time']:>7.3f} {summary['wall_time_min']:>7.3f} {summary['critical_path']:>7.3f} "
+              f"{summary['requests']:>5g} {summary['failed_requests']:>6g} {summary['bytes'] / 1024:>8.1f} "
+              f"{summary['device_processes']:>6g} {summary['host_processes']:>7g}")
+    print("\nSlowest steps (median seconds):")
+    for (scenario, link), summary in summaries.items():
+        slowest = sorted(summary["steps"].items(), key=lambda item: item[1], reverse=True)[:top]
+        print(f"  {scenario}/{link}: " + ", ".join(f"{name} {duration:.3f}" for name, duration in slowest))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the Android scripts' orchestration overhead "
+                                                 "against the fake adb server.")
+    parser.add_argument("--scenario", default=",".join(SCENARIOS),
+                        help=f"comma-separated subset of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--link", default="local,usb2",
+                        help=f"comma-separated link profiles from {', '.join(LINKS)} (default: local,usb2)")
+    parser.add_argument("--latency", type=float, help="override the profiles' latency, in milliseconds")
+    parser.add_argument("--bandwidth", type=parse_size, help="override the profiles' bandwidth, e.g. 30M")
+    parser.add_argument("--fail", type=parse_failure, action="append", default=[], metavar="PREFIX=RATE",
+                        help="fail this share of the requests whose service starts with PREFIX")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the injected failures")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--binary-size", type=parse_size, default=8 * 1024 ** 2,
+                        help="size of the stand-in binaries, e.g. 8M (default: 8M)")
+    parser.add_argument("--compress", help="pass --compress through to the scripts")
+    parser.add_argument("--json", help="also write every run to this file")
+    parser.add_argument("--verbose", action="store_true", help="show the scripts' own output")
+    args = parser.parse_args()
+
+    scenarios = [name for name in args.scenario.split(",") if name]
+    links = [name for name in args.link.split(",") if name]
+    for name in scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}")
+    for name in links:
+        if name not in LINKS:
+            parser.error(f"unknown link profile {name!r}")
+
+    spawns = HostSpawns()
+    summaries = {}
+    all_runs = {}
+    for link_name in links:
+        settings = dict(LINKS[link_name])
+        if args.latency is not None:
+            settings["latency"] = args.latency / 1000
+        if args.bandwidth is not None:
+            settings["bandwidth"] = args.bandwidth
+        for scenario in scenarios:
+            link = Link(failures=dict(args.fail), seed=args.seed, **settings)
+            print(f"⏱️ {scenario} over {link_name}: {args.warmup} warmup + {args.runs} runs...")
+            runs = run_scenario(scenario, link, args.runs, args.warmup, int(args.binary_size),
+                                args.compress, spawns, args.verbose)
+            all_runs[f"{scenario}/{link_name}"] = runs
+            summaries[(scenario, link_name)] = summarize_runs(runs)
+
+    print_summaries(summaries)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(all_runs, f, indent=1)
+        print(f"\nRuns written to {args.json}")
@@ -0,0 +1,265 @@
+# Dependency-driven step runner shared by the Android scripts.
+#
+# A script describes its work as Steps that name the steps they depend on.
+# Every step starts as soon as its dependencies are done, each on its own
+# thread, so device detection, port forwards and lldb startup run while cargo
+# is still building instead of after it. The run takes as long as its critical
+# path, the longest chain of steps that had to wait for each other, which the
+# summary prints next to the wall time.
+#
+#     steps = [
+#         Step('build', build, skip_if=build_is_cached),
+#         Step('devices', detect_devices, retries=2),
+#         Step('push', push, deps=('build', 'devices'), timeout=300),
+#         Step('cleanup', cleanup, after=('push',)),
+#     ]
+#     result = Pipeline(steps).run(ctx)
+#
+# Steps get the shared `ctx` dict and their return value is stored in it
+# under the step's name. A step fails by raising (StepFailed for a plain
+# message) or by returning False; steps that list it in `deps` are then
+# blocked, while steps that only list it in `after` (cleanup, or anything
+# that merely must not overlap with it) still run.
+
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from android_trace import tracer
+
+SETTLED = ("done", "cached", "failed", "timeout", "blocked")
+SUCCEEDED = ("done", "cached")
+
+
+class StepFailed(Exception):
+    """Raised by a step to fail with a message instead of a traceback."""
+
+
+@dataclass
+class Step:
+    name: str
+    run: Callable[[dict], Any]
+    deps: tuple = ()
+    after: tuple = ()  # run after these settle, whether or not they succeeded
+    retries: int = 0
+    retry_delay: float = 1.0
+    timeout: float | None = None  # seconds for all attempts together
+    skip_if: Callable[[dict], Any] | None = None  # truthy: cache hit, don't run
+    required: bool = True  # False: a failure is reported but the run still succeeds
+    main_thread: bool = False  # needs the main thread (signal handlers, the terminal)
+
+
+@dataclass
+class StepRecord:
+    name: str
+    status: str = "pending"
+    start: float | None = None  # seconds since the run started
+    end: float | None = None
+    attempts: int = 0
+    error: str = ""
+    waited_on: str | None = None  # the dependency that finished last
+
+    @property
+    def duration(self):
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+
+@dataclass
+class PipelineResult:
+    records: dict = field(default_factory=dict)
+    wall_time: float = 0.0
+    required: dict = field(default_factory=dict)
+
+    @property
+    def ok(self):
+        """No required step failed or timed out (blocked steps count against their cause)."""
+        return not any(record.status in ("failed", "timeout") and self.required[name]
+                       for name, record in self.records.items())
+
+    def critical_path(self):
+        """[record] from the first step to the one that finished last."""
+        finished = [record for record in self.records.values() if record.end is not None]
+        if not finished:
+            return []
+        path = [max(finished, key=lambda record: record.end)]
+        while path[-1].waited_on:
+            path.append(self.records[path[-1].waited_on])
+        return path[::-1]
+
+
+class Pipeline:
+    """Runs steps in dependency order, independent ones at the same time."""
+
+    def __init__(self, steps):
+        self.steps = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"duplicate step {step.name!r}")
+            self.steps[step.name] = step
+        for step in steps:
+            for dep in (*step.deps, *step.after):
+                if dep not in self.steps:
+                    raise ValueError(f"step {step.name!r} depends on unknown step {dep!r}")
+        self._check_cycles()
+
+    def _check_cycles(self):
+        state = {}
+
+        def visit(name, chain):
+            if state.get(name) == "visiting":
+                raise ValueError(f"dependency cycle: {' -> '.join([*chain, name])}")
+            if state.get(name) is None:
+                state[name] = "visiting"
+                for dep in (*self.steps[name].deps, *self.steps[name].after):
+                    visit(dep, [*chain, name])
+                state[name] = "visited"
+
+        for name in self.steps:
+            visit(name, [])
+
+    def run(self, ctx=None, verbose=True):
+        """Run every step; returns a PipelineResult once all of them settled.
+
+        Main-thread steps run inline when they become ready, so their timeout
+        is not enforced; they should be the last steps before cleanup.
+        """
+        ctx = {} if ctx is None else ctx
+        started = time.perf_counter()
+        records = {name: StepRecord(name) for name in self.steps}
+        finished = queue.Queue()
+        deadlines = {}
+
+        def settle(name, status, error=""):
+            record = records[name]
+            record.status = status
+            record.error = error
+            if record.start is None:
+                record.start = time.perf_counter() - started
+            record.end = time.perf_counter() - started
+
+        def attempt(step, record):
+            span = tracer.begin(f"step {step.name}")
+            try:
+                try:
+                    reason = step.skip_if(ctx) if step.skip_if is not None else None
+                except Exception as e:
+                    reason = None
+                    print(f"⚠️ {step.name} cache check failed ({e}), running it")
+                if reason:
+                    span.end(status="cached", reason=str(reason))
+                    return "cached", ""
+                while True:
+                    record.attempts += 1
+                    try:
+                        value = step.run(ctx)
+                        if value is False:
+                            raise StepFailed(f"{step.name} failed")
+                        ctx[step.name] = value
+                        span.end(status="done", attempts=record.attempts)
+                        return "done", ""
+                    except Exception as e:
+                        error = str(e) if isinstance(e, StepFailed) else traceback.format_exc(limit=3).strip()
+                        if record.attempts > step.retries:
+                            span.end(status="failed", attempts=record.attempts, error=str(e))
+                            return "failed", error
+                        print(f"↻ {step.name} failed ({e}), retrying "
+                              f"({record.attempts}/{step.retries})...")
+                        time.sleep(step.retry_delay)
+            finally:
+                span.end()
+
+        def worker(step, record):
+            status, error = attempt(step, record)
+            finished.put((step.name, status, error))
+
+        def start(step):
+            record = records[step.name]
+            record.status = "running"
+            record.start = time.perf_counter() - started
+            deps = [records[dep] for dep in (*step.deps, *step.after)]
+            if deps:
+                record.waited_on = max(deps, key=lambda dep: dep.end).name
+            if step.main_thread:
+                # Runs here, while the threads already started keep going.
+                status, error = attempt(step, record)
+                finished.put((step.name, status, error))
+                return
+            if step.timeout is not None:
+                deadlines[step.name] = time.perf_counter() + step.timeout
+            threading.Thread(target=worker, args=(step, record), name=step.name, daemon=True).start()
+
+        while True:
+            progressed = False
+            for name, step in self.steps.items():
+                record = records[name]
+                if record.status != "pending":
+                    continue
+                if not all(records[dep].status in SETTLED for dep in (*step.deps, *step.after)):
+                    continue
+                failed = [dep for dep in step.deps if records[dep].status not in SUCCEEDED]
+                if failed:
+                    settle(name, "blocked", f"needs {', '.join(failed)}")
+                    record.waited_on = failed[0]
+                    progressed = True
+                    continue
+                start(step)
+                progressed = True
+            if progressed:
+                continue
+
+            running = [name for name, record in records.items() if record.status == "running"]
+            if not running:
+                break
+            # Wake up for the next result or the nearest timeout, whichever is first.
+            wait = None
+            if deadlines:
+                wait = max(0.0, min(deadlines.values()) - time.perf_counter())
+            try:
+                name, status, error = finished.get(timeout=wait)
+            except queue.Empty:
+                now = time.perf_counter()
+                for name in [name for name, deadline in deadlines.items() if deadline <= now]:
+                    del deadlines[name]
+                    # The thread can't be killed; its result is ignored from here on.
+                    settle(name, "timeout", f"still running after {self.steps[name].timeout:g}s")
+                    if verbose:
+                        print(f"⏱️ {name} timed out after {self.steps[name].timeout:g}s")
+                continue
+            deadlines.pop(name, None)
+            if records[name].status == "running":
+                settle(name, status, error)
+                if verbose and status == "failed":
+                    print(f"❌ {name} failed: {error.splitlines()[-1] if error else ''}")
+
+        result = PipelineResult(records, time.perf_counter() - started,
+                                {name: step.required for name, step in self.steps.items()})
+        if verbose:
+            print_pipeline_result(result)
+        return result
+
+
+def print_pipeline_result(result):
+    """One row per step, then the critical path against the wall time."""
+    marks = {"done": "✅", "cached": "💾", "failed": "❌", "timeout": "⏱️", "blocked": "⏭️"}
+
+    def seconds(value):
+        return "-" if value is None else f"{value:.2f}"
+
+    print(f"\n{'':2} {'step':<24} {'status':<8} {'start':>7} {'time':>7}  detail")
+    for record in sorted(result.records.values(), key=lambda r: (r.start is None, r.start or 0)):
+        detail = record.error.splitlines()[-1] if record.error else ""
+        if record.attempts > 1:
+            detail = f"{record.attempts} attempts" + (f", {detail}" if detail else "")
+        print(f"{marks.get(record.status, '  ')} {record.name:<24} {record.status:<8} "
+              f"{seconds(record.start):>7} {seconds(record.duration):>7}  {detail}")
+    path = result.critical_path()
+    busy = sum(record.duration or 0 for record in result.records.values())
+    print(f"\nWall time {result.wall_time:.2f}s, sum of steps {busy:.2f}s")
+    if path:
+        print(f"Critical path: {' → '.join(record.name for record in path)} "
+              f"({sum(record.duration or 0 for record in path):.2f}s)")
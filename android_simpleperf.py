@@ -0,0 +1,184 @@
+# simpleperf profiling of the deployed codex binary.
+#
+# The device records with `simpleperf record -g`, the host pulls perf.data
+# back and turns it into samples with `simpleperf report-sample
+# --show-callchain`. That runs on the host when the NDK's simpleperf is
+# available, with --symfs pointing at the unstripped release binary so frames
+# get their full symbols; otherwise it runs on the device against the pushed
+# copy. The samples become a top-N hot function table and folded stacks.
+
+import os
+import platform
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from android_build_cache import RELEASE_DIR
+
+PROFILE_DIR = os.path.join("codex-rs", "target", "android-profiles")
+DEVICE_PERF_DATA = "/data/local/tmp/perf.data"
+
+
+def host_simpleperf():
+    """Path of the NDK's host simpleperf, or None."""
+    ndk_home = os.environ.get("ANDROID_NDK_HOME", "")
+    system = {"darwin": "darwin", "win32": "windows"}.get(sys.platform, "linux")
+    machine = {"amd64": "x86_64", "aarch64": "arm64"}.get(platform.machine().lower(), platform.machine().lower())
+    # The NDK ships x86_64 host binaries; Apple Silicon runs them under Rosetta.
+    for arch in dict.fromkeys([machine, "x86_64"]):
+        candidate = os.path.join(ndk_home, "simpleperf", "bin", system, arch, "simpleperf")
+        if ndk_home and os.access(candidate, os.X_OK):
+            return candidate
+    return shutil.which("simpleperf")
+
+
+def record_command(binary, args, duration=None, output=DEVICE_PERF_DATA):
+    """The device-side `simpleperf record -g` command line."""
+    command = ["simpleperf", "record", "-g", "-o", output]
+    if duration:
+        command += ["--duration", str(duration)]
+    return " ".join(shlex.quote(part) for part in command) + f" {shlex.quote(binary)} {args}"
+
+
+def parse_report_sample(text):
+    """Samples from `report-sample --show-callchain` text output.
+
+    Each sample is {"thread", "count", "frames"} with frames leaf first; a
+    frame is {"vaddr", "file", "symbol"}.
+    """
+    samples = []
+    sample = frame = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line == "sample:":
+            sample = {"thread": "", "count": 1, "frames": []}
+            samples.append(sample)
+            frame = None
+            continue
+        if sample is None:
+            continue
+        key, _, value = line.partition(":")
+        value = value.strip()
+        if key == "vaddr_in_file":
+            frame = {"vaddr": value, "file": "", "symbol": ""}
+            sample["frames"].append(frame)
+        elif key in ("file", "symbol") and frame is not None:
+            frame[key] = value
+        elif key == "event_count" and value.isdigit():
+            sample["count"] = int(value)
+        elif key == "thread_name":
+            sample["thread"] = value
+    for sample in samples:
+        frames = sample["frames"]
+        # Some versions repeat the sampled frame as the first callchain entry.
+        if len(frames) > 1 and frames[0] == frames[1]:
+            del frames[1]
+    return samples
+
+
+def frame_label(frame):
+    if frame["symbol"] and not frame["symbol"].startswith("unknown"):
+        return frame["symbol"]
+    return f"{os.path.basename(frame['file']) or '?'}+{frame['vaddr']}"
+
+
+def folded_stacks(samples):
+    """{`thread;root;...;leaf`: event count}, ready for flamegraph.pl or speedscope.
+
+    Samples are weighted by their event_count, since the sample period varies.
+    """
+    counts = {}
+    for sample in samples:
+        if not sample["frames"]:
+            continue
+        stack = ";".join([sample["thread"] or "?", *(frame_label(f) for f in reversed(sample["frames"]))])
+        counts[stack] = counts.get(stack, 0) + sample["count"]
+    return counts
+
+
+def hot_functions(samples, limit=20):
+    """[(function, self events, total events)] sorted by self events."""
+    self_counts = {}
+    total_counts = {}
+    for sample in samples:
+        if not sample["frames"]:
+            continue
+        leaf = frame_label(sample["frames"][0])
+        self_counts[leaf] = self_counts.get(leaf, 0) + sample["count"]
+        # Recursion must not count a function twice in one sample.
+        for name in {frame_label(frame) for frame in sample["frames"]}:
+            total_counts[name] = total_counts.get(name, 0) + sample["count"]
+    ranked = sorted(total_counts, key=lambda name: (self_counts.get(name, 0), total_counts[name]), reverse=True)
+    return [(name, self_counts.get(name, 0), total_counts[name]) for name in ranked[:limit]]
+
+
+def report_sample_on_host(perf_data, device_binary, release_dir=RELEASE_DIR):
+    """Run host simpleperf report-sample, symbolizing against the release build.
+
+    Returns the text output, or None if there is no host simpleperf.
+    """
+    simpleperf = host_simpleperf()
+    if not simpleperf:
+        return None
+    with tempfile.TemporaryDirectory() as symfs:
+        # --symfs looks binaries up by their device path under this root.
+        target = os.path.join(symfs, device_binary.lstrip("/"))
+        os.makedirs(os.path.dirname(target))
+        os.symlink(os.path.abspath(os.path.join(release_dir, os.path.basename(device_binary))), target)
+        proc = subprocess.run(
+            [simpleperf, "report-sample", "--show-callchain", "-i", perf_data, "--symfs", symfs],
+            capture_output=True,
+            text=True,
+            timeout=600,
+        )
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def profile_on_device(device, device_binary, args, duration=None, timeout=600, output_dir=PROFILE_DIR):
+    """Record `device_binary args` under simpleperf and bring the results home.
+
+    Returns (samples, paths) where paths has the pulled perf.data and the
+    folded stacks written next to it. Raises RuntimeError when recording
+    fails (no simpleperf, or perf_event access denied).
+    """
+    status, output = device.shell(
+        f"cd /data/local/tmp && {record_command(device_binary, args, duration)}", timeout=timeout
+    )
+    if status != 0 and "Samples recorded" not in output:
+        raise RuntimeError(f"simpleperf record failed: {output.strip()[-500:]}")
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    os.makedirs(output_dir, exist_ok=True)
+    perf_data = os.path.join(output_dir, f"perf-{stamp}.data")
+    device.pull(DEVICE_PERF_DATA, perf_data, timeout=timeout)
+
+    text = report_sample_on_host(perf_data, device_binary)
+    symbolized_on = "host"
+    if text is None:
+        symbolized_on = "device"
+        status, text = device.shell(
+            f"simpleperf report-sample --show-callchain -i {DEVICE_PERF_DATA}", timeout=timeout
+        )
+        if status != 0:
+            raise RuntimeError(f"simpleperf report-sample failed: {text.strip()[-500:]}")
+    device.shell(f"rm -f {DEVICE_PERF_DATA}")
+
+    samples = parse_report_sample(text)
+    folded_path = os.path.join(output_dir, f"perf-{stamp}.folded")
+    with open(folded_path, "w") as f:
+        for stack, count in sorted(folded_stacks(samples).items()):
+            f.write(f"{stack} {count}\n")
+    return samples, {"perf_data": perf_data, "folded": folded_path, "symbolized_on": symbolized_on}
+
+
+def print_hot_functions(samples, limit=20):
+    total = sum(sample["count"] for sample in samples) or 1
+    print(f"\nTop {limit} functions ({len(samples)} samples):")
+    print(f"  {'self':>6} {'total':>6}  function")
+    for name, self_count, total_count in hot_functions(samples, limit):
+        print(f"  {self_count / total * 100:5.1f}% {total_count / total * 100:5.1f}%  {name}")
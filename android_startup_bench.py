@@ -0,0 +1,183 @@
+# Startup latency of the codex binary, measured on the device.
+#
+# Each command runs back to back inside one shell script on the device, with
+# `date +%s%N` taken around every run, so adb round trips never land inside a
+# measurement. The cost of the two `date` calls themselves is measured the
+# same way around a no-op and subtracted. Results are kept per device model
+# and git commit next to the build timings, and one commit per model can be
+# pinned as the baseline that later runs on that model are compared against.
+
+import json
+import math
+import os
+import shlex
+import statistics
+import time
+
+from android_build_cache import DEFAULT_CACHE_DIR
+from android_build_timings import git_commit
+
+RESULTS_PATH = os.path.join(DEFAULT_CACHE_DIR, "startup-bench.json")
+RESULTS_LIMIT = 100
+DEFAULT_SUBCOMMAND = "completion bash"
+# A median this much slower than the baseline's counts as a regression.
+REGRESSION_THRESHOLD = 0.10
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    """min/median/p95/max in milliseconds."""
+    return {
+        "runs": len(samples),
+        "min": round(min(samples), 3),
+        "median": round(statistics.median(samples), 3),
+        "p95": round(percentile(samples, 0.95), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def timing_script(tag, command, runs, warmup):
+    """Shell loop that prints `tag start_ns end_ns` for every measured run.
+
+    mksh arithmetic is 32-bit, so the subtraction happens on the host.
+    """
+    return (
+        f"i=0; while [ $i -lt {warmup} ]; do {command} >/dev/null 2>&1; i=$((i+1)); done\n"
+        f"i=0; while [ $i -lt {runs} ]; do "
+        f"s=$(date +%s%N); {command} >/dev/null 2>&1; e=$(date +%s%N); "
+        f"echo {tag} $s $e; i=$((i+1)); done"
+    )
+
+
+def parse_timings(output, tag):
+    """Durations in milliseconds from the `tag` lines of `timing_script` output."""
+    samples = []
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == tag and parts[1].isdigit() and parts[2].isdigit():
+            samples.append((int(parts[2]) - int(parts[1])) / 1e6)
+    return samples
+
+
+def run_startup_bench(device, binary, subcommand=DEFAULT_SUBCOMMAND, runs=20, warmup=3):
+    """Time `binary --version`, `--help` and `subcommand` on the device.
+
+    Returns {"overhead_ms": ..., "commands": {label: summary}} with times in
+    milliseconds and the timer overhead already subtracted. Raises RuntimeError if the device's `date` has no
+    nanosecond support.
+    """
+    _, output = device.shell("date +%s%N", timeout=10)
+    if not output.strip().isdigit():
+        raise RuntimeError(f"device date has no %N support: {output.strip()!r}")
+
+    # `:` is a builtin, so this is just the two `date` calls.
+    _, output = device.shell(timing_script("overhead", ":", runs, warmup), timeout=60)
+    overhead = statistics.median(parse_timings(output, "overhead") or [0.0])
+
+    quoted = shlex.quote(binary)
+    commands = {
+        "--version": f"{quoted} --version",
+        "--help": f"{quoted} --help",
+    }
+    if subcommand:
+        commands[subcommand] = f"{quoted} {subcommand}"
+
+    results = {}
+    for index, (label, command) in enumerate(commands.items()):
+        # Labels can contain spaces; the output lines carry a plain tag instead.
+        tag = f"cmd{index}"
+        # Generous timeout: low-end phones are the reason this exists.
+        _, output = device.shell(timing_script(tag, command, runs, warmup), timeout=60 + runs * 10)
+        samples = [max(sample - overhead, 0.0) for sample in parse_timings(output, tag)]
+        if samples:
+            results[label] = summarize(samples)
+    return {"overhead_ms": round(overhead, 3), "commands": results}
+
+
+def load_results(path=RESULTS_PATH):
+    """{"devices": {model: {"baseline": commit, "commits": {commit: entry}}}}"""
+    try:
+        with open(path) as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return {"devices": {}}
+    if "commits" in results:
+        # One baseline for every phone, as first written: split it up by device.
+        devices = {}
+        for commit, entry in results["commits"].items():
+            history = devices.setdefault(entry.get("device", ""), {"baseline": None, "commits": {}})
+            history["commits"][commit] = entry
+        baseline = results.get("baseline")
+        for history in devices.values():
+            history["baseline"] = baseline if baseline in history["commits"] else list(history["commits"])[0]
+        results = {"devices": devices}
+    return results
+
+
+def save_results(results, path=RESULTS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(results, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def record_startup_bench(bench, device_name="", set_baseline=False, path=RESULTS_PATH):
+    """Store `bench` under the device and current git commit.
+
+    Baselines are per device model, since a slower phone is not a
+    regression. Returns this device's baseline entry, if any.
+    """
+    results = load_results(path)
+    history = results["devices"].setdefault(device_name, {"baseline": None, "commits": {}})
+    commit = git_commit() or "unknown"
+    baseline_commit = history["baseline"]
+    baseline = history["commits"].get(baseline_commit)
+
+    history["commits"].pop(commit, None)
+    history["commits"][commit] = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "device": device_name,
+        **bench,
+    }
+    # Oldest commits go first; keep the baseline whatever its age.
+    for old in list(history["commits"])[:-RESULTS_LIMIT]:
+        if old != history["baseline"]:
+            del history["commits"][old]
+    if set_baseline or baseline_commit not in history["commits"]:
+        history["baseline"] = commit
+    save_results(results, path)
+    return baseline
+
+
+def regressions(bench, baseline, threshold=REGRESSION_THRESHOLD):
+    """Commands whose median got more than `threshold` slower than the baseline's."""
+    if not baseline:
+        return []
+    slower = []
+    for label, summary in bench["commands"].items():
+        before = baseline["commands"].get(label)
+        if before and summary["median"] > before["median"] * (1 + threshold):
+            slower.append((label, before["median"], summary["median"]))
+    return slower
+
+
+def print_startup_bench(bench, baseline=None):
+    """Print the latency table, with the baseline median and change if there is one."""
+    print(f"\n  {'command':<18} {'runs':>4} {'min':>8} {'median':>8} {'p95':>8} {'max':>8}  baseline")
+    for label, summary in bench["commands"].items():
+        before = (baseline or {}).get("commands", {}).get(label)
+        change = ""
+        if before:
+            change = f"{before['median']:.1f} ({(summary['median'] / before['median'] - 1) * 100:+.0f}%)"
+        print(f"  {label:<18} {summary['runs']:>4} {summary['min']:8.1f} {summary['median']:8.1f} "
+              f"{summary['p95']:8.1f} {summary['max']:8.1f}  {change}")
+    print(f"  (ms, on-device timer overhead of {bench['overhead_ms']:.2f}ms subtracted)")
+    for label, before, after in regressions(bench, baseline):
+        print(f"⚠️ Startup regression: {label} median {before:.1f}ms -> {after:.1f}ms")
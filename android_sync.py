@@ -0,0 +1,205 @@
+# Shared helpers for getting binaries onto an Android device.
+#
+# `delta_push()` is an rsync-style alternative to `adb push`: it hashes
+# fixed-size blocks of the host file and of the copy already on the device,
+# pushes only the blocks that differ and rebuilds the file on the device.
+
+import hashlib
+import os
+import shlex
+import tempfile
+from dataclasses import dataclass
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class SyncStats:
+    """Outcome of a push: how the file got there and what it cost."""
+
+    mode: str  # "unchanged", "delta", "full" or "compressed"
+    total_bytes: int
+    bytes_sent: int
+    changed_blocks: int = 0
+    total_blocks: int = 0
+    codec: str = ""
+
+    @property
+    def bytes_skipped(self):
+        return max(self.total_bytes - self.bytes_sent, 0)
+
+    def summary(self):
+        if self.mode == "unchanged":
+            return f"unchanged on device, skipped {format_bytes(self.total_bytes)}"
+        if self.mode == "full":
+            return f"full push, sent {format_bytes(self.bytes_sent)}"
+        if self.mode == "compressed":
+            return (
+                f"{self.codec} push, sent {format_bytes(self.bytes_sent)} "
+                f"for {format_bytes(self.total_bytes)}"
+            )
+        return (
+            f"delta push, {self.changed_blocks}/{self.total_blocks} blocks changed, "
+            f"sent {format_bytes(self.bytes_sent)}, "
+            f"skipped {format_bytes(self.bytes_skipped)}"
+        )
+
+
+def format_bytes(count):
+    """Render a byte count for status lines."""
+    if count < 1024:
+        return f"{count} B"
+    if count < 1024 * 1024:
+        return f"{count / 1024:.1f} KB"
+    return f"{count / (1024 * 1024):.1f} MB"
+
+
+def shell_lines(device, command, timeout=60):
+    """Run a command on the device's shell session; returns (status, lines)."""
+    status, output = device.shell(command, timeout=timeout)
+    return status, output.splitlines()
+
+
+def local_block_hashes(path, block_size):
+    """Return (whole-file sha256, [per-block sha256]) for a host file."""
+    whole = hashlib.sha256()
+    blocks = []
+    with open(path, "rb") as f:
+        while chunk := f.read(block_size):
+            whole.update(chunk)
+            blocks.append(hashlib.sha256(chunk).hexdigest())
+    return whole.hexdigest(), blocks
+
+
+def remote_file_hash(device, remote_path):
+    """Return (sha256, size) of the device copy, or (None, None) if missing."""
+    quoted = shlex.quote(remote_path)
+    status, lines = shell_lines(
+        device,
+        f"[ -f {quoted} ] || exit 3; sha256sum {quoted} && stat -c %s {quoted}",
+        timeout=60,
+    )
+    if status != 0 or len(lines) < 2:
+        return None, None
+    digest = lines[0].split()[0]
+    size = lines[1].strip()
+    if len(digest) != 64 or not size.isdigit():
+        return None, None
+    return digest, int(size)
+
+
+def remote_block_hashes(device, remote_path, remote_size, block_size):
+    """Hash every block of the device copy with `dd | sha256sum`."""
+    count = (remote_size + block_size - 1) // block_size
+    quoted = shlex.quote(remote_path)
+    status, lines = shell_lines(
+        device,
+        f"i=0; while [ $i -lt {count} ]; do "
+        f"dd if={quoted} bs={block_size} skip=$i count=1 2>/dev/null | sha256sum; "
+        f"i=$((i+1)); done",
+        timeout=max(60, count),
+    )
+    hashes = [line.split()[0] for line in lines if line.strip()]
+    if status != 0 or len(hashes) != count:
+        return None
+    return hashes
+
+
+def changed_runs(local_hashes, remote_hashes):
+    """Group indexes of blocks that differ into (first_block, length) runs."""
+    runs = []
+    for index, digest in enumerate(local_hashes):
+        if index < len(remote_hashes) and remote_hashes[index] == digest:
+            continue
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1][1] += 1
+        else:
+            runs.append([index, 1])
+    return [tuple(run) for run in runs]
+
+
+def delta_push(device, local_path, remote_path, block_size=DEFAULT_BLOCK_SIZE):
+    """Bring `remote_path` in line with `local_path`, sending as little as possible.
+
+    `device` is an `android_adb.AdbDevice`. Returns a `SyncStats`; transport
+    failures raise `android_adb.AdbError`.
+    """
+    total_bytes = os.path.getsize(local_path)
+    local_hash, local_hashes = local_block_hashes(local_path, block_size)
+
+    remote_hash, remote_size = remote_file_hash(device, remote_path)
+    if remote_hash == local_hash and remote_size == total_bytes:
+        return SyncStats("unchanged", total_bytes, 0, 0, len(local_hashes))
+
+    remote_hashes = None
+    if remote_hash is not None:
+        remote_hashes = remote_block_hashes(device, remote_path, remote_size, block_size)
+    if remote_hashes is None:
+        # Nothing usable on the device (or no sha256sum): fall back to a full push.
+        device.push(local_path, remote_path)
+        blocks = len(local_hashes)
+        return SyncStats("full", total_bytes, total_bytes, blocks, blocks)
+
+    runs = changed_runs(local_hashes, remote_hashes)
+    changed_blocks = sum(length for _, length in runs)
+
+    remote_dir = os.path.dirname(remote_path)
+    remote_name = os.path.basename(remote_path)
+    delta_remote = f"{remote_dir}/{remote_name}.delta"
+    script_remote = f"{remote_dir}/{remote_name}.delta.sh"
+    staging_remote = f"{remote_dir}/{remote_name}.sync"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        delta_local = os.path.join(tmp, f"{remote_name}.delta")
+        script_local = os.path.join(tmp, f"{remote_name}.delta.sh")
+
+        # The delta file is the changed runs back to back; run N starts at the
+        # block offset equal to the number of changed blocks before it.
+        with open(local_path, "rb") as src, open(delta_local, "wb") as dst:
+            for first, length in runs:
+                src.seek(first * block_size)
+                dst.write(src.read(length * block_size))
+
+        # The script runs next to the files it touches, so it only needs
+        # their names.
+        target = shlex.quote(remote_name)
+        staging = shlex.quote(os.path.basename(staging_remote))
+        delta = shlex.quote(os.path.basename(delta_remote))
+        script = [
+            "set -e",
+            'cd "$(dirname "$0")"',
+            f"cp {target} {staging}",
+        ]
+        delta_offset = 0
+        for first, length in runs:
+            script.append(
+                f"dd if={delta} of={staging} bs={block_size} "
+                f"skip={delta_offset} seek={first} count={length} conv=notrunc 2>/dev/null"
+            )
+            delta_offset += length
+        script += [
+            f"truncate -s {total_bytes} {staging}",
+            f'[ "$(sha256sum {staging} | cut -d" " -f1)" = {local_hash} ]',
+            f"chmod 755 {staging}",
+            f"mv {staging} {target}",
+            f'rm -f {delta} "$0"',
+        ]
+        with open(script_local, "w") as f:
+            f.write("\n".join(script) + "\n")
+
+        bytes_sent = os.path.getsize(delta_local) + os.path.getsize(script_local)
+        device.push(delta_local, delta_remote)
+        device.push(script_local, script_remote)
+
+    status, _ = device.shell(f"sh {shlex.quote(script_remote)}", timeout=120)
+    if status != 0:
+        # Rebuild or verification failed; a full push always gets us there.
+        leftovers = " ".join(
+            shlex.quote(p) for p in (staging_remote, delta_remote, script_remote)
+        )
+        device.shell(f"rm -f {leftovers}")
+        device.push(local_path, remote_path)
+        blocks = len(local_hashes)
+        return SyncStats("full", total_bytes, bytes_sent + total_bytes, blocks, blocks)
+
+    return SyncStats("delta", total_bytes, bytes_sent, changed_blocks, len(local_hashes))
@@ -0,0 +1,123 @@
+# Phase timing for the Android scripts, written as Chrome trace JSON.
+#
+# Every script records its phases on the shared `tracer`:
+#
+#     span = tracer.begin("push", serial=serial)
+#     ...
+#     span.end(bytes_sent=n)
+#
+# or `with tracer.span("chmod"):` for blocks. `tracer.save()` writes the run to
+# codex-rs/target/android-traces/, which chrome://tracing and ui.perfetto.dev
+# open directly. Spans from worker threads land on their own track.
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+TRACE_DIR = os.path.join("codex-rs", "target", "android-traces")
+
+
+class Span:
+    """One timed phase; attributes end up in the event's `args`."""
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = dict(attrs)
+        self.tid = tracer._thread_id()
+        self.start = time.perf_counter()
+        self.duration = None
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+        return self
+
+    def end(self, **attrs):
+        if self.duration is None:
+            self.attrs.update(attrs)
+            self.duration = time.perf_counter() - self.start
+        return self
+
+
+class Tracer:
+    """Collects spans for one script run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans = []
+        self._threads = {}
+        self.origin = time.perf_counter()
+        self.wall_origin = time.time()
+        self.metadata = {}
+
+    def _thread_id(self):
+        ident = threading.get_ident()
+        with self._lock:
+            if ident not in self._threads:
+                self._threads[ident] = (len(self._threads) + 1, threading.current_thread().name)
+            return self._threads[ident][0]
+
+    def begin(self, name, **attrs):
+        span = Span(self, name, attrs)
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    @contextlib.contextmanager
+    def span(self, name, **attrs):
+        span = self.begin(name, **attrs)
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=repr(e))
+            raise
+        finally:
+            span.end()
+
+    def events(self):
+        """Chrome trace events for everything recorded so far."""
+        now = time.perf_counter()
+        pid = os.getpid()
+        events = []
+        with self._lock:
+            for tid, thread_name in self._threads.values():
+                events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                               "args": {"name": thread_name}})
+            for span in self._spans:
+                args = dict(span.attrs)
+                duration = span.duration
+                if duration is None:
+                    # Still open (an early return or a crash): close it at save time.
+                    duration = now - span.start
+                    args["incomplete"] = True
+                events.append({
+                    "name": span.name,
+                    "cat": "android",
+                    "ph": "X",
+                    "pid": pid,
+                    "tid": span.tid,
+                    "ts": round((span.start - self.origin) * 1e6, 3),
+                    "dur": round(duration * 1e6, 3),
+                    "args": args,
+                })
+        return events
+
+    def save(self, script, path=None):
+        """Write the trace and return its path."""
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.wall_origin))
+            path = os.path.join(TRACE_DIR, f"{script}-{stamp}-{os.getpid()}.json")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        trace = {
+            "traceEvents": self.events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"script": script, "start_time": self.wall_origin, **self.metadata},
+        }
+        with open(path, "w") as f:
+            json.dump(trace, f)
+        return path
+
+
+tracer = Tracer()
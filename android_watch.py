@@ -0,0 +1,214 @@
+# Source watching and cancellable builds for `android_deploy_debug.py --watch`.
+#
+# On Linux the watcher uses inotify directly through libc (one watch per
+# directory under codex-rs, skipping target/), so a save wakes the loop
+# immediately and costs nothing while idle. Elsewhere, macOS included, it falls
+# back to comparing mtimes once a second. Only `*.rs` and `Cargo.toml` count as
+# changes.
+#
+# A build runs in its own process group so that a newer edit can cancel it
+# with SIGINT, which cargo handles cleanly, instead of waiting for a binary
+# that is already stale.
+
+import ctypes
+import ctypes.util
+import os
+import signal
+import struct
+import subprocess
+import time
+
+from android_log import BUILD_CONSOLE, READ_SIZE, StreamingLog, console_filter
+
+WATCH_ROOT = "codex-rs"
+SKIPPED_DIRS = {"target", "node_modules"}
+POLL_INTERVAL = 1.0
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_watched(path):
+    name = os.path.basename(path)
+    return name.endswith(".rs") or name == "Cargo.toml"
+
+
+def watched_dirs(root):
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS and not d.startswith(".")]
+        yield dirpath
+
+
+class InotifyWatcher:
+    """Changed source files under `root`, reported by inotify."""
+
+    kind = "inotify"
+
+    def __init__(self, root=WATCH_ROOT):
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+        for path in watched_dirs(root):
+            self._add(path)
+
+    def _add(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    @property
+    def count(self):
+        return len(self._dirs)
+
+    def fileno(self):
+        return self._fd
+
+    def read_changes(self):
+        """Watched files touched since the last call; never blocks."""
+        changes = set()
+        while True:
+            try:
+                data = os.read(self._fd, READ_SIZE)
+            except BlockingIOError:
+                return changes
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped; we can't tell what changed, only that something did.
+                    changes.add(self.root)
+                    continue
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                path = os.path.join(self._dirs.get(wd, self.root), name)
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and os.path.basename(path) not in SKIPPED_DIRS:
+                        # A directory moved in arrives with its files already inside.
+                        for new_dir in watched_dirs(path):
+                            self._add(new_dir)
+                            changes.update(os.path.join(new_dir, f) for f in os.listdir(new_dir)
+                                           if is_watched(f))
+                elif is_watched(path):
+                    changes.add(path)
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Changed source files under `root`, found by comparing mtimes."""
+
+    kind = "polling"
+
+    def __init__(self, root=WATCH_ROOT):
+        self.root = root
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for dirpath in watched_dirs(self.root):
+            for name in os.listdir(dirpath):
+                path = os.path.join(dirpath, name)
+                if is_watched(path):
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    @property
+    def count(self):
+        return len(self._snapshot)
+
+    def fileno(self):
+        return None
+
+    def read_changes(self):
+        snapshot = self._scan()
+        changes = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        self._snapshot = snapshot
+        return changes
+
+    def close(self):
+        pass
+
+
+def file_watcher(root=WATCH_ROOT):
+    """An InotifyWatcher where the kernel has inotify, else a PollingWatcher."""
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher(root)
+
+
+class CancellableBuild:
+    """A build process whose output is read by the caller's select loop."""
+
+    def __init__(self, argv, log_path, cwd=None, env=None):
+        self.started = time.monotonic()
+        self.log = StreamingLog(log_path, tail_bytes=8 * 1024, console=console_filter(BUILD_CONSOLE))
+        self.proc = subprocess.Popen(
+            argv,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        self.returncode = None
+
+    def fileno(self):
+        return self.proc.stdout.fileno()
+
+    def read(self):
+        """Consume available output; returns True once the build has finished."""
+        data = os.read(self.fileno(), READ_SIZE)
+        if data:
+            self.log.feed(data)
+            return False
+        self.returncode = self.proc.wait()
+        self._close()
+        return True
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def cancel(self):
+        """Stop the build and everything it started."""
+        for sig, grace in ((signal.SIGINT, 5), (signal.SIGKILL, None)):
+            try:
+                os.killpg(self.proc.pid, sig)
+            except ProcessLookupError:
+                break
+            try:
+                self.proc.wait(timeout=grace)
+                break
+            except subprocess.TimeoutExpired:
+                continue
+        self.returncode = self.proc.wait()
+        self._close()
+
+    def _close(self):
+        self.proc.stdout.close()
+        self.log.close()
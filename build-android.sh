@@ -67,37 +67,48 @@ rustup target add aarch64-linux-android
 export OPENSSL_DIR="$ANDROID_NDK_HOME/toolchains/llvm/prebuilt/$NDK_HOST_TAG/sysroot/usr"
 export OPENSSL_STATIC=1
 
+# Extra flags for every cargo build below (android_deploy_debug.py passes --timings)
+CARGO_EXTRA_ARGS="${CODEX_CARGO_ARGS:-}"
+
 # Build the workspace
 echo "Building workspace..."
 cd codex-rs
 
+# android_deploy_debug.py --watch only redeploys the codex binary
+if [ -n "${CODEX_CLI_ONLY:-}" ]; then
+    echo "Building codex-cli binary only..."
+    cargo build --release --target aarch64-linux-android --bin codex -p codex-cli $CARGO_EXTRA_ARGS
+    echo "Android build completed successfully!"
+    exit 0
+fi
+
 echo "Building libraries with custom Android PTY implementation..."
 
 # Build libraries that should work on Android
 echo "Building codex-apply-patch library..."
-cargo build --release --target aarch64-linux-android --lib -p codex-apply-patch || echo "codex-apply-patch build failed"
+cargo build --release --target aarch64-linux-android --lib -p codex-apply-patch $CARGO_EXTRA_ARGS || echo "codex-apply-patch build failed"
 
 echo "Building codex-common library..."
-cargo build --release --target aarch64-linux-android --lib -p codex-common || echo "codex-common build failed"
+cargo build --release --target aarch64-linux-android --lib -p codex-common $CARGO_EXTRA_ARGS || echo "codex-common build failed"
 
 echo "Building codex-ollama library..."
-cargo build --release --target aarch64-linux-android --lib -p codex-ollama || echo "codex-ollama build failed"
+cargo build --release --target aarch64-linux-android --lib -p codex-ollama $CARGO_EXTRA_ARGS || echo "codex-ollama build failed"
 
 echo "Building codex-login library..."
-cargo build --release --target aarch64-linux-android --lib -p codex-login || echo "codex-login build failed"
+cargo build --release --target aarch64-linux-android --lib -p codex-login $CARGO_EXTRA_ARGS || echo "codex-login build failed"
 
 echo "Building codex-linux-sandbox library..."
-cargo build --release --target aarch64-linux-android --lib -p codex-linux-sandbox || echo "codex-linux-sandbox build failed"
+cargo build --release --target aarch64-linux-android --lib -p codex-linux-sandbox $CARGO_EXTRA_ARGS || echo "codex-linux-sandbox build failed"
 
 echo ""
 echo "Building codex-core with custom Android PTY implementation..."
-cargo build --release --target aarch64-linux-android --lib -p codex-core || echo "codex-core build failed"
+cargo build --release --target aarch64-linux-android --lib -p codex-core $CARGO_EXTRA_ARGS || echo "codex-core build failed"
 
 echo "Building codex-cli binary with custom Android PTY implementation..."
-cargo build --release --target aarch64-linux-android --bin codex -p codex-cli || echo "codex-cli binary build failed"
+cargo build --release --target aarch64-linux-android --bin codex -p codex-cli $CARGO_EXTRA_ARGS || echo "codex-cli binary build failed"
 
 echo "Building codex-exec binary with custom Android PTY implementation..."
-cargo build --release --target aarch64-linux-android --bin codex-exec -p codex-exec || echo "codex-exec binary build failed"
+cargo build --release --target aarch64-linux-android --bin codex-exec -p codex-exec $CARGO_EXTRA_ARGS || echo "codex-exec binary build failed"
 
 echo "Android build completed successfully!"
 echo "Binaries are available in target/aarch64-linux-android/release/"
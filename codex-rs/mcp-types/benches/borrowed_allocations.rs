@@ -0,0 +1,167 @@
+//! Heap allocations made deserializing a large `tools/list` response and a
+//! large `resources/read` response, into the owned types the way mcp-client
+//! does today and into the `borrowed` ones.
+//!
+//! ```shell
+//! cargo bench -p mcp-types --features borrowed --bench borrowed_allocations
+//! ```
+
+use std::alloc::GlobalAlloc;
+use std::alloc::Layout;
+use std::alloc::System;
+use std::hint::black_box;
+use std::sync::atomic::AtomicUsize;
+use std::sync::atomic::Ordering;
+use std::time::Instant;
+
+use mcp_types::IntoOwned;
+use mcp_types::JSONRPCMessage;
+use mcp_types::ListToolsResult;
+use mcp_types::ReadResourceResult;
+use mcp_types::borrowed;
+use serde::de::DeserializeOwned;
+use serde_json::json;
+
+const RUNS: u32 = 50;
+
+struct CountingAllocator;
+
+static ALLOCATIONS: AtomicUsize = AtomicUsize::new(0);
+static ALLOCATED_BYTES: AtomicUsize = AtomicUsize::new(0);
+
+unsafe impl GlobalAlloc for CountingAllocator {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        ALLOCATIONS.fetch_add(1, Ordering::Relaxed);
+        ALLOCATED_BYTES.fetch_add(layout.size(), Ordering::Relaxed);
+        unsafe { System.alloc(layout) }
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        unsafe { System.dealloc(ptr, layout) }
+    }
+
+    unsafe fn realloc(&self, ptr: *mut u8, layout: Layout, new_size: usize) -> *mut u8 {
+        ALLOCATIONS.fetch_add(1, Ordering::Relaxed);
+        ALLOCATED_BYTES.fetch_add(new_size, Ordering::Relaxed);
+        unsafe { System.realloc(ptr, layout, new_size) }
+    }
+}
+
+#[global_allocator]
+static GLOBAL: CountingAllocator = CountingAllocator;
+
+fn main() -> Result<(), serde_json::Error> {
+    let tools = tools_list_response(500);
+    let resources = read_resource_response(200);
+    println!(
+        "{:<44} {:>12} {:>12} {:>10}",
+        "per response", "allocations", "bytes", "µs"
+    );
+
+    measure("tools/list: owned (mcp-client)", &tools, |line| {
+        owned::<ListToolsResult>(line)
+    })?;
+    measure("tools/list: borrowed", &tools, |line| {
+        let response: borrowed::JSONRPCResponse = serde_json::from_str(line)?;
+        let result: borrowed::ListToolsResult = serde_json::from_str(response.result.get())?;
+        black_box(&result);
+        Ok(())
+    })?;
+    measure("tools/list: borrowed, then into_owned", &tools, |line| {
+        let response: borrowed::JSONRPCResponse = serde_json::from_str(line)?;
+        let result: borrowed::ListToolsResult = serde_json::from_str(response.result.get())?;
+        black_box(result.into_owned());
+        Ok(())
+    })?;
+
+    measure("resources/read: owned (mcp-client)", &resources, |line| {
+        owned::<ReadResourceResult>(line)
+    })?;
+    measure("resources/read: borrowed", &resources, |line| {
+        let response: borrowed::JSONRPCResponse = serde_json::from_str(line)?;
+        let result: borrowed::ReadResourceResult = serde_json::from_str(response.result.get())?;
+        black_box(&result);
+        Ok(())
+    })?;
+    measure(
+        "resources/read: borrowed, then into_owned",
+        &resources,
+        |line| {
+            let response: borrowed::JSONRPCResponse = serde_json::from_str(line)?;
+            let result: borrowed::ReadResourceResult = serde_json::from_str(response.result.get())?;
+            black_box(result.into_owned());
+            Ok(())
+        },
+    )?;
+    Ok(())
+}
+
+/// What mcp-client does with every line it reads from the server.
+fn owned<T: DeserializeOwned>(line: &str) -> Result<(), serde_json::Error> {
+    let JSONRPCMessage::Response(response) = serde_json::from_str(line)? else {
+        panic!("not a response");
+    };
+    black_box(serde_json::from_value::<T>(response.result)?);
+    Ok(())
+}
+
+fn measure(
+    name: &str,
+    line: &str,
+    deserialize: impl Fn(&str) -> Result<(), serde_json::Error>,
+) -> Result<(), serde_json::Error> {
+    // Once untimed, so one-off allocations are not counted.
+    deserialize(line)?;
+    let allocations = ALLOCATIONS.load(Ordering::Relaxed);
+    let bytes = ALLOCATED_BYTES.load(Ordering::Relaxed);
+    let started = Instant::now();
+    for _ in 0..RUNS {
+        deserialize(black_box(line))?;
+    }
+    let elapsed = started.elapsed() / RUNS;
+    let allocations = (ALLOCATIONS.load(Ordering::Relaxed) - allocations) / RUNS as usize;
+    let bytes = (ALLOCATED_BYTES.load(Ordering::Relaxed) - bytes) / RUNS as usize;
+    println!(
+        "{name:<44} {allocations:>12} {bytes:>12} {:>10.1}",
+        elapsed.as_secs_f64() * 1e6
+    );
+    Ok(())
+}
+
+fn tools_list_response(tools: usize) -> String {
+    let tools: Vec<_> = (0..tools)
+        .map(|i| {
+            json!({
+                "name": format!("tool_{i}"),
+                "title": format!("Tool {i}"),
+                "description": "Runs a command in the workspace and returns its output. ".repeat(4),
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "command": {"type": "string", "description": "The command to run."},
+                        "cwd": {"type": "string", "description": "Where to run it."},
+                        "timeout_ms": {"type": "integer"}
+                    },
+                    "required": ["command"]
+                },
+                "annotations": {"readOnlyHint": false, "title": format!("Tool {i}")}
+            })
+        })
+        .collect();
+    json!({"jsonrpc": "2.0", "id": 1, "result": {"tools": tools}}).to_string()
+}
+
+/// Source files have newlines, which JSON escapes, so their text is still
+/// copied; the borrowed types save the rest.
+fn read_resource_response(contents: usize) -> String {
+    let contents: Vec<_> = (0..contents)
+        .map(|i| {
+            json!({
+                "uri": format!("file:///workspace/src/module_{i}.rs"),
+                "mimeType": "text/x-rust",
+                "text": "fn main() {}\n".repeat(300)
+            })
+        })
+        .collect();
+    json!({"jsonrpc": "2.0", "id": 2, "result": {"contents": contents}}).to_string()
+}
@@ -2,9 +2,16 @@
 # flake8: noqa: E501
 
 import argparse
+import difflib
+import hashlib
 import json
+import os
+import re
 import subprocess
 import sys
+import tempfile
+
+from concurrent.futures import ProcessPoolExecutor
 
 from dataclasses import (
     dataclass,
@@ -14,12 +21,32 @@ from pathlib import Path
 # Helper first so it is defined when other functions call it.
 from typing import Any, Literal
 
-SCHEMA_VERSION = "2025-06-18"
 JSONRPC_VERSION = "2.0"
+# rustfmt's max_width and attr_fn_like_width; the generator breaks lines
+# where rustfmt would.
+MAX_WIDTH = 100
+ATTR_FN_LIKE_WIDTH = 70
+
+GENERATOR = Path(__file__).resolve()
+CRATE_DIR = GENERATOR.parent
+# Every schema/<version>/schema.json becomes src/v<version>/; definitions
+# that are the same in all of them go to src/shared/.
+SCHEMA_DIR = CRATE_DIR / "schema"
+SRC_DIR = CRATE_DIR / "src"
+SHARED_MODULE = "shared"
+# Hashes of the inputs and output of the last run; lives under target/ so it
+# is never committed.
+STAMP_FILE = (
+    Path(os.environ.get("CARGO_TARGET_DIR", CRATE_DIR.parent / "target"))
+    / "mcp-types-generate.stamp"
+)
 
-STANDARD_DERIVE = "#[derive(Debug, Clone, PartialEq, Deserialize, Serialize, TS)]\n"
+# TypeScript bindings are only needed for the export, so ts_rs::TS is behind
+# the crate's `ts` feature.
+TS_DERIVE = '#[cfg_attr(feature = "ts", derive(ts_rs::TS))]\n'
+STANDARD_DERIVE = "#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]\n" + TS_DERIVE
 STANDARD_HASHABLE_DERIVE = (
-    "#[derive(Debug, Clone, PartialEq, Deserialize, Serialize, Hash, Eq, TS)]\n"
+    "#[derive(Debug, Clone, PartialEq, Deserialize, Serialize, Hash, Eq)]\n" + TS_DERIVE
 )
 
 # Will be populated with the schema's `definitions` map in `main()` so that
@@ -33,80 +60,240 @@ SERVER_NOTIFICATION_TYPE_NAMES: list[str] = []
 # Enum types that will need a `allow(clippy::large_enum_variant)` annotation in
 # order to compile without warnings.
 LARGE_ENUMS = {"ServerResult"}
+IDENTIFIER = re.compile(r"(?<!::)\b[A-Za-z_][A-Za-z0-9_]*\b")
+STRING_LITERAL = re.compile(r'"[^"]*"')
+# Names being declared rather than used: enum variants and associated types.
+DECLARATION = re.compile(r"^    (?:type \w+ =|\w+(?=[(,{ ]|$))", re.MULTILINE)
+DEFINED_NAME = re.compile(r"^pub (?:struct|enum|type) (\w+)", re.MULTILINE)
+# Definitions go to the module named after their suffix; see group_names().
+GROUP_SUFFIXES = (
+    ("Request", "requests"),
+    ("Result", "results"),
+    ("Notification", "notifications"),
+    ("Capabilities", "capabilities"),
+)
+MISC_GROUP = "types"
+
+GENERATED_HEADER = """// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+"""
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(
-        description="Embed, cluster and analyse text prompts via the OpenAI API.",
+        description="Generate the mcp-types crate from the MCP JSON schemas.",
     )
-
-    default_schema_file = (
-        Path(__file__).resolve().parent / "schema" / SCHEMA_VERSION / "schema.json"
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate even if the schemas and this script are unchanged",
     )
     parser.add_argument(
-        "schema_file",
-        nargs="?",
-        default=default_schema_file,
-        help="schema.json file to process",
+        "--check-format",
+        action="store_true",
+        help="also run rustfmt over the output and fail if it would change it",
     )
     args = parser.parse_args()
-    schema_file = args.schema_file
 
-    lib_rs = Path(__file__).resolve().parent / "src/lib.rs"
+    schema_files = sorted(SCHEMA_DIR.glob("*/schema.json"))
+    inputs = {"generator": sha256_hex(GENERATOR.read_bytes())}
+    for schema_file in schema_files:
+        inputs[str(schema_file.relative_to(CRATE_DIR))] = sha256_hex(
+            schema_file.read_bytes()
+        )
+    if not args.force and is_up_to_date(inputs):
+        print(f"{SRC_DIR} is up to date")
+        return 0
+
+    # Each schema is rendered in its own process: the helpers below keep
+    # per-schema state in module globals.
+    with ProcessPoolExecutor(max_workers=len(schema_files)) as pool:
+        schemas = list(pool.map(render_schema, schema_files))
+    outputs = render_crate(schemas)
+    check_features(schemas)
+
+    if args.check_format:
+        if not all([check_format(source, path) for path, source in outputs.items()]):
+            return 1
+    for path, source in outputs.items():
+        if write_if_changed(path, source):
+            print(f"Wrote {path}")
+    remove_stale(outputs)
+    save_stamp(inputs, outputs)
+    return 0
 
-    global DEFINITIONS  # Allow helper functions to access the schema.
 
-    with schema_file.open(encoding="utf-8") as f:
-        schema_json = json.load(f)
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
-    DEFINITIONS = schema_json["definitions"]
 
-    out = [
-        f"""
-// @generated
-// DO NOT EDIT THIS FILE DIRECTLY.
-// Run the following in the crate root to regenerate this file:
-//
-// ```shell
-// ./generate_mcp_types.py
-// ```
-use serde::Deserialize;
-use serde::Serialize;
-use serde::de::DeserializeOwned;
-use std::convert::TryFrom;
-
-use ts_rs::TS;
+def is_up_to_date(inputs: dict[str, str]) -> bool:
+    """True if every output is what the last run wrote from these same inputs."""
+    try:
+        stamp = json.loads(STAMP_FILE.read_text(encoding="utf-8"))
+        return stamp["inputs"] == inputs and all(
+            sha256_hex(Path(path).read_bytes()) == digest
+            for path, digest in stamp["outputs"].items()
+        )
+    except (OSError, ValueError, KeyError):
+        return False
 
-pub const MCP_SCHEMA_VERSION: &str = "{SCHEMA_VERSION}";
-pub const JSONRPC_VERSION: &str = "{JSONRPC_VERSION}";
 
-/// Paired request/response types for the Model Context Protocol (MCP).
-pub trait ModelContextProtocolRequest {{
-    const METHOD: &'static str;
-    type Params: DeserializeOwned + Serialize + Send + Sync + 'static;
-    type Result: DeserializeOwned + Serialize + Send + Sync + 'static;
-}}
+def save_stamp(inputs: dict[str, str], outputs: dict[Path, str]) -> None:
+    stamp = {
+        "inputs": inputs,
+        "outputs": {
+            str(path): sha256_hex(source.encode("utf-8"))
+            for path, source in outputs.items()
+        },
+    }
+    STAMP_FILE.parent.mkdir(parents=True, exist_ok=True)
+    STAMP_FILE.write_text(json.dumps(stamp, indent=2, sort_keys=True), encoding="utf-8")
 
-/// One-way message in the Model Context Protocol (MCP).
-pub trait ModelContextProtocolNotification {{
-    const METHOD: &'static str;
-    type Params: DeserializeOwned + Serialize + Send + Sync + 'static;
-}}
 
-fn default_jsonrpc() -> String {{ JSONRPC_VERSION.to_owned() }}
+def write_if_changed(path: Path, source: str) -> bool:
+    """Atomically replace `path` with `source` unless it already holds exactly that.
 
-"""
+    Leaving an identical file alone keeps its mtime, so cargo does not rebuild
+    mcp-types and every crate that depends on it.
+    """
+    data = source.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def format_rust(source: str) -> str:
+    """`source` as rustfmt formats it; only this text goes through rustfmt, via stdin."""
+    return subprocess.run(
+        [
+            "rustfmt",
+            "--edition",
+            "2024",
+            "--emit",
+            "stdout",
+            "--config",
+            "imports_granularity=Item",
+        ],
+        input=source,
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=CRATE_DIR,
+    ).stdout
+
+
+def check_format(source: str, path: Path) -> bool:
+    """True if rustfmt leaves the generated `source` as it is."""
+    formatted = format_rust(source)
+    if formatted == source:
+        return True
+    diff = difflib.unified_diff(
+        source.splitlines(keepends=True),
+        formatted.splitlines(keepends=True),
+        f"{path} (generated)",
+        f"{path} (rustfmt)",
+    )
+    sys.stderr.writelines(diff)
+    print(
+        "rustfmt would reformat the generated code; fix the generator", file=sys.stderr
+    )
+    return False
+
+
+def wrap_attribute(indent: str, attribute: str) -> str:
+    """`attribute` on one line, or one argument per line if that is too wide."""
+    name, args = attribute[2:-2].split("(", 1)
+    if len(args) <= ATTR_FN_LIKE_WIDTH and len(indent) + len(attribute) <= MAX_WIDTH:
+        return f"{indent}{attribute}\n"
+    lines = [f"{indent}#[{name}(\n"]
+    # rustfmt adds no trailing comma inside attributes.
+    lines.append(",\n".join(f"{indent}    {arg}" for arg in args.split(", ")) + "\n")
+    lines.append(f"{indent})]\n")
+    return "".join(lines)
+
+
+def tuple_variant(name: str, type_name: str) -> str:
+    line = f"    {name}({type_name}),\n"
+    if len(line) - 1 <= MAX_WIDTH:
+        return line
+    return f"    {name}(\n        {type_name},\n    ),\n"
+
+
+def parse_params_lines(payload_type: str) -> list[str]:
+    line = f"                let params: {payload_type} = serde_json::from_value(params_json)?;\n"
+    head = f"                let params: {payload_type} =\n"
+    # rustfmt leaves the line alone when breaking it would not make it fit.
+    if len(line) - 1 <= MAX_WIDTH or len(head) - 1 > MAX_WIDTH:
+        return [line]
+    return [head, "                    serde_json::from_value(params_json)?;\n"]
+
+
+def unknown_method_lines(method: str) -> list[str]:
+    return [
+        "            _ => Err(serde_json::Error::io(std::io::Error::new(\n",
+        "                std::io::ErrorKind::InvalidData,\n",
+        f'                format!("Unknown method: {{}}", {method}),\n',
+        "            ))),\n",
     ]
-    definitions = schema_json["definitions"]
-    # Keep track of every *Request type so we can generate the TryFrom impl at
-    # the end.
-    # The concrete *Request types referenced by the ClientRequest enum will be
-    # captured dynamically while we are processing that definition.
-    for name, definition in definitions.items():
+
+
+@dataclass
+class RenderedSchema:
+    version: str
+    # The Rust source of every definition, in schema order. An entry includes
+    # the types generated for the definition's nested objects and, for
+    # ClientRequest and ServerNotification, their TryFrom impls.
+    items: dict[str, str]
+    # The body of the `borrowed` module and the crate::borrow helpers it uses.
+    borrowed: str
+    borrow_helpers: set[str]
+
+    @property
+    def module(self) -> str:
+        return module_name(self.version)
+
+
+def module_name(version: str) -> str:
+    return "v" + version.replace("-", "_")
+
+
+def render_schema(schema_file: Path) -> RenderedSchema:
+    """Render every definition of one schema.json; runs in a worker process."""
+    global DEFINITIONS  # Allow helper functions to access the schema.
+
+    DEFINITIONS = json.loads(schema_file.read_text(encoding="utf-8"))["definitions"]
+    items: dict[str, str] = {}
+    for name, definition in DEFINITIONS.items():
+        out: list[str] = []
         add_definition(name, definition, out)
-    # No-op: list collected via define_any_of("ClientRequest").
+        items[name] = "".join(out)
+    # The lists of request and notification types were collected while
+    # rendering ClientRequest and ServerNotification.
+    items["ClientRequest"] += try_from_client_request()
+    items["ServerNotification"] += try_from_server_notification()
+    borrowed = BorrowedRenderer()
+    body = borrowed.render(BORROWED_ROOTS)
+    return RenderedSchema(schema_file.parent.name, items, body, borrowed.helpers)
 
-    # Generate TryFrom impl string and append to out before writing to file.
+
+def try_from_client_request() -> str:
     try_from_impl_lines: list[str] = []
     try_from_impl_lines.append("impl TryFrom<JSONRPCRequest> for ClientRequest {\n")
     try_from_impl_lines.append("    type Error = serde_json::Error;\n")
@@ -116,7 +303,7 @@ fn default_jsonrpc() -> String {{ JSONRPC_VERSION.to_owned() }}
     try_from_impl_lines.append("        match req.method.as_str() {\n")
 
     for req_name in CLIENT_REQUEST_TYPE_NAMES:
-        defn = definitions[req_name]
+        defn = DEFINITIONS[req_name]
         method_const = (
             defn.get("properties", {}).get("method", {}).get("const", req_name)
         )
@@ -125,24 +312,20 @@ fn default_jsonrpc() -> String {{ JSONRPC_VERSION.to_owned() }}
         try_from_impl_lines.append(
             "                let params_json = req.params.unwrap_or(serde_json::Value::Null);\n"
         )
-        try_from_impl_lines.append(
-            f"                let params: {payload_type} = serde_json::from_value(params_json)?;\n"
-        )
+        try_from_impl_lines.extend(parse_params_lines(payload_type))
         try_from_impl_lines.append(
             f"                Ok(ClientRequest::{req_name}(params))\n"
         )
-        try_from_impl_lines.append("            },\n")
+        try_from_impl_lines.append("            }\n")
 
-    try_from_impl_lines.append(
-        '            _ => Err(serde_json::Error::io(std::io::Error::new(std::io::ErrorKind::InvalidData, format!("Unknown method: {}", req.method)))),\n'
-    )
+    try_from_impl_lines.extend(unknown_method_lines("req.method"))
     try_from_impl_lines.append("        }\n")
     try_from_impl_lines.append("    }\n")
     try_from_impl_lines.append("}\n\n")
+    return "".join(try_from_impl_lines)
 
-    out.extend(try_from_impl_lines)
 
-    # Generate TryFrom for ServerNotification
+def try_from_server_notification() -> str:
     notif_impl_lines: list[str] = []
     notif_impl_lines.append(
         "impl TryFrom<JSONRPCNotification> for ServerNotification {\n"
@@ -154,7 +337,7 @@ fn default_jsonrpc() -> String {{ JSONRPC_VERSION.to_owned() }}
     notif_impl_lines.append("        match n.method.as_str() {\n")
 
     for notif_name in SERVER_NOTIFICATION_TYPE_NAMES:
-        n_def = definitions[notif_name]
+        n_def = DEFINITIONS[notif_name]
         method_const = (
             n_def.get("properties", {}).get("method", {}).get("const", notif_name)
         )
@@ -164,34 +347,643 @@ fn default_jsonrpc() -> String {{ JSONRPC_VERSION.to_owned() }}
         notif_impl_lines.append(
             "                let params_json = n.params.unwrap_or(serde_json::Value::Null);\n"
         )
-        notif_impl_lines.append(
-            f"                let params: {payload_type} = serde_json::from_value(params_json)?;\n"
-        )
+        notif_impl_lines.extend(parse_params_lines(payload_type))
         notif_impl_lines.append(
             f"                Ok(ServerNotification::{notif_name}(params))\n"
         )
-        notif_impl_lines.append("            },\n")
+        notif_impl_lines.append("            }\n")
 
-    notif_impl_lines.append(
-        '            _ => Err(serde_json::Error::io(std::io::Error::new(std::io::ErrorKind::InvalidData, format!("Unknown method: {}", n.method)))),\n'
-    )
+    notif_impl_lines.extend(unknown_method_lines("n.method"))
     notif_impl_lines.append("        }\n")
     notif_impl_lines.append("    }\n")
-    notif_impl_lines.append("}\n")
+    notif_impl_lines.append("}\n\n")
+    return "".join(notif_impl_lines)
 
-    out.extend(notif_impl_lines)
 
-    with open(lib_rs, "w", encoding="utf-8") as f:
-        for chunk in out:
-            f.write(chunk)
+def referenced_names(source: str, names: set[str]) -> set[str]:
+    """The definitions in `names` that the code in `source` refers to by name.
 
-    subprocess.check_call(
-        ["cargo", "fmt", "--", "--config", "imports_granularity=Item"],
-        cwd=lib_rs.parent.parent,
-        stderr=subprocess.DEVNULL,
+    Comments, string literals, enum variant names, associated type names and
+    the tail of paths like `std::result::Result` do not count.
+    """
+    code = "\n".join(
+        line for line in source.splitlines() if not line.lstrip().startswith("//")
     )
+    code = DECLARATION.sub("", STRING_LITERAL.sub('""', code))
+    return set(IDENTIFIER.findall(code)) & names
+
+
+def shared_names(schemas: list[RenderedSchema]) -> set[str]:
+    """Definitions every schema renders identically and that only use other shared ones."""
+    if len(schemas) < 2:
+        return set()
+    first, *rest = schemas
+    shared = {
+        name
+        for name, source in first.items.items()
+        if all(schema.items.get(name) == source for schema in rest)
+    }
+    names = set(first.items)
+    uses = {name: referenced_names(first.items[name], names) for name in shared}
+    # A definition that mentions a version-specific type has to be generated
+    # once per version, and so then does everything that mentions it.
+    while unshared := {name for name in shared if not uses[name] <= shared}:
+        shared -= unshared
+    return shared
+
+
+def seed_group(name: str) -> str | None:
+    if name.startswith("JSONRPC"):
+        return "jsonrpc"
+    for suffix, group in GROUP_SUFFIXES:
+        if name.endswith(suffix):
+            return group
+    if "Content" in name:
+        return "content"
+    return None
+
+
+def group_names(schemas: list[RenderedSchema]) -> dict[str, str]:
+    """{definition: module} for every definition of every schema.
+
+    Definitions are seeded into a group by name (see GROUP_SUFFIXES); every
+    other one follows the definitions that use it, through the `$ref` graph,
+    when they all belong to one group, and goes to MISC_GROUP otherwise.
+    """
+    users: dict[str, set[str]] = {}
+    for schema in schemas:
+        names = set(schema.items)
+        for name, source in schema.items.items():
+            users.setdefault(name, set())
+            for used in referenced_names(source, names) - {name}:
+                users.setdefault(used, set()).add(name)
+
+    groups = {name: seed_group(name) for name in users}
+    # The groups each unseeded definition is reachable from, grown to a fixpoint.
+    reached: dict[str, set[str]] = {
+        name: set() for name, group in groups.items() if group is None
+    }
+    changed = True
+    while changed:
+        changed = False
+        for name, found in reached.items():
+            for user in users[name]:
+                new = {groups[user]} if groups[user] else reached[user]
+                if not new <= found:
+                    found |= new
+                    changed = True
+    for name, found in reached.items():
+        groups[name] = found.pop() if len(found) == 1 else MISC_GROUP
+    return groups
+
+
+def module_imports(body: str, names: set[str]) -> str:
+    """The `use` lines a generated module needs for the code in `body`.
+
+    `names` are the definitions found in sibling modules; they are imported
+    from the parent, which re-exports them all.
+    """
+    defined = set(DEFINED_NAME.findall(body))
+    groups = [
+        [
+            f"use {path};\n"
+            for path, name in (
+                ("serde::Deserialize", "Deserialize"),
+                ("serde::Serialize", "Serialize"),
+                ("std::convert::TryFrom", "TryFrom"),
+            )
+            if re.search(rf"\b{name}\b", body)
+        ],
+        [
+            f"use crate::{name};\n"
+            for name in (
+                "ModelContextProtocolNotification",
+                "ModelContextProtocolRequest",
+                "default_jsonrpc",
+            )
+            if re.search(rf"\b{name}\b", body)
+        ],
+        [
+            f"use super::{name};\n"
+            for name in sorted(referenced_names(body, names - defined))
+        ],
+    ]
+    return "\n".join("".join(group) for group in groups if group)
 
-    return 0
+
+def render_group(body: str, names: set[str]) -> str:
+    imports = module_imports(body, names)
+    return (GENERATED_HEADER + imports + "\n" + body).rstrip("\n") + "\n"
+
+
+def render_module_root(
+    groups: list[str], reexports: list[str], consts: str = "", borrowed: bool = False
+) -> str:
+    """mod.rs of a version or of the shared module: all of its groups, flattened."""
+    parts = [GENERATED_HEADER + "".join(f"mod {group};\n" for group in groups)]
+    if borrowed:
+        parts.append(f'#[cfg(feature = "borrowed")]\npub mod {BORROWED_MODULE};\n')
+    parts += [
+        "".join(f"pub use {group}::*;\n" for group in groups),
+    ]
+    if reexports:
+        parts.append(
+            "".join(f"pub use crate::{SHARED_MODULE}::{name};\n" for name in reexports)
+        )
+    if consts:
+        parts.append(consts)
+    return "\n".join(parts)
+
+
+def render_grouped(
+    directory: Path, items: dict[str, str], groups: dict[str, str]
+) -> dict[Path, str]:
+    """{path: source} of one group module per group used by `items`."""
+    by_group: dict[str, list[str]] = {}
+    for name, source in items.items():
+        by_group.setdefault(groups[name], []).append(source)
+    return {
+        directory / f"{group}.rs": render_group("".join(sources), set(groups))
+        for group, sources in sorted(by_group.items())
+    }
+
+
+def render_crate(schemas: list[RenderedSchema]) -> dict[Path, str]:
+    """{path: source} of lib.rs, the shared module and one module per schema version.
+
+    The shared module and each version module are directories with a mod.rs
+    and one file per group of definitions.
+    """
+    shared = shared_names(schemas)
+    groups = group_names(schemas)
+    outputs = {}
+    # Shared items keep the order of the first schema, the others their own.
+    shared_dir = SRC_DIR / SHARED_MODULE
+    files = render_grouped(
+        shared_dir,
+        {name: source for name, source in schemas[0].items.items() if name in shared},
+        groups,
+    )
+    outputs[shared_dir / "mod.rs"] = render_module_root(
+        [path.stem for path in files], []
+    )
+    outputs.update(files)
+    for schema in schemas:
+        module_dir = SRC_DIR / schema.module
+        files = render_grouped(
+            module_dir,
+            {name: source for name, source in schema.items.items() if name not in shared},
+            groups,
+        )
+        outputs[module_dir / "mod.rs"] = render_module_root(
+            [path.stem for path in files],
+            # Nested types, like JSONRPCErrorError, are re-exported too.
+            sorted(
+                defined
+                for name in schema.items
+                if name in shared
+                for defined in DEFINED_NAME.findall(schema.items[name])
+            ),
+            f'pub const MCP_SCHEMA_VERSION: &str = "{schema.version}";\n',
+            borrowed=bool(schema.borrowed),
+        )
+        outputs.update(files)
+        if schema.borrowed:
+            outputs[module_dir / f"{BORROWED_MODULE}.rs"] = render_borrowed(
+                schema.borrowed
+            )
+    outputs[SRC_DIR / "borrow.rs"] = render_borrow_rs(
+        set().union(*(schema.borrow_helpers for schema in schemas))
+    )
+    outputs[SRC_DIR / "lib.rs"] = render_lib_rs(schemas)
+    return outputs
+
+
+def remove_stale(outputs: dict[Path, str]) -> None:
+    """Delete generated files under src/ that this run did not produce."""
+    for path in sorted(SRC_DIR.rglob("*.rs")):
+        if path in outputs:
+            continue
+        with path.open(encoding="utf-8") as f:
+            if f.readline() != "// @generated\n":
+                continue
+        path.unlink()
+        print(f"Removed {path}")
+        if path.parent != SRC_DIR and not any(path.parent.iterdir()):
+            path.parent.rmdir()
+
+
+def render_lib_rs(schemas: list[RenderedSchema]) -> str:
+    features = ", ".join(f'feature = "{schema.module}"' for schema in schemas)
+    any_version = f"#[cfg(any({features}))]\n"
+    borrowed = f'#[cfg(all(feature = "borrowed", any({features})))]\n'
+    if len(borrowed) - len("#[cfg()]\n") > ATTR_FN_LIKE_WIDTH:
+        borrowed = f'#[cfg(all(\n    feature = "borrowed",\n    any({features})\n))]\n'
+    latest = max(schemas, key=lambda schema: schema.version)
+    modules = "".join(
+        f"/// Types for version {schema.version} of the MCP schema.\n"
+        f'#[cfg(feature = "{schema.module}")]\n'
+        f"pub mod {schema.module};\n"
+        for schema in schemas
+    )
+    return f"""{GENERATED_HEADER}use serde::Serialize;
+use serde::de::DeserializeOwned;
+
+pub const JSONRPC_VERSION: &str = "{JSONRPC_VERSION}";
+
+/// Paired request/response types for the Model Context Protocol (MCP).
+pub trait ModelContextProtocolRequest {{
+    const METHOD: &'static str;
+    type Params: DeserializeOwned + Serialize + Send + Sync + 'static;
+    type Result: DeserializeOwned + Serialize + Send + Sync + 'static;
+}}
+
+/// One-way message in the Model Context Protocol (MCP).
+pub trait ModelContextProtocolNotification {{
+    const METHOD: &'static str;
+    type Params: DeserializeOwned + Serialize + Send + Sync + 'static;
+}}
+
+{any_version}fn default_jsonrpc() -> String {{
+    JSONRPC_VERSION.to_owned()
+}}
+
+/// IntoOwned and the deserializers behind each version's `borrowed` module.
+{borrowed}mod borrow;
+{borrowed}pub use borrow::IntoOwned;
+
+/// Definitions that are identical in every schema version; each version
+/// module re-exports the ones it has.
+{any_version}mod {SHARED_MODULE};
+{modules}
+// The newest schema version is also available at the crate root.
+#[cfg(feature = "{latest.module}")]
+pub use {latest.module}::*;
+"""
+
+
+def check_features(schemas: list[RenderedSchema]) -> None:
+    """Warn about features the generated code uses that Cargo.toml lacks."""
+    manifest = (CRATE_DIR / "Cargo.toml").read_text(encoding="utf-8")
+    for feature in ["ts", "borrowed"] + [schema.module for schema in schemas]:
+        if not re.search(rf"^{feature}\s*=", manifest, re.MULTILINE):
+            print(f"warning: add a `{feature}` feature to Cargo.toml", file=sys.stderr)
+
+
+# The responses mcp-client deserializes on its hot path. With the `borrowed`
+# feature each version gets lifetime-parameterized copies of these, and of
+# every type they contain, that borrow strings and open objects from the
+# input instead of allocating.
+BORROWED_ROOTS = (
+    "JSONRPCResponse",
+    "CallToolResult",
+    "GetPromptResult",
+    "ListPromptsResult",
+    "ListResourceTemplatesResult",
+    "ListResourcesResult",
+    "ListToolsResult",
+    "ReadResourceResult",
+)
+BORROWED_DERIVE = "#[derive(Debug, Clone, Deserialize, Serialize)]\n"
+BORROWED_MODULE = "borrowed"
+
+
+@dataclass
+class BorrowedLeaf:
+    rust: str
+    # "cow", "raw" or "named" when the type carries the 'a lifetime.
+    kind: str | None = None
+
+
+COW = BorrowedLeaf("Cow<'a, str>", "cow")
+RAW = BorrowedLeaf("&'a RawValue", "raw")
+
+
+class BorrowedRenderer:
+    """Renders the `borrowed` module of one schema version.
+
+    Only types that hold a string or an open object get a borrowed copy; the
+    others, like Role or RequestId, are used from the owned module as they are.
+    """
+
+    def __init__(self) -> None:
+        self.out: list[str] = []
+        # name -> whether it has a borrowed copy; None while being defined.
+        self.borrows: dict[str, bool | None] = {}
+        self.helpers: set[str] = set()
+        # For the untagged enums, which cannot hold a RawValue: the borrowed
+        # types each one contains directly, and those with a RawValue field.
+        self.untagged: list[str] = []
+        self.uses: dict[str, set[str]] = {}
+        self.holds_raw: set[str] = set()
+
+    def render(self, roots: tuple[str, ...]) -> str:
+        for name in roots:
+            if name in DEFINITIONS:
+                self.named(name)
+        for name in self.untagged:
+            if self.holds_raw & self.reachable(name):
+                raise ValueError(f"{name} is untagged, so it cannot hold a RawValue")
+        return "".join(self.out)
+
+    def reachable(self, name: str) -> set[str]:
+        seen, todo = set(), [name]
+        while todo:
+            current = todo.pop()
+            if current not in seen:
+                seen.add(current)
+                todo.extend(self.uses.get(current, ()))
+        return seen
+
+    def named(self, name: str) -> BorrowedLeaf:
+        if name == "Result":
+            return RAW
+        if name not in self.borrows:
+            self.borrows[name] = None
+            self.borrows[name] = self.define(name, DEFINITIONS[name])
+        # A type still being defined is part of a cycle, and borrows.
+        if self.borrows[name] is False:
+            return BorrowedLeaf(f"super::{name}")
+        return BorrowedLeaf(f"{name}<'a>", "named")
+
+    def define(self, name: str, definition: dict[str, Any]) -> bool:
+        """Emit the borrowed copy of `name`; False if it does not need one."""
+        if properties := definition.get("properties"):
+            return self.define_struct(
+                name,
+                properties,
+                set(definition.get("required", [])),
+                definition.get("description"),
+            )
+        if any_of := definition.get("anyOf"):
+            return self.define_any_of(name, any_of, definition.get("description"))
+        if ref := definition.get("$ref"):
+            return self.named(type_from_ref(ref)).kind is not None
+        # String enums, newtypes and the like hold nothing worth borrowing.
+        return False
+
+    def field_type(
+        self, typedef: dict[str, Any], prop_name: str, struct_name: str
+    ) -> tuple[BorrowedLeaf, list[str]]:
+        """The leaf type of a property and the containers around it, outermost first."""
+        if ref := typedef.get("$ref"):
+            return self.named(type_from_ref(ref)), []
+        if any_of := typedef.get("anyOf"):
+            custom_type = struct_name + capitalize(prop_name)
+            return self.nested(custom_type, {"anyOf": any_of}), []
+        type_prop = typedef.get("type")
+        if type_prop is None:
+            return RAW, []
+        if type_prop == "string":
+            return COW, []
+        if type_prop in ("integer", "number", "boolean"):
+            return BorrowedLeaf(map_type(typedef)), []
+        if type_prop == "array":
+            leaf, containers = self.field_type(typedef["items"], prop_name, struct_name)
+            if containers:
+                raise ValueError(f"Nested arrays in {struct_name}.{prop_name}")
+            return leaf, ["Vec"]
+        if type_prop == "object":
+            if typedef.get("additionalProperties") is not None or not typedef.get(
+                "properties"
+            ):
+                return RAW, []
+            custom_type = struct_name + capitalize(prop_name)
+            return self.nested(custom_type, typedef), []
+        raise ValueError(f"Unknown type: {type_prop} in {typedef}")
+
+    def nested(self, name: str, definition: dict[str, Any]) -> BorrowedLeaf:
+        """A type the owned module generated for an inline object or anyOf."""
+        if name not in self.borrows:
+            self.borrows[name] = None
+            self.borrows[name] = self.define(name, definition)
+        if self.borrows[name] is False:
+            return BorrowedLeaf(f"super::{name}")
+        return BorrowedLeaf(f"{name}<'a>", "named")
+
+    def define_struct(
+        self,
+        name: str,
+        properties: dict[str, Any],
+        required_props: set[str],
+        description: str | None,
+    ) -> bool:
+        fields: list[tuple[str, list[str], str, bool]] = []
+        for prop_name, prop in properties.items():
+            if prop_name == "_meta":
+                continue
+            if prop_name == "jsonrpc":
+                fields.append(
+                    (
+                        "jsonrpc",
+                        ['rename = "jsonrpc"', 'default = "default_jsonrpc"'],
+                        "String",
+                        False,
+                    )
+                )
+                continue
+            leaf, containers = self.field_type(prop, prop_name, name)
+            is_optional = prop_name not in required_props
+            if is_optional:
+                containers = ["Option"] + containers
+            rust_type = leaf.rust
+            for container in reversed(containers):
+                rust_type = f"{container}<{rust_type}>"
+            rs_prop = rust_prop_name(prop_name, is_optional)
+            serde_args = rs_prop.serde[len("#[serde(") : -2].split(", ") if rs_prop.serde else []
+            if leaf.kind:
+                serde_args.insert(0, "borrow")
+            if leaf.kind == "cow" and containers:
+                # `borrow` alone only borrows a Cow that is the whole field.
+                helper = "_".join(c.lower() for c in containers) + "_cow_str"
+                self.helpers.add(helper)
+                serde_args.append(f'deserialize_with = "crate::borrow::{helper}"')
+            if leaf.kind == "raw":
+                self.holds_raw.add(name)
+            if leaf.kind == "named":
+                self.uses.setdefault(name, set()).add(leaf.rust.split("<")[0])
+            fields.append((rs_prop.name, serde_args, rust_type, leaf.kind is not None))
+
+        if not any(borrows for *_, borrows in fields):
+            return False
+        out: list[str] = []
+        emit_doc_comment(description, out)
+        out.append(BORROWED_DERIVE)
+        out.append(f"pub struct {name}<'a> {{\n")
+        for field_name, serde_args, rust_type, _ in fields:
+            if serde_args:
+                out.append(wrap_attribute("    ", f"#[serde({', '.join(serde_args)})]"))
+            out.append(f"    pub {field_name}: {rust_type},\n")
+        out.append("}\n\n")
+        out.append(f"impl IntoOwned for {name}<'_> {{\n")
+        out.append(f"    type Owned = super::{name};\n\n")
+        out.append(f"    fn into_owned(self) -> super::{name} {{\n")
+        out.append(f"        super::{name} {{\n")
+        for field_name, _, _, borrows in fields:
+            value = f"self.{field_name}" + (".into_owned()" if borrows else "")
+            out.append(f"            {field_name}: {value},\n")
+        out.append("        }\n")
+        out.append("    }\n")
+        out.append("}\n\n")
+        self.out.extend(out)
+        return True
+
+    def define_any_of(
+        self, name: str, any_of: list[Any], description: str | None
+    ) -> bool:
+        if get_serde_annotation_for_anyof_type(name) != "#[serde(untagged)]":
+            raise ValueError(f"No borrowed form for {name}")
+        variants = []
+        for item in any_of:
+            ref_name = type_from_ref(ref_of(item))
+            leaf = self.named(ref_name)
+            if leaf.kind == "named":
+                self.uses.setdefault(name, set()).add(ref_name)
+            variants.append((ref_name, leaf))
+        if not any(leaf.kind for _, leaf in variants):
+            return False
+        self.untagged.append(name)
+        out: list[str] = []
+        emit_doc_comment(description, out)
+        out.append(BORROWED_DERIVE)
+        out.append("#[serde(untagged)]\n")
+        out.append(f"pub enum {name}<'a> {{\n")
+        for variant, leaf in variants:
+            borrow = "#[serde(borrow)] " if leaf.kind else ""
+            out.append(f"    {variant}({borrow}{leaf.rust}),\n")
+        out.append("}\n\n")
+        out.append(f"impl IntoOwned for {name}<'_> {{\n")
+        out.append(f"    type Owned = super::{name};\n\n")
+        out.append(f"    fn into_owned(self) -> super::{name} {{\n")
+        out.append("        match self {\n")
+        for variant, leaf in variants:
+            value = "value.into_owned()" if leaf.kind else "value"
+            arm = f"            Self::{variant}(value) => super::{name}::{variant}({value}),\n"
+            if len(arm) - 1 <= MAX_WIDTH:
+                out.append(arm)
+            else:
+                out.append(f"            Self::{variant}(value) => {{\n")
+                out.append(f"                super::{name}::{variant}({value})\n")
+                out.append("            }\n")
+        out.append("        }\n")
+        out.append("    }\n")
+        out.append("}\n\n")
+        self.out.extend(out)
+        return True
+
+
+BORROW_HELPERS = {
+    "option_cow_str": ("Option<Cow<'a, str>>", "Option<BorrowedStr<'a>>", "value.map(|s| s.0)"),
+    "vec_cow_str": (
+        "Vec<Cow<'a, str>>",
+        "Vec<BorrowedStr<'a>>",
+        "value.into_iter().map(|s| s.0).collect()",
+    ),
+    "option_vec_cow_str": (
+        "Option<Vec<Cow<'a, str>>>",
+        "Option<Vec<BorrowedStr<'a>>>",
+        "value.map(|v| v.into_iter().map(|s| s.0).collect())",
+    ),
+}
+
+
+def render_borrow_rs(helpers: set[str]) -> str:
+    """src/borrow.rs: IntoOwned and the deserializers the borrowed modules use."""
+    out = [
+        GENERATED_HEADER,
+        """use serde_json::value::RawValue;
+use std::borrow::Cow;
+""",
+    ]
+    if helpers:
+        out[1] = "use serde::Deserialize;\nuse serde::Deserializer;\n" + out[1]
+    out.append(
+        """
+/// Conversion of a borrowed MCP type into its owned counterpart.
+pub trait IntoOwned {
+    type Owned;
+
+    fn into_owned(self) -> Self::Owned;
+}
+
+impl IntoOwned for Cow<'_, str> {
+    type Owned = String;
+
+    fn into_owned(self) -> String {
+        Cow::into_owned(self)
+    }
+}
+
+impl IntoOwned for &RawValue {
+    type Owned = serde_json::Value;
+
+    fn into_owned(self) -> serde_json::Value {
+        // A RawValue always holds valid JSON, so this cannot fail.
+        #[expect(clippy::unwrap_used)]
+        serde_json::from_str(self.get()).unwrap()
+    }
+}
+
+impl<T: IntoOwned> IntoOwned for Option<T> {
+    type Owned = Option<T::Owned>;
+
+    fn into_owned(self) -> Self::Owned {
+        self.map(T::into_owned)
+    }
+}
+
+impl<T: IntoOwned> IntoOwned for Vec<T> {
+    type Owned = Vec<T::Owned>;
+
+    fn into_owned(self) -> Self::Owned {
+        self.into_iter().map(T::into_owned).collect()
+    }
+}
+"""
+    )
+    if helpers:
+        out.append(
+            """
+/// A string field that borrows from the input unless it has escapes. serde
+/// only does that for a `Cow<str>` that is the whole field, so the fields
+/// that wrap one in `Option` or `Vec` deserialize through this.
+#[derive(Deserialize)]
+#[serde(transparent)]
+struct BorrowedStr<'a>(#[serde(borrow)] Cow<'a, str>);
+"""
+        )
+    for helper in sorted(helpers):
+        rust_type, borrowed_type, convert = BORROW_HELPERS[helper]
+        out.append(
+            f"""
+pub(crate) fn {helper}<'de: 'a, 'a, D: Deserializer<'de>>(
+    deserializer: D,
+) -> std::result::Result<{rust_type}, D::Error> {{
+    let value: {borrowed_type} = Deserialize::deserialize(deserializer)?;
+    Ok({convert})
+}}
+"""
+        )
+    return "".join(out)
+
+
+def render_borrowed(body: str) -> str:
+    imports = ["use serde::Deserialize;\n", "use serde::Serialize;\n"]
+    if "RawValue" in body:
+        imports.append("use serde_json::value::RawValue;\n")
+    if "Cow<" in body:
+        imports.append("use std::borrow::Cow;\n")
+    crate_imports = ["use crate::IntoOwned;\n"]
+    if "default_jsonrpc" in body:
+        crate_imports.append("use crate::default_jsonrpc;\n")
+    return (
+        GENERATED_HEADER
+        + "".join(imports)
+        + "\n"
+        + "".join(crate_imports)
+        + "\n"
+        + body
+    ).rstrip("\n") + "\n"
 
 
 def add_definition(name: str, definition: dict[str, Any], out: list[str]) -> None:
@@ -268,7 +1060,7 @@ class StructField:
 
     def append(self, out: list[str], supports_const: bool) -> None:
         if self.serde:
-            out.append(f"    {self.serde}\n")
+            out.append(wrap_attribute("    ", self.serde))
         if self.viz == "const":
             if supports_const:
                 out.append(f"    const {self.name}: {self.type_name};\n")
@@ -431,8 +1223,7 @@ def define_any_of(
       full `…Request` struct from the schema definition.
     """
 
-    # Verify each item in list_of_refs is a dict with a $ref key.
-    refs = [item["$ref"] for item in list_of_refs if isinstance(item, dict)]
+    refs = [ref_of(item) for item in list_of_refs if isinstance(item, dict)]
 
     out: list[str] = []
     if description:
@@ -495,7 +1286,7 @@ def define_any_of(
             )
 
             out.append(f'    #[serde(rename = "{method_const}")]\n')
-            out.append(f"    {variant_name}({payload_type}),\n")
+            out.append(tuple_variant(variant_name, payload_type))
         else:
             # The regular/straight-forward case.
             out.append(f"    {variant_name}({ref_name}),\n")
@@ -649,6 +1440,20 @@ def check_string_list(value: Any) -> list[str] | None:
     return value
 
 
+def ref_of(item: dict[str, Any]) -> str:
+    """The `$ref` of an anyOf item.
+
+    An inline schema (2025-03-26 spells out the JSON-RPC batch arrays in
+    JSONRPCMessage) is mapped to the definition it is a copy of.
+    """
+    if "$ref" in item:
+        return item["$ref"]
+    for name, definition in DEFINITIONS.items():
+        if definition == item:
+            return f"#/definitions/{name}"
+    raise ValueError(f"anyOf item matches no definition: {item}")
+
+
 def type_from_ref(ref: str) -> str:
     """Convert a JSON reference to a Rust type."""
     assert ref.startswith("#/definitions/")
@@ -660,7 +1465,7 @@ def emit_doc_comment(text: str | None, out: list[str]) -> None:
     if not text:
         return
     for line in text.strip().split("\n"):
-        out.append(f"/// {line.rstrip()}\n")
+        out.append(f"/// {line}".rstrip() + "\n")
 
 
 if __name__ == "__main__":
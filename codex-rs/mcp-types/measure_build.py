@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Measure how long `cargo build -p mcp-types` takes, and how big its .rlib
+is, for each feature configuration of the crate.
+
+Dependencies are built once per configuration up front; after that every run
+cleans only mcp-types and rebuilds it, so the times are the crate's own.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+
+CRATE_DIR = Path(__file__).resolve().parent
+WORKSPACE_DIR = CRATE_DIR.parent
+
+# name -> cargo feature flags
+CONFIGURATIONS = {
+    "default": [],
+    "default+ts": ["--features", "ts"],
+    "default+borrowed": ["--features", "borrowed"],
+    "v2025_03_26": ["--no-default-features", "--features", "v2025_03_26"],
+    "all-versions": ["--features", "v2025_03_26"],
+    "all-features": ["--all-features"],
+    "no-versions": ["--no-default-features"],
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--config",
+        action="append",
+        choices=CONFIGURATIONS,
+        help="configuration to measure; repeat for several (default: all)",
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--release", action="store_true")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args()
+
+    profile = ["--release"] if args.release else []
+    results = {}
+    for name in args.config or CONFIGURATIONS:
+        flags = CONFIGURATIONS[name] + profile
+        print(f"{name}: building dependencies...", file=sys.stderr)
+        build(flags)
+        times = []
+        rlib = None
+        for _ in range(args.runs):
+            cargo("clean", "-p", "mcp-types", *profile)
+            started = time.perf_counter()
+            rlib = build(flags)
+            times.append(time.perf_counter() - started)
+        results[name] = {
+            "flags": flags,
+            "times": times,
+            "median": statistics.median(times),
+            "min": min(times),
+            "rlib_bytes": rlib.stat().st_size if rlib else None,
+        }
+
+    print(f"\n{'configuration':<16} {'median s':>9} {'min s':>7} {'rlib KB':>9}")
+    for name, result in results.items():
+        size = result["rlib_bytes"]
+        print(
+            f"{name:<16} {result['median']:>9.2f} {result['min']:>7.2f} "
+            f"{size / 1024 if size is not None else float('nan'):>9.1f}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+def cargo(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["cargo", *args],
+        cwd=WORKSPACE_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def build(flags: list[str]) -> Path | None:
+    """Build mcp-types with `flags`; returns the path of its .rlib."""
+    proc = cargo(
+        "build", "-p", "mcp-types", "--message-format=json-render-diagnostics", *flags
+    )
+    rlib = None
+    for line in proc.stdout.splitlines():
+        message = json.loads(line)
+        if (
+            message.get("reason") == "compiler-artifact"
+            and message["target"]["name"] == "mcp_types"
+        ):
+            rlib = next(
+                (Path(f) for f in message["filenames"] if f.endswith(".rlib")), rlib
+            )
+    return rlib
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+use serde::Deserialize;
+use serde::Deserializer;
+use serde_json::value::RawValue;
+use std::borrow::Cow;
+
+/// Conversion of a borrowed MCP type into its owned counterpart.
+pub trait IntoOwned {
+    type Owned;
+
+    fn into_owned(self) -> Self::Owned;
+}
+
+impl IntoOwned for Cow<'_, str> {
+    type Owned = String;
+
+    fn into_owned(self) -> String {
+        Cow::into_owned(self)
+    }
+}
+
+impl IntoOwned for &RawValue {
+    type Owned = serde_json::Value;
+
+    fn into_owned(self) -> serde_json::Value {
+        // A RawValue always holds valid JSON, so this cannot fail.
+        #[expect(clippy::unwrap_used)]
+        serde_json::from_str(self.get()).unwrap()
+    }
+}
+
+impl<T: IntoOwned> IntoOwned for Option<T> {
+    type Owned = Option<T::Owned>;
+
+    fn into_owned(self) -> Self::Owned {
+        self.map(T::into_owned)
+    }
+}
+
+impl<T: IntoOwned> IntoOwned for Vec<T> {
+    type Owned = Vec<T::Owned>;
+
+    fn into_owned(self) -> Self::Owned {
+        self.into_iter().map(T::into_owned).collect()
+    }
+}
+
+/// A string field that borrows from the input unless it has escapes. serde
+/// only does that for a `Cow<str>` that is the whole field, so the fields
+/// that wrap one in `Option` or `Vec` deserialize through this.
+#[derive(Deserialize)]
+#[serde(transparent)]
+struct BorrowedStr<'a>(#[serde(borrow)] Cow<'a, str>);
+
+pub(crate) fn option_cow_str<'de: 'a, 'a, D: Deserializer<'de>>(
+    deserializer: D,
+) -> std::result::Result<Option<Cow<'a, str>>, D::Error> {
+    let value: Option<BorrowedStr<'a>> = Deserialize::deserialize(deserializer)?;
+    Ok(value.map(|s| s.0))
+}
+
+pub(crate) fn option_vec_cow_str<'de: 'a, 'a, D: Deserializer<'de>>(
+    deserializer: D,
+) -> std::result::Result<Option<Vec<Cow<'a, str>>>, D::Error> {
+    let value: Option<Vec<BorrowedStr<'a>>> = Deserialize::deserialize(deserializer)?;
+    Ok(value.map(|v| v.into_iter().map(|s| s.0).collect()))
+}
@@ -0,0 +1,22 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+mod capabilities;
+mod content;
+mod jsonrpc;
+mod notifications;
+mod requests;
+mod results;
+mod types;
+
+pub use capabilities::*;
+pub use content::*;
+pub use jsonrpc::*;
+pub use notifications::*;
+pub use requests::*;
+pub use results::*;
+pub use types::*;
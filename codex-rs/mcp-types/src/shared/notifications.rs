@@ -0,0 +1,238 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+use serde::Deserialize;
+use serde::Serialize;
+use std::convert::TryFrom;
+
+use crate::ModelContextProtocolNotification;
+
+use super::JSONRPCNotification;
+use super::LoggingLevel;
+use super::RequestId;
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum CancelledNotification {}
+
+impl ModelContextProtocolNotification for CancelledNotification {
+    const METHOD: &'static str = "notifications/cancelled";
+    type Params = CancelledNotificationParams;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct CancelledNotificationParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub reason: Option<String>,
+    #[serde(rename = "requestId")]
+    pub request_id: RequestId,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum ClientNotification {
+    CancelledNotification(CancelledNotification),
+    InitializedNotification(InitializedNotification),
+    ProgressNotification(ProgressNotification),
+    RootsListChangedNotification(RootsListChangedNotification),
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum InitializedNotification {}
+
+impl ModelContextProtocolNotification for InitializedNotification {
+    const METHOD: &'static str = "notifications/initialized";
+    type Params = Option<serde_json::Value>;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum LoggingMessageNotification {}
+
+impl ModelContextProtocolNotification for LoggingMessageNotification {
+    const METHOD: &'static str = "notifications/message";
+    type Params = LoggingMessageNotificationParams;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct LoggingMessageNotificationParams {
+    pub data: serde_json::Value,
+    pub level: LoggingLevel,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub logger: Option<String>,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct Notification {
+    pub method: String,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub params: Option<serde_json::Value>,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ProgressNotification {}
+
+impl ModelContextProtocolNotification for ProgressNotification {
+    const METHOD: &'static str = "notifications/progress";
+    type Params = ProgressNotificationParams;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ProgressNotificationParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub message: Option<String>,
+    pub progress: f64,
+    #[serde(rename = "progressToken")]
+    pub progress_token: ProgressToken,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub total: Option<f64>,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize, Hash, Eq)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum ProgressToken {
+    String(String),
+    Integer(i64),
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum PromptListChangedNotification {}
+
+impl ModelContextProtocolNotification for PromptListChangedNotification {
+    const METHOD: &'static str = "notifications/prompts/list_changed";
+    type Params = Option<serde_json::Value>;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ResourceListChangedNotification {}
+
+impl ModelContextProtocolNotification for ResourceListChangedNotification {
+    const METHOD: &'static str = "notifications/resources/list_changed";
+    type Params = Option<serde_json::Value>;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ResourceUpdatedNotification {}
+
+impl ModelContextProtocolNotification for ResourceUpdatedNotification {
+    const METHOD: &'static str = "notifications/resources/updated";
+    type Params = ResourceUpdatedNotificationParams;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ResourceUpdatedNotificationParams {
+    pub uri: String,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum RootsListChangedNotification {}
+
+impl ModelContextProtocolNotification for RootsListChangedNotification {
+    const METHOD: &'static str = "notifications/roots/list_changed";
+    type Params = Option<serde_json::Value>;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(tag = "method", content = "params")]
+pub enum ServerNotification {
+    #[serde(rename = "notifications/cancelled")]
+    CancelledNotification(<CancelledNotification as ModelContextProtocolNotification>::Params),
+    #[serde(rename = "notifications/progress")]
+    ProgressNotification(<ProgressNotification as ModelContextProtocolNotification>::Params),
+    #[serde(rename = "notifications/resources/list_changed")]
+    ResourceListChangedNotification(
+        <ResourceListChangedNotification as ModelContextProtocolNotification>::Params,
+    ),
+    #[serde(rename = "notifications/resources/updated")]
+    ResourceUpdatedNotification(
+        <ResourceUpdatedNotification as ModelContextProtocolNotification>::Params,
+    ),
+    #[serde(rename = "notifications/prompts/list_changed")]
+    PromptListChangedNotification(
+        <PromptListChangedNotification as ModelContextProtocolNotification>::Params,
+    ),
+    #[serde(rename = "notifications/tools/list_changed")]
+    ToolListChangedNotification(
+        <ToolListChangedNotification as ModelContextProtocolNotification>::Params,
+    ),
+    #[serde(rename = "notifications/message")]
+    LoggingMessageNotification(
+        <LoggingMessageNotification as ModelContextProtocolNotification>::Params,
+    ),
+}
+
+impl TryFrom<JSONRPCNotification> for ServerNotification {
+    type Error = serde_json::Error;
+    fn try_from(n: JSONRPCNotification) -> std::result::Result<Self, Self::Error> {
+        match n.method.as_str() {
+            "notifications/cancelled" => {
+                let params_json = n.params.unwrap_or(serde_json::Value::Null);
+                let params: <CancelledNotification as ModelContextProtocolNotification>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ServerNotification::CancelledNotification(params))
+            }
+            "notifications/progress" => {
+                let params_json = n.params.unwrap_or(serde_json::Value::Null);
+                let params: <ProgressNotification as ModelContextProtocolNotification>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ServerNotification::ProgressNotification(params))
+            }
+            "notifications/resources/list_changed" => {
+                let params_json = n.params.unwrap_or(serde_json::Value::Null);
+                let params: <ResourceListChangedNotification as ModelContextProtocolNotification>::Params = serde_json::from_value(params_json)?;
+                Ok(ServerNotification::ResourceListChangedNotification(params))
+            }
+            "notifications/resources/updated" => {
+                let params_json = n.params.unwrap_or(serde_json::Value::Null);
+                let params: <ResourceUpdatedNotification as ModelContextProtocolNotification>::Params = serde_json::from_value(params_json)?;
+                Ok(ServerNotification::ResourceUpdatedNotification(params))
+            }
+            "notifications/prompts/list_changed" => {
+                let params_json = n.params.unwrap_or(serde_json::Value::Null);
+                let params: <PromptListChangedNotification as ModelContextProtocolNotification>::Params = serde_json::from_value(params_json)?;
+                Ok(ServerNotification::PromptListChangedNotification(params))
+            }
+            "notifications/tools/list_changed" => {
+                let params_json = n.params.unwrap_or(serde_json::Value::Null);
+                let params: <ToolListChangedNotification as ModelContextProtocolNotification>::Params = serde_json::from_value(params_json)?;
+                Ok(ServerNotification::ToolListChangedNotification(params))
+            }
+            "notifications/message" => {
+                let params_json = n.params.unwrap_or(serde_json::Value::Null);
+                let params: <LoggingMessageNotification as ModelContextProtocolNotification>::Params = serde_json::from_value(params_json)?;
+                Ok(ServerNotification::LoggingMessageNotification(params))
+            }
+            _ => Err(serde_json::Error::io(std::io::Error::new(
+                std::io::ErrorKind::InvalidData,
+                format!("Unknown method: {}", n.method),
+            ))),
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ToolListChangedNotification {}
+
+impl ModelContextProtocolNotification for ToolListChangedNotification {
+    const METHOD: &'static str = "notifications/tools/list_changed";
+    type Params = Option<serde_json::Value>;
+}
@@ -0,0 +1,45 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+use serde::Deserialize;
+use serde::Serialize;
+
+use super::Annotations;
+
+/// Audio provided to or from an LLM.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct AudioContent {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations>,
+    pub data: String,
+    #[serde(rename = "mimeType")]
+    pub mime_type: String,
+    pub r#type: String, // &'static str = "audio"
+}
+
+/// An image provided to or from an LLM.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ImageContent {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations>,
+    pub data: String,
+    #[serde(rename = "mimeType")]
+    pub mime_type: String,
+    pub r#type: String, // &'static str = "image"
+}
+
+/// Text provided to or from an LLM.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct TextContent {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations>,
+    pub text: String,
+    pub r#type: String, // &'static str = "text"
+}
@@ -0,0 +1,47 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+use serde::Deserialize;
+use serde::Serialize;
+
+use super::JSONRPCError;
+use super::JSONRPCNotification;
+use super::JSONRPCRequest;
+use super::JSONRPCResponse;
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum JSONRPCBatchRequestItem {
+    JSONRPCRequest(JSONRPCRequest),
+    JSONRPCNotification(JSONRPCNotification),
+}
+
+pub type JSONRPCBatchRequest = Vec<JSONRPCBatchRequestItem>;
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum JSONRPCBatchResponseItem {
+    JSONRPCResponse(JSONRPCResponse),
+    JSONRPCError(JSONRPCError),
+}
+
+pub type JSONRPCBatchResponse = Vec<JSONRPCBatchResponseItem>;
+
+/// Refers to any valid JSON-RPC object that can be decoded off the wire, or encoded to be sent.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum JSONRPCMessage {
+    Request(JSONRPCRequest),
+    Notification(JSONRPCNotification),
+    BatchRequest(JSONRPCBatchRequest),
+    Response(JSONRPCResponse),
+    Error(JSONRPCError),
+    BatchResponse(JSONRPCBatchResponse),
+}
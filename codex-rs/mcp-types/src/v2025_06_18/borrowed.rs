@@ -0,0 +1,876 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+use serde::Deserialize;
+use serde::Serialize;
+use serde_json::value::RawValue;
+use std::borrow::Cow;
+
+use crate::IntoOwned;
+use crate::default_jsonrpc;
+
+/// A successful (non-error) response to a request.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct JSONRPCResponse<'a> {
+    pub id: super::RequestId,
+    #[serde(rename = "jsonrpc", default = "default_jsonrpc")]
+    pub jsonrpc: String,
+    #[serde(borrow)]
+    pub result: &'a RawValue,
+}
+
+impl IntoOwned for JSONRPCResponse<'_> {
+    type Owned = super::JSONRPCResponse;
+
+    fn into_owned(self) -> super::JSONRPCResponse {
+        super::JSONRPCResponse {
+            id: self.id,
+            jsonrpc: self.jsonrpc,
+            result: self.result.into_owned(),
+        }
+    }
+}
+
+/// Optional annotations for the client. The client can use annotations to inform how objects are used or displayed
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct Annotations<'a> {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub audience: Option<Vec<super::Role>>,
+    #[serde(
+        borrow,
+        rename = "lastModified",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub last_modified: Option<Cow<'a, str>>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub priority: Option<f64>,
+}
+
+impl IntoOwned for Annotations<'_> {
+    type Owned = super::Annotations;
+
+    fn into_owned(self) -> super::Annotations {
+        super::Annotations {
+            audience: self.audience,
+            last_modified: self.last_modified.into_owned(),
+            priority: self.priority,
+        }
+    }
+}
+
+/// Text provided to or from an LLM.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct TextContent<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations<'a>>,
+    #[serde(borrow)]
+    pub text: Cow<'a, str>,
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+}
+
+impl IntoOwned for TextContent<'_> {
+    type Owned = super::TextContent;
+
+    fn into_owned(self) -> super::TextContent {
+        super::TextContent {
+            annotations: self.annotations.into_owned(),
+            text: self.text.into_owned(),
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+/// An image provided to or from an LLM.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ImageContent<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations<'a>>,
+    #[serde(borrow)]
+    pub data: Cow<'a, str>,
+    #[serde(borrow, rename = "mimeType")]
+    pub mime_type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+}
+
+impl IntoOwned for ImageContent<'_> {
+    type Owned = super::ImageContent;
+
+    fn into_owned(self) -> super::ImageContent {
+        super::ImageContent {
+            annotations: self.annotations.into_owned(),
+            data: self.data.into_owned(),
+            mime_type: self.mime_type.into_owned(),
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+/// Audio provided to or from an LLM.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct AudioContent<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations<'a>>,
+    #[serde(borrow)]
+    pub data: Cow<'a, str>,
+    #[serde(borrow, rename = "mimeType")]
+    pub mime_type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+}
+
+impl IntoOwned for AudioContent<'_> {
+    type Owned = super::AudioContent;
+
+    fn into_owned(self) -> super::AudioContent {
+        super::AudioContent {
+            annotations: self.annotations.into_owned(),
+            data: self.data.into_owned(),
+            mime_type: self.mime_type.into_owned(),
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+/// A resource that the server is capable of reading, included in a prompt or tool call result.
+///
+/// Note: resource links returned by tools are not guaranteed to appear in the results of `resources/list` requests.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ResourceLink<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations<'a>>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub description: Option<Cow<'a, str>>,
+    #[serde(
+        borrow,
+        rename = "mimeType",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub size: Option<i64>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub title: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+    #[serde(borrow)]
+    pub uri: Cow<'a, str>,
+}
+
+impl IntoOwned for ResourceLink<'_> {
+    type Owned = super::ResourceLink;
+
+    fn into_owned(self) -> super::ResourceLink {
+        super::ResourceLink {
+            annotations: self.annotations.into_owned(),
+            description: self.description.into_owned(),
+            mime_type: self.mime_type.into_owned(),
+            name: self.name.into_owned(),
+            size: self.size,
+            title: self.title.into_owned(),
+            r#type: self.r#type.into_owned(),
+            uri: self.uri.into_owned(),
+        }
+    }
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct TextResourceContents<'a> {
+    #[serde(
+        borrow,
+        rename = "mimeType",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub text: Cow<'a, str>,
+    #[serde(borrow)]
+    pub uri: Cow<'a, str>,
+}
+
+impl IntoOwned for TextResourceContents<'_> {
+    type Owned = super::TextResourceContents;
+
+    fn into_owned(self) -> super::TextResourceContents {
+        super::TextResourceContents {
+            mime_type: self.mime_type.into_owned(),
+            text: self.text.into_owned(),
+            uri: self.uri.into_owned(),
+        }
+    }
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct BlobResourceContents<'a> {
+    #[serde(borrow)]
+    pub blob: Cow<'a, str>,
+    #[serde(
+        borrow,
+        rename = "mimeType",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub uri: Cow<'a, str>,
+}
+
+impl IntoOwned for BlobResourceContents<'_> {
+    type Owned = super::BlobResourceContents;
+
+    fn into_owned(self) -> super::BlobResourceContents {
+        super::BlobResourceContents {
+            blob: self.blob.into_owned(),
+            mime_type: self.mime_type.into_owned(),
+            uri: self.uri.into_owned(),
+        }
+    }
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize)]
+#[serde(untagged)]
+pub enum EmbeddedResourceResource<'a> {
+    TextResourceContents(#[serde(borrow)] TextResourceContents<'a>),
+    BlobResourceContents(#[serde(borrow)] BlobResourceContents<'a>),
+}
+
+impl IntoOwned for EmbeddedResourceResource<'_> {
+    type Owned = super::EmbeddedResourceResource;
+
+    fn into_owned(self) -> super::EmbeddedResourceResource {
+        match self {
+            Self::TextResourceContents(value) => {
+                super::EmbeddedResourceResource::TextResourceContents(value.into_owned())
+            }
+            Self::BlobResourceContents(value) => {
+                super::EmbeddedResourceResource::BlobResourceContents(value.into_owned())
+            }
+        }
+    }
+}
+
+/// The contents of a resource, embedded into a prompt or tool call result.
+///
+/// It is up to the client how best to render embedded resources for the benefit
+/// of the LLM and/or the user.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct EmbeddedResource<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations<'a>>,
+    #[serde(borrow)]
+    pub resource: EmbeddedResourceResource<'a>,
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+}
+
+impl IntoOwned for EmbeddedResource<'_> {
+    type Owned = super::EmbeddedResource;
+
+    fn into_owned(self) -> super::EmbeddedResource {
+        super::EmbeddedResource {
+            annotations: self.annotations.into_owned(),
+            resource: self.resource.into_owned(),
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize)]
+#[serde(untagged)]
+pub enum ContentBlock<'a> {
+    TextContent(#[serde(borrow)] TextContent<'a>),
+    ImageContent(#[serde(borrow)] ImageContent<'a>),
+    AudioContent(#[serde(borrow)] AudioContent<'a>),
+    ResourceLink(#[serde(borrow)] ResourceLink<'a>),
+    EmbeddedResource(#[serde(borrow)] EmbeddedResource<'a>),
+}
+
+impl IntoOwned for ContentBlock<'_> {
+    type Owned = super::ContentBlock;
+
+    fn into_owned(self) -> super::ContentBlock {
+        match self {
+            Self::TextContent(value) => super::ContentBlock::TextContent(value.into_owned()),
+            Self::ImageContent(value) => super::ContentBlock::ImageContent(value.into_owned()),
+            Self::AudioContent(value) => super::ContentBlock::AudioContent(value.into_owned()),
+            Self::ResourceLink(value) => super::ContentBlock::ResourceLink(value.into_owned()),
+            Self::EmbeddedResource(value) => {
+                super::ContentBlock::EmbeddedResource(value.into_owned())
+            }
+        }
+    }
+}
+
+/// The server's response to a tool call.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct CallToolResult<'a> {
+    #[serde(borrow)]
+    pub content: Vec<ContentBlock<'a>>,
+    #[serde(rename = "isError", default, skip_serializing_if = "Option::is_none")]
+    pub is_error: Option<bool>,
+    #[serde(
+        borrow,
+        rename = "structuredContent",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub structured_content: Option<&'a RawValue>,
+}
+
+impl IntoOwned for CallToolResult<'_> {
+    type Owned = super::CallToolResult;
+
+    fn into_owned(self) -> super::CallToolResult {
+        super::CallToolResult {
+            content: self.content.into_owned(),
+            is_error: self.is_error,
+            structured_content: self.structured_content.into_owned(),
+        }
+    }
+}
+
+/// Describes a message returned as part of a prompt.
+///
+/// This is similar to `SamplingMessage`, but also supports the embedding of
+/// resources from the MCP server.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct PromptMessage<'a> {
+    #[serde(borrow)]
+    pub content: ContentBlock<'a>,
+    pub role: super::Role,
+}
+
+impl IntoOwned for PromptMessage<'_> {
+    type Owned = super::PromptMessage;
+
+    fn into_owned(self) -> super::PromptMessage {
+        super::PromptMessage {
+            content: self.content.into_owned(),
+            role: self.role,
+        }
+    }
+}
+
+/// The server's response to a prompts/get request from the client.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct GetPromptResult<'a> {
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub description: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub messages: Vec<PromptMessage<'a>>,
+}
+
+impl IntoOwned for GetPromptResult<'_> {
+    type Owned = super::GetPromptResult;
+
+    fn into_owned(self) -> super::GetPromptResult {
+        super::GetPromptResult {
+            description: self.description.into_owned(),
+            messages: self.messages.into_owned(),
+        }
+    }
+}
+
+/// Describes an argument that a prompt can accept.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct PromptArgument<'a> {
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub description: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub required: Option<bool>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub title: Option<Cow<'a, str>>,
+}
+
+impl IntoOwned for PromptArgument<'_> {
+    type Owned = super::PromptArgument;
+
+    fn into_owned(self) -> super::PromptArgument {
+        super::PromptArgument {
+            description: self.description.into_owned(),
+            name: self.name.into_owned(),
+            required: self.required,
+            title: self.title.into_owned(),
+        }
+    }
+}
+
+/// A prompt or prompt template that the server offers.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct Prompt<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub arguments: Option<Vec<PromptArgument<'a>>>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub description: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub title: Option<Cow<'a, str>>,
+}
+
+impl IntoOwned for Prompt<'_> {
+    type Owned = super::Prompt;
+
+    fn into_owned(self) -> super::Prompt {
+        super::Prompt {
+            arguments: self.arguments.into_owned(),
+            description: self.description.into_owned(),
+            name: self.name.into_owned(),
+            title: self.title.into_owned(),
+        }
+    }
+}
+
+/// The server's response to a prompts/list request from the client.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ListPromptsResult<'a> {
+    #[serde(
+        borrow,
+        rename = "nextCursor",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub next_cursor: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub prompts: Vec<Prompt<'a>>,
+}
+
+impl IntoOwned for ListPromptsResult<'_> {
+    type Owned = super::ListPromptsResult;
+
+    fn into_owned(self) -> super::ListPromptsResult {
+        super::ListPromptsResult {
+            next_cursor: self.next_cursor.into_owned(),
+            prompts: self.prompts.into_owned(),
+        }
+    }
+}
+
+/// A template description for resources available on the server.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ResourceTemplate<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations<'a>>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub description: Option<Cow<'a, str>>,
+    #[serde(
+        borrow,
+        rename = "mimeType",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub title: Option<Cow<'a, str>>,
+    #[serde(borrow, rename = "uriTemplate")]
+    pub uri_template: Cow<'a, str>,
+}
+
+impl IntoOwned for ResourceTemplate<'_> {
+    type Owned = super::ResourceTemplate;
+
+    fn into_owned(self) -> super::ResourceTemplate {
+        super::ResourceTemplate {
+            annotations: self.annotations.into_owned(),
+            description: self.description.into_owned(),
+            mime_type: self.mime_type.into_owned(),
+            name: self.name.into_owned(),
+            title: self.title.into_owned(),
+            uri_template: self.uri_template.into_owned(),
+        }
+    }
+}
+
+/// The server's response to a resources/templates/list request from the client.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ListResourceTemplatesResult<'a> {
+    #[serde(
+        borrow,
+        rename = "nextCursor",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub next_cursor: Option<Cow<'a, str>>,
+    #[serde(borrow, rename = "resourceTemplates")]
+    pub resource_templates: Vec<ResourceTemplate<'a>>,
+}
+
+impl IntoOwned for ListResourceTemplatesResult<'_> {
+    type Owned = super::ListResourceTemplatesResult;
+
+    fn into_owned(self) -> super::ListResourceTemplatesResult {
+        super::ListResourceTemplatesResult {
+            next_cursor: self.next_cursor.into_owned(),
+            resource_templates: self.resource_templates.into_owned(),
+        }
+    }
+}
+
+/// A known resource that the server is capable of reading.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct Resource<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<Annotations<'a>>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub description: Option<Cow<'a, str>>,
+    #[serde(
+        borrow,
+        rename = "mimeType",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub mime_type: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub size: Option<i64>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub title: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub uri: Cow<'a, str>,
+}
+
+impl IntoOwned for Resource<'_> {
+    type Owned = super::Resource;
+
+    fn into_owned(self) -> super::Resource {
+        super::Resource {
+            annotations: self.annotations.into_owned(),
+            description: self.description.into_owned(),
+            mime_type: self.mime_type.into_owned(),
+            name: self.name.into_owned(),
+            size: self.size,
+            title: self.title.into_owned(),
+            uri: self.uri.into_owned(),
+        }
+    }
+}
+
+/// The server's response to a resources/list request from the client.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ListResourcesResult<'a> {
+    #[serde(
+        borrow,
+        rename = "nextCursor",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub next_cursor: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub resources: Vec<Resource<'a>>,
+}
+
+impl IntoOwned for ListResourcesResult<'_> {
+    type Owned = super::ListResourcesResult;
+
+    fn into_owned(self) -> super::ListResourcesResult {
+        super::ListResourcesResult {
+            next_cursor: self.next_cursor.into_owned(),
+            resources: self.resources.into_owned(),
+        }
+    }
+}
+
+/// Additional properties describing a Tool to clients.
+///
+/// NOTE: all properties in ToolAnnotations are **hints**.
+/// They are not guaranteed to provide a faithful description of
+/// tool behavior (including descriptive properties like `title`).
+///
+/// Clients should never make tool use decisions based on ToolAnnotations
+/// received from untrusted servers.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ToolAnnotations<'a> {
+    #[serde(
+        rename = "destructiveHint",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub destructive_hint: Option<bool>,
+    #[serde(
+        rename = "idempotentHint",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub idempotent_hint: Option<bool>,
+    #[serde(
+        rename = "openWorldHint",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub open_world_hint: Option<bool>,
+    #[serde(
+        rename = "readOnlyHint",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub read_only_hint: Option<bool>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub title: Option<Cow<'a, str>>,
+}
+
+impl IntoOwned for ToolAnnotations<'_> {
+    type Owned = super::ToolAnnotations;
+
+    fn into_owned(self) -> super::ToolAnnotations {
+        super::ToolAnnotations {
+            destructive_hint: self.destructive_hint,
+            idempotent_hint: self.idempotent_hint,
+            open_world_hint: self.open_world_hint,
+            read_only_hint: self.read_only_hint,
+            title: self.title.into_owned(),
+        }
+    }
+}
+
+/// A JSON Schema object defining the expected parameters for the tool.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ToolInputSchema<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub properties: Option<&'a RawValue>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_vec_cow_str"
+    )]
+    pub required: Option<Vec<Cow<'a, str>>>,
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+}
+
+impl IntoOwned for ToolInputSchema<'_> {
+    type Owned = super::ToolInputSchema;
+
+    fn into_owned(self) -> super::ToolInputSchema {
+        super::ToolInputSchema {
+            properties: self.properties.into_owned(),
+            required: self.required.into_owned(),
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+/// An optional JSON Schema object defining the structure of the tool's output returned in
+/// the structuredContent field of a CallToolResult.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ToolOutputSchema<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub properties: Option<&'a RawValue>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_vec_cow_str"
+    )]
+    pub required: Option<Vec<Cow<'a, str>>>,
+    #[serde(borrow)]
+    pub r#type: Cow<'a, str>,
+}
+
+impl IntoOwned for ToolOutputSchema<'_> {
+    type Owned = super::ToolOutputSchema;
+
+    fn into_owned(self) -> super::ToolOutputSchema {
+        super::ToolOutputSchema {
+            properties: self.properties.into_owned(),
+            required: self.required.into_owned(),
+            r#type: self.r#type.into_owned(),
+        }
+    }
+}
+
+/// Definition for a tool the client can call.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct Tool<'a> {
+    #[serde(borrow, default, skip_serializing_if = "Option::is_none")]
+    pub annotations: Option<ToolAnnotations<'a>>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub description: Option<Cow<'a, str>>,
+    #[serde(borrow, rename = "inputSchema")]
+    pub input_schema: ToolInputSchema<'a>,
+    #[serde(borrow)]
+    pub name: Cow<'a, str>,
+    #[serde(
+        borrow,
+        rename = "outputSchema",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub output_schema: Option<ToolOutputSchema<'a>>,
+    #[serde(
+        borrow,
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub title: Option<Cow<'a, str>>,
+}
+
+impl IntoOwned for Tool<'_> {
+    type Owned = super::Tool;
+
+    fn into_owned(self) -> super::Tool {
+        super::Tool {
+            annotations: self.annotations.into_owned(),
+            description: self.description.into_owned(),
+            input_schema: self.input_schema.into_owned(),
+            name: self.name.into_owned(),
+            output_schema: self.output_schema.into_owned(),
+            title: self.title.into_owned(),
+        }
+    }
+}
+
+/// The server's response to a tools/list request from the client.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ListToolsResult<'a> {
+    #[serde(
+        borrow,
+        rename = "nextCursor",
+        default,
+        skip_serializing_if = "Option::is_none",
+        deserialize_with = "crate::borrow::option_cow_str"
+    )]
+    pub next_cursor: Option<Cow<'a, str>>,
+    #[serde(borrow)]
+    pub tools: Vec<Tool<'a>>,
+}
+
+impl IntoOwned for ListToolsResult<'_> {
+    type Owned = super::ListToolsResult;
+
+    fn into_owned(self) -> super::ListToolsResult {
+        super::ListToolsResult {
+            next_cursor: self.next_cursor.into_owned(),
+            tools: self.tools.into_owned(),
+        }
+    }
+}
+
+#[derive(Debug, Clone, Deserialize, Serialize)]
+#[serde(untagged)]
+pub enum ReadResourceResultContents<'a> {
+    TextResourceContents(#[serde(borrow)] TextResourceContents<'a>),
+    BlobResourceContents(#[serde(borrow)] BlobResourceContents<'a>),
+}
+
+impl IntoOwned for ReadResourceResultContents<'_> {
+    type Owned = super::ReadResourceResultContents;
+
+    fn into_owned(self) -> super::ReadResourceResultContents {
+        match self {
+            Self::TextResourceContents(value) => {
+                super::ReadResourceResultContents::TextResourceContents(value.into_owned())
+            }
+            Self::BlobResourceContents(value) => {
+                super::ReadResourceResultContents::BlobResourceContents(value.into_owned())
+            }
+        }
+    }
+}
+
+/// The server's response to a resources/read request from the client.
+#[derive(Debug, Clone, Deserialize, Serialize)]
+pub struct ReadResourceResult<'a> {
+    #[serde(borrow)]
+    pub contents: Vec<ReadResourceResultContents<'a>>,
+}
+
+impl IntoOwned for ReadResourceResult<'_> {
+    type Owned = super::ReadResourceResult;
+
+    fn into_owned(self) -> super::ReadResourceResult {
+        super::ReadResourceResult {
+            contents: self.contents.into_owned(),
+        }
+    }
+}
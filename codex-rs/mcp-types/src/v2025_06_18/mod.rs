@@ -0,0 +1,84 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+mod capabilities;
+mod content;
+mod jsonrpc;
+mod requests;
+mod results;
+mod types;
+
+#[cfg(feature = "borrowed")]
+pub mod borrowed;
+
+pub use capabilities::*;
+pub use content::*;
+pub use jsonrpc::*;
+pub use requests::*;
+pub use results::*;
+pub use types::*;
+
+pub use crate::shared::BlobResourceContents;
+pub use crate::shared::CancelledNotification;
+pub use crate::shared::CancelledNotificationParams;
+pub use crate::shared::ClientNotification;
+pub use crate::shared::CompleteResult;
+pub use crate::shared::CompleteResultCompletion;
+pub use crate::shared::Cursor;
+pub use crate::shared::EmptyResult;
+pub use crate::shared::InitializedNotification;
+pub use crate::shared::JSONRPCError;
+pub use crate::shared::JSONRPCErrorError;
+pub use crate::shared::JSONRPCNotification;
+pub use crate::shared::JSONRPCRequest;
+pub use crate::shared::JSONRPCResponse;
+pub use crate::shared::ListRootsRequest;
+pub use crate::shared::ListRootsResult;
+pub use crate::shared::LoggingLevel;
+pub use crate::shared::LoggingMessageNotification;
+pub use crate::shared::LoggingMessageNotificationParams;
+pub use crate::shared::ModelHint;
+pub use crate::shared::ModelPreferences;
+pub use crate::shared::Notification;
+pub use crate::shared::PaginatedRequest;
+pub use crate::shared::PaginatedRequestParams;
+pub use crate::shared::PaginatedResult;
+pub use crate::shared::PingRequest;
+pub use crate::shared::ProgressNotification;
+pub use crate::shared::ProgressNotificationParams;
+pub use crate::shared::ProgressToken;
+pub use crate::shared::PromptListChangedNotification;
+pub use crate::shared::ReadResourceRequest;
+pub use crate::shared::ReadResourceRequestParams;
+pub use crate::shared::ReadResourceResult;
+pub use crate::shared::ReadResourceResultContents;
+pub use crate::shared::Request;
+pub use crate::shared::RequestId;
+pub use crate::shared::ResourceContents;
+pub use crate::shared::ResourceListChangedNotification;
+pub use crate::shared::ResourceUpdatedNotification;
+pub use crate::shared::ResourceUpdatedNotificationParams;
+pub use crate::shared::Result;
+pub use crate::shared::Role;
+pub use crate::shared::Root;
+pub use crate::shared::RootsListChangedNotification;
+pub use crate::shared::ServerCapabilities;
+pub use crate::shared::ServerCapabilitiesPrompts;
+pub use crate::shared::ServerCapabilitiesResources;
+pub use crate::shared::ServerCapabilitiesTools;
+pub use crate::shared::ServerNotification;
+pub use crate::shared::SetLevelRequest;
+pub use crate::shared::SetLevelRequestParams;
+pub use crate::shared::SubscribeRequest;
+pub use crate::shared::SubscribeRequestParams;
+pub use crate::shared::TextResourceContents;
+pub use crate::shared::ToolAnnotations;
+pub use crate::shared::ToolListChangedNotification;
+pub use crate::shared::UnsubscribeRequest;
+pub use crate::shared::UnsubscribeRequestParams;
+
+pub const MCP_SCHEMA_VERSION: &str = "2025-06-18";
@@ -0,0 +1,448 @@
+// @generated
+// DO NOT EDIT THIS FILE DIRECTLY.
+// Run the following in the crate root to regenerate this file:
+//
+// ```shell
+// ./generate_mcp_types.py
+// ```
+use serde::Deserialize;
+use serde::Serialize;
+use std::convert::TryFrom;
+
+use crate::ModelContextProtocolRequest;
+
+use super::AudioContent;
+use super::CallToolResult;
+use super::ClientCapabilities;
+use super::CompleteResult;
+use super::CreateMessageResult;
+use super::ElicitResult;
+use super::GetPromptResult;
+use super::ImageContent;
+use super::Implementation;
+use super::InitializeResult;
+use super::JSONRPCRequest;
+use super::ListPromptsResult;
+use super::ListResourceTemplatesResult;
+use super::ListResourcesResult;
+use super::ListRootsRequest;
+use super::ListToolsResult;
+use super::ModelPreferences;
+use super::PingRequest;
+use super::ReadResourceRequest;
+use super::Role;
+use super::SetLevelRequest;
+use super::SubscribeRequest;
+use super::TextContent;
+use super::UnsubscribeRequest;
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum CallToolRequest {}
+
+impl ModelContextProtocolRequest for CallToolRequest {
+    const METHOD: &'static str = "tools/call";
+    type Params = CallToolRequestParams;
+    type Result = CallToolResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct CallToolRequestParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub arguments: Option<serde_json::Value>,
+    pub name: String,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(tag = "method", content = "params")]
+pub enum ClientRequest {
+    #[serde(rename = "initialize")]
+    InitializeRequest(<InitializeRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "ping")]
+    PingRequest(<PingRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "resources/list")]
+    ListResourcesRequest(<ListResourcesRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "resources/templates/list")]
+    ListResourceTemplatesRequest(
+        <ListResourceTemplatesRequest as ModelContextProtocolRequest>::Params,
+    ),
+    #[serde(rename = "resources/read")]
+    ReadResourceRequest(<ReadResourceRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "resources/subscribe")]
+    SubscribeRequest(<SubscribeRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "resources/unsubscribe")]
+    UnsubscribeRequest(<UnsubscribeRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "prompts/list")]
+    ListPromptsRequest(<ListPromptsRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "prompts/get")]
+    GetPromptRequest(<GetPromptRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "tools/list")]
+    ListToolsRequest(<ListToolsRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "tools/call")]
+    CallToolRequest(<CallToolRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "logging/setLevel")]
+    SetLevelRequest(<SetLevelRequest as ModelContextProtocolRequest>::Params),
+    #[serde(rename = "completion/complete")]
+    CompleteRequest(<CompleteRequest as ModelContextProtocolRequest>::Params),
+}
+
+impl TryFrom<JSONRPCRequest> for ClientRequest {
+    type Error = serde_json::Error;
+    fn try_from(req: JSONRPCRequest) -> std::result::Result<Self, Self::Error> {
+        match req.method.as_str() {
+            "initialize" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <InitializeRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::InitializeRequest(params))
+            }
+            "ping" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <PingRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::PingRequest(params))
+            }
+            "resources/list" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <ListResourcesRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::ListResourcesRequest(params))
+            }
+            "resources/templates/list" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <ListResourceTemplatesRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::ListResourceTemplatesRequest(params))
+            }
+            "resources/read" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <ReadResourceRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::ReadResourceRequest(params))
+            }
+            "resources/subscribe" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <SubscribeRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::SubscribeRequest(params))
+            }
+            "resources/unsubscribe" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <UnsubscribeRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::UnsubscribeRequest(params))
+            }
+            "prompts/list" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <ListPromptsRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::ListPromptsRequest(params))
+            }
+            "prompts/get" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <GetPromptRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::GetPromptRequest(params))
+            }
+            "tools/list" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <ListToolsRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::ListToolsRequest(params))
+            }
+            "tools/call" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <CallToolRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::CallToolRequest(params))
+            }
+            "logging/setLevel" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <SetLevelRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::SetLevelRequest(params))
+            }
+            "completion/complete" => {
+                let params_json = req.params.unwrap_or(serde_json::Value::Null);
+                let params: <CompleteRequest as ModelContextProtocolRequest>::Params =
+                    serde_json::from_value(params_json)?;
+                Ok(ClientRequest::CompleteRequest(params))
+            }
+            _ => Err(serde_json::Error::io(std::io::Error::new(
+                std::io::ErrorKind::InvalidData,
+                format!("Unknown method: {}", req.method),
+            ))),
+        }
+    }
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum CompleteRequest {}
+
+impl ModelContextProtocolRequest for CompleteRequest {
+    const METHOD: &'static str = "completion/complete";
+    type Params = CompleteRequestParams;
+    type Result = CompleteResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct CompleteRequestParams {
+    pub argument: CompleteRequestParamsArgument,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub context: Option<CompleteRequestParamsContext>,
+    pub r#ref: CompleteRequestParamsRef,
+}
+
+/// Additional, optional context for completions
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct CompleteRequestParamsContext {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub arguments: Option<serde_json::Value>,
+}
+
+/// The argument's information
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct CompleteRequestParamsArgument {
+    pub name: String,
+    pub value: String,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum CompleteRequestParamsRef {
+    PromptReference(PromptReference),
+    ResourceTemplateReference(ResourceTemplateReference),
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum CreateMessageRequest {}
+
+impl ModelContextProtocolRequest for CreateMessageRequest {
+    const METHOD: &'static str = "sampling/createMessage";
+    type Params = CreateMessageRequestParams;
+    type Result = CreateMessageResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct CreateMessageRequestParams {
+    #[serde(
+        rename = "includeContext",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub include_context: Option<String>,
+    #[serde(rename = "maxTokens")]
+    pub max_tokens: i64,
+    pub messages: Vec<SamplingMessage>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub metadata: Option<serde_json::Value>,
+    #[serde(
+        rename = "modelPreferences",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub model_preferences: Option<ModelPreferences>,
+    #[serde(
+        rename = "stopSequences",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub stop_sequences: Option<Vec<String>>,
+    #[serde(
+        rename = "systemPrompt",
+        default,
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub system_prompt: Option<String>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub temperature: Option<f64>,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ElicitRequest {}
+
+impl ModelContextProtocolRequest for ElicitRequest {
+    const METHOD: &'static str = "elicitation/create";
+    type Params = ElicitRequestParams;
+    type Result = ElicitResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ElicitRequestParams {
+    pub message: String,
+    #[serde(rename = "requestedSchema")]
+    pub requested_schema: ElicitRequestParamsRequestedSchema,
+}
+
+/// A restricted subset of JSON Schema.
+/// Only top-level properties are allowed, without nesting.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ElicitRequestParamsRequestedSchema {
+    pub properties: serde_json::Value,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub required: Option<Vec<String>>,
+    pub r#type: String, // &'static str = "object"
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum GetPromptRequest {}
+
+impl ModelContextProtocolRequest for GetPromptRequest {
+    const METHOD: &'static str = "prompts/get";
+    type Params = GetPromptRequestParams;
+    type Result = GetPromptResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct GetPromptRequestParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub arguments: Option<serde_json::Value>,
+    pub name: String,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum InitializeRequest {}
+
+impl ModelContextProtocolRequest for InitializeRequest {
+    const METHOD: &'static str = "initialize";
+    type Params = InitializeRequestParams;
+    type Result = InitializeResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct InitializeRequestParams {
+    pub capabilities: ClientCapabilities,
+    #[serde(rename = "clientInfo")]
+    pub client_info: Implementation,
+    #[serde(rename = "protocolVersion")]
+    pub protocol_version: String,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ListPromptsRequest {}
+
+impl ModelContextProtocolRequest for ListPromptsRequest {
+    const METHOD: &'static str = "prompts/list";
+    type Params = Option<ListPromptsRequestParams>;
+    type Result = ListPromptsResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ListPromptsRequestParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub cursor: Option<String>,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ListResourceTemplatesRequest {}
+
+impl ModelContextProtocolRequest for ListResourceTemplatesRequest {
+    const METHOD: &'static str = "resources/templates/list";
+    type Params = Option<ListResourceTemplatesRequestParams>;
+    type Result = ListResourceTemplatesResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ListResourceTemplatesRequestParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub cursor: Option<String>,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ListResourcesRequest {}
+
+impl ModelContextProtocolRequest for ListResourcesRequest {
+    const METHOD: &'static str = "resources/list";
+    type Params = Option<ListResourcesRequestParams>;
+    type Result = ListResourcesResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ListResourcesRequestParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub cursor: Option<String>,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub enum ListToolsRequest {}
+
+impl ModelContextProtocolRequest for ListToolsRequest {
+    const METHOD: &'static str = "tools/list";
+    type Params = Option<ListToolsRequestParams>;
+    type Result = ListToolsResult;
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ListToolsRequestParams {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub cursor: Option<String>,
+}
+
+/// Identifies a prompt.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct PromptReference {
+    pub name: String,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub title: Option<String>,
+    pub r#type: String, // &'static str = "ref/prompt"
+}
+
+/// A reference to a resource or resource template definition.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct ResourceTemplateReference {
+    pub r#type: String, // &'static str = "ref/resource"
+    pub uri: String,
+}
+
+/// Describes a message issued to or received from an LLM API.
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+pub struct SamplingMessage {
+    pub content: SamplingMessageContent,
+    pub role: Role,
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum SamplingMessageContent {
+    TextContent(TextContent),
+    ImageContent(ImageContent),
+    AudioContent(AudioContent),
+}
+
+#[derive(Debug, Clone, PartialEq, Deserialize, Serialize)]
+#[cfg_attr(feature = "ts", derive(ts_rs::TS))]
+#[serde(untagged)]
+pub enum ServerRequest {
+    PingRequest(PingRequest),
+    CreateMessageRequest(CreateMessageRequest),
+    ListRootsRequest(ListRootsRequest),
+    ElicitRequest(ElicitRequest),
+}
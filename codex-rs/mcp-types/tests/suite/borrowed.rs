@@ -0,0 +1,44 @@
+use std::borrow::Cow;
+
+use mcp_types::IntoOwned;
+use mcp_types::ListToolsResult;
+use mcp_types::borrowed;
+
+#[test]
+fn borrowed_tools_list_matches_owned() {
+    let raw = r#"{
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {
+            "tools": [
+                {
+                    "name": "shell",
+                    "description": "Runs a command.\nReturns its output.",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": { "command": { "type": "string" } },
+                        "required": ["command"]
+                    }
+                }
+            ]
+        }
+    }"#;
+
+    let response: borrowed::JSONRPCResponse =
+        serde_json::from_str(raw).expect("failed to deserialize JSONRPCResponse");
+    let result: borrowed::ListToolsResult =
+        serde_json::from_str(response.result.get()).expect("failed to deserialize ListToolsResult");
+
+    // Plain strings point into the input; escaped ones have to be copied.
+    let tool = &result.tools[0];
+    assert!(matches!(tool.name, Cow::Borrowed("shell")));
+    assert!(matches!(tool.description, Some(Cow::Owned(_))));
+    assert!(matches!(
+        tool.input_schema.required.as_deref(),
+        Some([Cow::Borrowed("command")])
+    ));
+
+    let expected: ListToolsResult =
+        serde_json::from_str(response.result.get()).expect("failed to deserialize ListToolsResult");
+    assert_eq!(result.into_owned(), expected);
+}
@@ -1,3 +1,5 @@
 // Aggregates all former standalone integration tests as modules.
+#[cfg(feature = "borrowed")]
+mod borrowed;
 mod initialize;
 mod progress_notification;
@@ -0,0 +1,46 @@
+"""Checks android_simpleperf's report-sample parsing against recorded output.
+
+android_testdata/report-sample.txt is `simpleperf report-sample
+--show-callchain` output from a codex run; run with
+`python -m unittest test_android_simpleperf`.
+"""
+
+import os
+import unittest
+
+from android_simpleperf import folded_stacks, hot_functions, parse_report_sample
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "android_testdata", "report-sample.txt")
+
+
+class ReportSampleTest(unittest.TestCase):
+    def setUp(self):
+        with open(FIXTURE) as f:
+            self.samples = parse_report_sample(f.read())
+
+    def test_parse(self):
+        self.assertEqual([s["thread"] for s in self.samples], ["codex", "tokio-runtime-w", "tokio-runtime-w"])
+        self.assertEqual([s["count"] for s in self.samples], [250000, 750000, 250000])
+        # The sampled frame repeated at the top of the callchain is dropped.
+        self.assertEqual([f["symbol"] for f in self.samples[1]["frames"]],
+                         ["memchr", "codex_core::codex::run_turn",
+                          "codex_core::codex::submission_loop", "__start_thread"])
+        self.assertEqual(self.samples[2]["frames"], [{"vaddr": "2a01c", "file": "/data/local/tmp/codex", "symbol": ""}])
+
+    def test_hot_functions_weighted_by_event_count(self):
+        hot = hot_functions(self.samples)
+        self.assertEqual(hot[0], ("memchr", 750000, 750000))
+        self.assertIn(("codex_core::codex::run_turn", 250000, 1000000), hot)
+        self.assertIn(("codex+2a01c", 250000, 250000), hot)
+
+    def test_folded_stacks(self):
+        self.assertEqual(folded_stacks(self.samples), {
+            "codex;__start_thread;codex_core::codex::submission_loop;codex_core::codex::run_turn": 250000,
+            "tokio-runtime-w;__start_thread;codex_core::codex::submission_loop;"
+            "codex_core::codex::run_turn;memchr": 750000,
+            "tokio-runtime-w;codex+2a01c": 250000,
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()